@@ -33,30 +33,38 @@ class BalanceHistoryFactory:
         balance_history_uid = IdFactory(BalanceHistoryFactory._NAME, db).get_uid()
 
         balance_history = BalanceHistory(balance_history_uid, db)
-        balance_history._token.set(token)
-        balance_history._transaction_uid.set(transaction_uid)
-        balance_history._balance.set(balance)
-        balance_history._timestamp.set(timestamp)
+        balance_history._record.create({
+            'token': token,
+            'transaction_uid': transaction_uid,
+            'balance': balance,
+            'timestamp': timestamp
+        })
 
         return balance_history_uid
 
 
-class BalanceHistory:
+class BalanceHistory(EntityDB):
 
     _NAME = 'BALANCE_HISTORY'
 
+    _FIELDS = [
+        ('token', Address),
+        ('transaction_uid', int),
+        ('balance', int),
+        ('timestamp', int)
+    ]
+
+    _LEGACY_FIELD = 'token'
+    _NAMESPACE = 4
+
     # ================================================
     #  Initialization
     # ================================================
     def __init__(self, uid: int, db: IconScoreDatabase):
         name = f"{BalanceHistory._NAME}_{uid}"
-        self._token = VarDB(f"{name}_token", db, value_type=Address)
-        self._transaction_uid = VarDB(f"{name}_transaction_uid", db, value_type=int)
-        self._balance = VarDB(f"{name}_balance", db, value_type=int)
-        self._timestamp = VarDB(f"{name}_timestamp", db, value_type=int)
+        super().__init__(name, db, uid)
         self._uid = uid
         self._name = name
-        self._db = db
 
     # ================================================
     #  Internal methods
@@ -20,6 +20,8 @@ from ..scorelib import *
 from ..interfaces.irc2 import *
 from ..wallet_owner_manager import *
 from ..transaction_manager import *
+from ..transaction_manager.outgoing_transaction import *
+from ..transaction_manager.sub_outgoing_transaction import *
 from ..event_manager import *
 from .consts import *
 from .balance_history import *
@@ -29,6 +31,18 @@ class InvalidBalance(Exception):
     pass
 
 
+class BalanceHistoryNotIndexed(Exception):
+    pass
+
+
+class InvalidBalanceBucketGranularity(Exception):
+    pass
+
+
+class InvalidBalanceHistoryRetention(Exception):
+    pass
+
+
 class BalanceHistoryManager:
 
     _NAME = 'BALANCE_HISTORY_MANAGER'
@@ -36,15 +50,44 @@ class BalanceHistoryManager:
     # ================================================
     #  Fields
     # ================================================
-    def _token_balance_history(self, token: Address) -> UIDLinkedListDB:
-        """ List of balance history items for any token """
-        return UIDLinkedListDB(f'{BalanceHistoryManager._NAME}_{str(token)}_balance_history', self.db)
+    def _token_balance_history(self, token: Address) -> UnrolledUIDListDB:
+        """ List of balance history items for any token, newest first """
+        name = f'{BalanceHistoryManager._NAME}_{str(token)}_balance_history'
+        return UnrolledUIDListDB(name, self.db, legacy_key=name, legacy_first=False)
 
     @property
     def _tracked_balance_history(self) -> SetDB:
         """ List of tokens that are actively tracked for the balance history """
         return SetDB(f'{BalanceHistoryManager._NAME}_tokens_tracked', self.db, value_type=Address)
 
+    def _token_balance_index(self, token: Address) -> PackedIntArrayDB:
+        """ Balance history items of a token, oldest first, addressable by their index """
+        return PackedIntArrayDB(f'{BalanceHistoryManager._NAME}_{str(token)}_balance_index', self.db)
+
+    @property
+    def _indexed_balance_history(self) -> VarDB:
+        """ Uid of the latest balance history item added to the token indexes """
+        return VarDB(f'{BalanceHistoryManager._NAME}_indexed_balance_history', self.db, value_type=int)
+
+    def _balance_buckets(self, token: Address, granularity: str) -> DictDB:
+        """ Open, close, min and max balances and changes count of a token by period """
+        return DictDB(f'{BalanceHistoryManager._NAME}_{str(token)}_{granularity}_buckets', self.db, value_type=bytes)
+
+    @property
+    def _balance_history_retention(self) -> DictDB:
+        """ Amount of balance history items kept for each token, all of them if 0 """
+        return DictDB(f'{BalanceHistoryManager._NAME}_balance_history_retention', self.db, value_type=int)
+
+    @property
+    def _compacted_balance_history(self) -> DictDB:
+        """ Uid of the newest compacted balance history item of the tokens, kept as a summary of the compacted items """
+        return DictDB(f'{BalanceHistoryManager._NAME}_compacted_balance_history', self.db, value_type=int)
+
+    @property
+    def _latest_balances(self) -> DictDB:
+        """ Latest balance and balance history uid of the tokens, packed in a single record """
+        return DictDB(f'{BalanceHistoryManager._NAME}_latest_balances', self.db, value_type=bytes)
+
     # ================================================
     #  Event Logs
     # ================================================
@@ -56,19 +99,82 @@ class BalanceHistoryManager:
     # ================================================
     #  Private methods
     # ================================================
-    def _update_token_balance(self, transaction_uid: int, token: Address, current_balance: int) -> None:
-        # Check for update in the last balance history item
+    @staticmethod
+    def _balance_bucket_period(granularity: str, timestamp: int) -> int:
+        """ Index of the period of a timestamp : days, weeks starting on monday or months since the epoch """
+        days = timestamp // (24 * 3600 * 10 ** 6)
+        if granularity == 'daily':
+            return days
+        if granularity == 'weekly':
+            return (days + 3) // 7
+        if granularity != 'monthly':
+            raise InvalidBalanceBucketGranularity(granularity)
+
+        # Convert the days to a civil date (proleptic gregorian calendar)
+        era, day_of_era = divmod(days + 719468, 146097)
+        year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+        day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+        month = (5 * day_of_year + 2) // 153
+        # The computed year starts in march
+        return (era * 400 + year_of_era - 1970) * 12 + month + 2
+
+    def _update_balance_buckets(self, token: Address, balance: int, timestamp: int) -> None:
+        for granularity in BALANCE_BUCKET_GRANULARITIES:
+            buckets = self._balance_buckets(token, granularity)
+            period = BalanceHistoryManager._balance_bucket_period(granularity, timestamp)
+            bucket = buckets[period]
+            if bucket:
+                opening, _, low, high, count = Codec.unpack(bucket, [int] * 5)
+                buckets[period] = Codec.pack([opening, balance, min(low, balance), max(high, balance), count + 1])
+            else:
+                buckets[period] = Codec.pack([balance, balance, balance, balance, 1])
+
+    def _index_balance_history(self, max_count: int) -> int:
+        """ Add a limited amount of balance history items to the index of their token, in creation order.
+            The items created before the indexes are added progressively. Returns the amount indexed """
+        indexed = self._indexed_balance_history.get()
+        last = min(IdFactory(BalanceHistoryFactory._NAME, self.db).get_last_uid(), indexed + max_count)
+
+        for balance_history_uid in range(indexed + 1, last + 1):
+            balance_history = BalanceHistory(balance_history_uid, self.db)
+            token = balance_history._token.get()
+            self._token_balance_index(token).put(balance_history_uid)
+            self._update_balance_buckets(token, balance_history._balance.get(), balance_history._timestamp.get())
+
+        if last > indexed:
+            self._indexed_balance_history.set(last)
+        return last - indexed
+
+    def _check_balance_history_indexed(self) -> None:
+        """ The token indexes and the balance buckets are incomplete until all the items are indexed """
+        if self._indexed_balance_history.get() != IdFactory(BalanceHistoryFactory._NAME, self.db).get_last_uid():
+            raise BalanceHistoryNotIndexed
+
+    def _latest_balance(self, token: Address) -> list:
+        """ Returns the latest balance of a token and its balance history uid, or None without history """
+        latest = self._latest_balances[token]
+        if latest:
+            return Codec.unpack(latest, [int, int])
+
+        # Tokens without a latest balance record are read from the head of their history
         token_balance_history = self._token_balance_history(token)
+        if len(token_balance_history) == 0:
+            return None
+        last_balance_history_uid = token_balance_history.head_value()
+        return [BalanceHistory(last_balance_history_uid, self.db)._balance.get(), last_balance_history_uid]
 
-        if len(token_balance_history) > 0:
-            last_balance_history_uid = token_balance_history.head_value()
-            last_balance_history = BalanceHistory(last_balance_history_uid, self.db)
-            if last_balance_history._balance.get() == current_balance:
-                # The last balance is the same, no need to update the balance history
-                return
+    def _update_token_balance(self, transaction_uid: int, token: Address, current_balance: int) -> None:
+        # Check for update in the last balance history item
+        latest = self._latest_balance(token)
+        if latest and latest[0] == current_balance:
+            # The last balance is the same, no need to update the balance history
+            return
 
         balance_history_uid = BalanceHistoryFactory.create(self.db, transaction_uid, token, current_balance, self.now())
-        token_balance_history.prepend(balance_history_uid)
+        self._token_balance_history(token).prepend(balance_history_uid)
+        self._latest_balances[token] = Codec.pack([current_balance, balance_history_uid])
+        # Index the new item, along with some of the items created before the indexes
+        self._index_balance_history(MAX_GARBAGE_COLLECTION_LOOP + 1)
         self.BalanceHistoryCreated(balance_history_uid)
 
     def _update_icx_balance(self, transaction_uid: int) -> None:
@@ -88,8 +194,23 @@ class BalanceHistoryManager:
         self._tracked_balance_history.add(ICX_TOKEN_ADDRESS)
         self.update_balance_history_manager(SYSTEM_TRANSACTION_UID)
 
-    def update_balance_history_manager(self, transaction_uid: int):
-        for token in self._tracked_balance_history:
+    def executed_transaction_tokens(self, transaction_uid: int) -> list:
+        """ Tokens whose balance may be changed by the sub transactions of an outgoing transaction :
+            ICX if some ICX is sent, and the contracts called by the sub transactions """
+        tokens = []
+        for sub_transaction_uid in OutgoingTransaction(transaction_uid, self.db).get_sub_transactions():
+            sub_transaction = SubOutgoingTransaction(sub_transaction_uid, self.db)
+            destination = sub_transaction._destination.get()
+            if sub_transaction._amount.get() > 0 and ICX_TOKEN_ADDRESS not in tokens:
+                tokens.append(ICX_TOKEN_ADDRESS)
+            if destination.is_contract and sub_transaction._method_name.get() and destination not in tokens:
+                tokens.append(destination)
+        return tokens
+
+    def update_balance_history_manager(self, transaction_uid: int, tokens: list = None):
+        """ Refresh the balance of the given tokens if they're tracked, or of all the tracked tokens """
+        tracked = self._tracked_balance_history
+        for token in (tracked if tokens is None else filter(tracked.__contains__, tokens)):
             if token == ICX_TOKEN_ADDRESS:
                 self._update_icx_balance(transaction_uid)
             else:
@@ -106,26 +227,124 @@ class BalanceHistoryManager:
             for balance_history_uid in self._token_balance_history(token).select(offset)
         ]
 
+    @external(readonly=True)
+    @catch_exception
+    def get_token_balance_history_page(self, token: Address, cursor: int = 0) -> dict:
+        return Utils.serialize_page(self._token_balance_history(token).select_page(cursor), self.get_balance_history)
+
     @external(readonly=True)
     @catch_exception
     def get_balance_history(self, balance_history_uid: int) -> dict:
         return BalanceHistory(balance_history_uid, self.db).serialize()
 
+    @external(readonly=True)
+    @catch_exception
+    def get_current_balances(self, offset: int = 0) -> list:
+        result = []
+        for token in self._tracked_balance_history.select(offset):
+            balance, balance_history_uid = self._latest_balance(token) or [0, 0]
+            result.append({"token": str(token), "balance": balance, "balance_history_uid": balance_history_uid})
+        return result
+
+    @external(readonly=True)
+    @catch_exception
+    def get_balance_at(self, token: Address, timestamp: int) -> dict:
+        """ Returns the latest balance history item of a token at a given timestamp,
+            or an empty dict if there was none or if it has been compacted, except the newest compacted item """
+        self._check_balance_history_indexed()
+
+        # Binary search of the first item after the timestamp.
+        # The compacted items are the oldest ones, their timestamp is read as 0 but for the newest one
+        index = self._token_balance_index(token)
+        low, high = 0, len(index)
+        while low < high:
+            middle = (low + high) // 2
+            if BalanceHistory(index[middle], self.db)._timestamp.get() <= timestamp:
+                low = middle + 1
+            else:
+                high = middle
+
+        balance_history = BalanceHistory(index[low - 1], self.db) if low > 0 else None
+        return balance_history.serialize() if balance_history and balance_history._timestamp.get() else {}
+
+    @external(readonly=True)
+    @catch_exception
+    def get_balance_buckets(self, token: Address, granularity: str, start: int, end: int) -> list:
+        """ Returns the balance buckets of a token for the periods between two timestamps """
+        self._check_balance_history_indexed()
+        result = []
+        buckets = self._balance_buckets(token, granularity)
+        first = BalanceHistoryManager._balance_bucket_period(granularity, start)
+        last = min(BalanceHistoryManager._balance_bucket_period(granularity, end), first + MAX_ITERATION_LOOP - 1)
+
+        for period in range(first, last + 1):
+            bucket = buckets[period]
+            if bucket:
+                result.append(dict(zip(
+                    ["period", "open", "close", "min", "max", "count"],
+                    [period] + Codec.unpack(bucket, [int] * 5))))
+        return result
+
     @external(readonly=True)
     @catch_exception
     def get_balance_trackers(self, offset: int = 0) -> list:
         return self._tracked_balance_history.select(offset)
 
     @external
-    @catch_exception
-    @only_multisig_owner
+    @defer_writes
+    @guarded(owner=True)
     def add_balance_tracker(self, token: Address) -> None:
         self._tracked_balance_history.add(token)
-        self.update_balance_history_manager(SYSTEM_TRANSACTION_UID)
+        self.update_balance_history_manager(SYSTEM_TRANSACTION_UID, [token])
 
     @external
-    @catch_exception
-    @only_multisig_owner
+    @defer_writes
+    @guarded(owner=True)
     def remove_balance_tracker(self, token: Address) -> None:
         self._tracked_balance_history.remove(token)
+
+    @external
+    @defer_writes
+    @guarded(owner=True)
+    def index_balance_history(self, max_items: int) -> None:
+        self._index_balance_history(max_items)
+
+    @external
+    @defer_writes
+    @guarded(owner=True)
+    def set_balance_history_retention(self, token: Address, max_items: int) -> None:
+        if max_items < 0:
+            raise InvalidBalanceHistoryRetention(max_items)
+        self._balance_history_retention[token] = max_items
+
+    @external
+    @defer_writes
+    @guarded(owner=True)
+    def compact_balance_history(self, token: Address, max_items: int) -> None:
+        """ Delete up to `max_items` of the oldest balance history items of a token beyond its retention.
+            The balance history must be indexed, so the deleted items remain summarized by the balance buckets.
+            The newest deleted item is kept, so the balance is still known until the oldest item retained """
+        self._check_balance_history_indexed()
+        retention = self._balance_history_retention[token]
+        token_balance_history = self._token_balance_history(token)
+        compacted = self._compacted_balance_history[token]
+
+        for _ in range(max_items):
+            if retention == 0 or len(token_balance_history) <= retention:
+                break
+            balance_history_uid = token_balance_history.tail_value()
+            token_balance_history.remove(balance_history_uid)
+            if compacted:
+                BalanceHistory(compacted, self.db).remove()
+            compacted = balance_history_uid
+
+        if compacted:
+            self._compacted_balance_history[token] = compacted
+
+    @external
+    @defer_writes
+    @guarded(owner=True)
+    def refresh_balance_history(self) -> None:
+        """ Refresh the balance of all the tracked tokens, for changes that weren't
+            made by an incoming or an executed transaction of the wallet """
         self.update_balance_history_manager(SYSTEM_TRANSACTION_UID)
@@ -18,3 +18,5 @@ from iconservice import *
 
 ICX_TOKEN_ADDRESS = Address.from_string('cx0000000000000000000000000000000000000000')
 SYSTEM_TRANSACTION_UID = 0
+# Periods of the balance buckets
+BALANCE_BUCKET_GRANULARITIES = ['daily', 'weekly', 'monthly']
@@ -16,5 +16,5 @@
 
 from iconservice import *
 
-VERSION = '1.0.0'
+VERSION = '1.1.0'
 DEFAULT_NAME = "My Safe"
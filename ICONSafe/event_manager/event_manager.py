@@ -54,6 +54,13 @@ class EventManager:
             for event_uid, event_hash in self._events.select(offset)
         ]
 
+    @external(readonly=True)
+    @catch_exception
+    def get_events_page(self, cursor: int = 0) -> dict:
+        return Utils.serialize_page(
+            self._events.select_page(cursor),
+            lambda event: {"uid": event[0], "hash": event[1]})
+
 
 def add_event(func):
     if not isfunction(func):
@@ -63,8 +63,23 @@ class ICONSafe(IconScoreBase,
         # if self._is_less_than_target_version('1.0.0'):
         #     self._migrate_v1_0_0()
 
+        if self._is_less_than_target_version('1.1.0'):
+            self._migrate_v1_1_0()
+
         self.on_update_version_manager(VERSION)
 
+    def _migrate_v1_1_0(self) -> None:
+        self.on_update_transaction_manager()
+
+    # ================================================
+    #  Database
+    # ================================================
+    @property
+    def db(self) -> IconScoreDatabase:
+        # During an external call, all the containers go through the cache of the call
+        cache = DatabaseCache.current(self)
+        return cache.db if cache else super().db
+
     # ================================================
     #  External methods
     # ================================================
@@ -72,14 +87,14 @@ class ICONSafe(IconScoreBase,
     def name(self) -> str:
         return ICONSafe._NAME
 
-    @catch_exception
-    @check_maintenance
+    @guarded(maintenance=True)
     @payable
+    @defer_writes
     def fallback(self):
         self.handle_incoming_transaction(ICX_TOKEN_ADDRESS, self.msg.sender, self.msg.value)
 
-    @catch_exception
-    @check_maintenance
+    @guarded(maintenance=True)
     @external
+    @defer_writes
     def tokenFallback(self, _from: Address, _value: int, _data: bytes) -> None:
         self.handle_incoming_transaction(self.msg.sender, _from, _value)
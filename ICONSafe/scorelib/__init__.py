@@ -1,13 +1,21 @@
 from .auth import *
 from .bag import *
-from .binary_tree import *
+from .bitmap import *
+from .cache import *
+from .codec import *
 from .consts import *
+from .entity import *
+from .epoch import *
 from .exception import *
 from .id_factory import *
 from .iterable_dict import *
+from .key import *
 from .linked_list import *
 from .maintenance import *
+from .packed_array import *
+from .record import *
 from .set import *
 from .state import *
+from .unrolled_list import *
 from .utils import *
 from .version import *
@@ -16,6 +16,8 @@
 
 from iconservice import *
 from .consts import *
+from .epoch import *
+from .utils import *
 
 
 class ItemNotFound(Exception):
@@ -32,37 +34,167 @@ class BagDB(object):
     """
     BagDB is an iterable collection of items that may have duplicates.
     Order of retrieval is *optionally* significant (*not* significant by default)
+    Removing an item from an ordered BagDB leaves a tombstone in its slot instead of
+    shifting the next items, so the removal is done in constant time.
+    The tombstones are reclaimed once they outnumber the items of the bag.
+    The records of the bag are keyed by its current epoch, so clearing it is done
+    in constant time. The items of the previous epochs are deleted progressively
+    during the next writes.
     """
 
     _NAME = '_BAGDB'
 
     def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type, order=False):
         self._name = var_key + BagDB._NAME
-        self._items = ArrayDB(f'{self._name}_items', db, value_type=value_type)
+        self._key = self._name
+        self._epoch = EpochDB(self._key, db)
+        self._value_type = value_type
         self._order = order
         self._db = db
+        self._bind(self._epoch.suffix())
+
+    def _bind(self, suffix: str) -> None:
+        """ Select the records of the epoch matching a given key suffix """
+        name = self._key + suffix
+        self._items = ArrayDB(f'{name}_items', self._db, value_type=self._value_type)
+        # Ordered bags only : index of the first item, and removed slots after it
+        self._start = VarDB(f'{name}_start', self._db, value_type=int)
+        self._tombstones = DictDB(f'{name}_tombstones', self._db, value_type=bool)
+        self._tombstones_count = VarDB(f'{name}_tombstones_count', self._db, value_type=int)
+
+    def _indexes(self, cursor: int = 0):
+        """ Iterate over the array indexes of the items of the bag, skipping the tombstones """
+        length = len(self._items)
+
+        if not self._order:
+            for index in range(cursor, length):
+                yield index
+            return
+
+        start = max(cursor, self._start.get())
+        has_tombstones = self._tombstones_count.get() > 0
+
+        for index in range(start, length):
+            if has_tombstones and self._tombstones[index]:
+                continue
+            yield index
+
+    def _has_tombstones(self) -> bool:
+        return self._order and (self._start.get() != 0 or self._tombstones_count.get() != 0)
+
+    def _array_index(self, index: int) -> int:
+        """ Convert the position of an item in the bag to its index in the array """
+        if not self._has_tombstones():
+            return index
+
+        if index < 0:
+            index += len(self)
+
+        for position, array_index in enumerate(self._indexes()):
+            if position == index:
+                return array_index
+
+        raise ItemNotFound(self._name, str(index))
+
+    def _on_move(self, item, index: int) -> None:
+        """ Called when an item is moved to another index of the array """
+        pass
+
+    def _remove_at(self, index: int) -> None:
+        """ Remove the item at a given index of the array """
+        if not self._order:
+            # Replace the removed item with the tail of the array
+            last = self._items.pop()
+            if index != len(self._items):
+                self._items[index] = last
+                self._on_move(last, index)
+            return
+
+        length = len(self._items)
+        start = old_start = self._start.get()
+        tombstones_count = old_tombstones_count = self._tombstones_count.get()
+
+        if index == length - 1:
+            # Drop the tail, along with the tombstones preceding it
+            self._items.pop()
+            length -= 1
+            while length > start and self._tombstones[length - 1]:
+                self._tombstones.remove(length - 1)
+                self._items.pop()
+                length -= 1
+                tombstones_count -= 1
+        elif index == start:
+            # Move the start after the removed item and the tombstones following it
+            start += 1
+            while self._tombstones[start]:
+                self._tombstones.remove(start)
+                start += 1
+                tombstones_count -= 1
+        else:
+            self._tombstones[index] = True
+            tombstones_count += 1
+
+        if length == start:
+            # Nothing left in the bag, reclaim the removed slots
+            while self._items:
+                self._items.pop()
+            start = 0
+        elif start + tombstones_count > length - start - tombstones_count:
+            # More removed slots than items
+            self._compact(start, length, tombstones_count)
+            start = tombstones_count = 0
+
+        if start != old_start:
+            self._start.set(start)
+        if tombstones_count != old_tombstones_count:
+            self._tombstones_count.set(tombstones_count)
+
+    def _compact(self, start: int, length: int, tombstones_count: int) -> None:
+        """ Move all the items at the beginning of the array and remove the tombstones """
+        target = 0
+
+        for index in range(start, length):
+            if tombstones_count > 0 and self._tombstones[index]:
+                self._tombstones.remove(index)
+                tombstones_count -= 1
+                continue
+            if index != target:
+                item = self._items[index]
+                self._items[target] = item
+                self._on_move(item, target)
+            target += 1
+
+        while len(self._items) > target:
+            self._items.pop()
 
     def __iter__(self):
-        for item in self._items:
-            yield item
+        if not self._has_tombstones():
+            for item in self._items:
+                yield item
+            return
+
+        for index in self._indexes():
+            yield self._items[index]
 
     def __len__(self) -> int:
-        return len(self._items)
+        if not self._order:
+            return len(self._items)
+        return len(self._items) - self._start.get() - self._tombstones_count.get()
 
     def __getitem__(self, index: int):
         if not self._order:
             raise BagDBIsNotOrdered(self._name)
-        return self._items[index]
+        return self._items[self._array_index(index)]
 
     def __setitem__(self, index: int, value):
         if not self._order:
             raise BagDBIsNotOrdered(self._name)
-        self._items[index] = value
+        self._items[self._array_index(index)] = value
 
     def first(self):
         if not self._order:
             raise BagDBIsNotOrdered(self._name)
-        return self._items[0]
+        return self._items[self._start.get()]
 
     def last(self):
         if not self._order:
@@ -70,7 +202,10 @@ class BagDB(object):
         return self._items[len(self._items) - 1]
 
     def __contains__(self, item) -> bool:
-        return item in self._items
+        for cur in self:
+            if cur == item:
+                return True
+        return False
 
     def check_exists(self, item) -> None:
         if not item in self:
@@ -79,56 +214,111 @@ class BagDB(object):
     def count(self, item) -> int:
         """ Returns the number of occurences of a given item in the bag """
         count = 0
-        for cur in self._items:
+        for cur in self:
             if cur == item:
                 count += 1
         return count
 
     def add(self, item) -> None:
         """ Adds an item in the bag """
+        if self._epoch.has_garbage():
+            self.collect_garbage(MAX_GARBAGE_COLLECTION_LOOP)
         self._items.put(item)
 
     def clear(self) -> None:
         """ Removes all the items from the bag """
-        while self._items:
-            self._items.pop()
+        if not self._items:
+            return
+
+        # The items of the current epoch become unreachable
+        self._epoch.next()
+        self._bind(self._epoch.suffix())
+
+    def _on_collect(self, item) -> None:
+        """ Called when an item of a previous epoch is deleted """
+        pass
+
+    def _remove_metadata(self) -> None:
+        """ Remove the records describing the bag, except its items """
+        self._start.remove()
+        self._tombstones_count.remove()
+        Utils.remove_array(self._items)
+
+    def has_garbage(self) -> bool:
+        """ Returns True if some records of the previous epochs haven't been deleted yet """
+        return self._epoch.has_garbage()
+
+    def _collect_items(self, max_count: int, on_collect=None) -> int:
+        """ Delete a limited amount of slots from the end of the array of a stale bag, without reindexing it.
+            `on_collect` is called with each item deleted. Returns the amount of slots deleted """
+        start = self._start.get()
+        has_tombstones = self._tombstones_count.get() > 0
+        count = 0
+
+        while self._items and count < max_count:
+            index = len(self._items) - 1
+            item = self._items.pop()
+            if has_tombstones and self._tombstones[index]:
+                self._tombstones.remove(index)
+            elif index >= start:
+                self._on_collect(item)
+                if on_collect:
+                    on_collect(item)
+            count += 1
+
+        return count
+
+    def collect_garbage(self, max_count: int = MAX_ITERATION_LOOP) -> int:
+        """ Delete a limited amount of items left by the previous epochs of the bag.
+            Returns the amount of records deleted """
+        count = 0
+
+        try:
+            while count < max_count and self._epoch.has_garbage():
+                self._bind(self._epoch.suffix(self._epoch.garbage()))
+                count += self._collect_items(max_count - count)
+
+                if not self._items:
+                    self._remove_metadata()
+                    self._epoch.collected()
+                    count += 1
+        finally:
+            self._bind(self._epoch.suffix())
+
+        return count
+
+    def delete(self) -> None:
+        """ Delete all the records of the bag, including the ones of its previous epochs """
+        self.clear()
+        while self.has_garbage():
+            self.collect_garbage()
+        self._remove_metadata()
+        self._epoch.remove()
+        self._bind(self._epoch.suffix())
 
     def remove(self, item) -> None:
         """ This operation removes a given item from the bag.
+            An ordered bag removes the last occurrence of the item.
             If the item does not exist, it *does not raise* a KeyError.
         """
-        if self._order:
-            # Remove from the ArrayDB (ordered)
-            tmp = []
-            while self._items:
-                cur = self._items.pop()
-                # Keep all the elements until we reach the selected one
-                if cur != item:
-                    tmp.append(cur)
-                # We found the removable element, stop here
-                else:
-                    break
-            # Append the elements next to the removed one in order
-            while tmp:
-                cur = tmp.pop()
-                self._items.put(cur)
-        else:
-            # Remove from the ArrayDB (unordered)
-            length = len(self._items)
-            for idx, cur in enumerate(self._items):
+        if not self._order:
+            for index, cur in enumerate(self._items):
                 # Look for the item index to be removed
                 if cur == item:
-                    if idx == length - 1:
-                        # Nothing left in the array
-                        self._items.pop()
-                    else:
-                        # Replace the old value with the tail of the array
-                        self._items[idx] = self._items.pop()
+                    self._remove_at(index)
                     return
+            return
+
+        has_tombstones = self._tombstones_count.get() > 0
+        for index in range(len(self._items) - 1, self._start.get() - 1, -1):
+            # Look for the item index to be removed from the end, skipping the removed slots
+            if self._items[index] == item and not (has_tombstones and self._tombstones[index]):
+                self._remove_at(index)
+                return
 
     def select(self, offset: int, cond=None, **kwargs) -> list:
         """ Returns a limited amount of items in the BagDB that optionally fulfills a condition """
-        items = iter(self._items)
+        items = iter(self)
         result = []
 
         # Skip N items until offset
@@ -153,3 +343,26 @@ class BagDB(object):
                 break
 
         return result
+
+    def select_page(self, cursor: int = 0, cond=None, **kwargs) -> tuple:
+        """ Returns a limited amount of items in the BagDB that optionally fulfills a condition,
+            starting from a given index.
+            Returns the items, the index of the next page (0 if none) and whether there are more items.
+            The cursor is an index of the underlying array : when an ordered bag is compacted between
+            two pages, its items are renumbered, so the next page may skip or repeat some items """
+        result = []
+        next_cursor = 0
+
+        for count, index in enumerate(self._indexes(cursor)):
+            if count == MAX_ITERATION_LOOP:
+                next_cursor = index
+                break
+
+            item = self._items[index]
+            if cond:
+                if cond(self._db, item, **kwargs):
+                    result.append(item)
+            else:
+                result.append(item)
+
+        return result, next_cursor, next_cursor != 0
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+
+class BitmapDB:
+    """ BitmapDB is a set of non-negative integers stored as a bitmap,
+        in chunks of `chunk_bits` bits.
+        Looking up n consecutive integers reads about n / chunk_bits records.
+    """
+
+    _NAME = '_BITMAPDB'
+
+    def __init__(self, var_key: str, db: IconScoreDatabase, chunk_bits: int = 256):
+        self._name = var_key + BitmapDB._NAME
+        self._chunk_bits = chunk_bits
+        self._db = db
+
+    def _chunk(self, chunk_index: int) -> VarDB:
+        return VarDB(f'{self._name}_{chunk_index}', self._db, value_type=bytes)
+
+    def _read_chunk(self, chunk_index: int) -> bytes:
+        return self._chunk(chunk_index).get() or b''
+
+    @staticmethod
+    def _bit(data: bytes, offset: int) -> bool:
+        byte = offset // 8
+        return byte < len(data) and bool(data[byte] & (1 << (offset % 8)))
+
+    def __contains__(self, index: int) -> bool:
+        return BitmapDB._bit(self._read_chunk(index // self._chunk_bits), index % self._chunk_bits)
+
+    def set(self, index: int, value: bool = True) -> None:
+        chunk_index, offset = divmod(index, self._chunk_bits)
+        data = bytearray(self._read_chunk(chunk_index))
+        byte = offset // 8
+
+        if value:
+            data += bytes(max(0, byte + 1 - len(data)))
+            data[byte] |= 1 << (offset % 8)
+        elif byte < len(data):
+            data[byte] &= ~(1 << (offset % 8)) & 0xFF
+
+        # Trailing empty bytes aren't stored
+        data = bytes(data).rstrip(b'\x00')
+        if data:
+            self._chunk(chunk_index).set(data)
+        else:
+            self._chunk(chunk_index).remove()
+
+    def remove(self, index: int) -> None:
+        self.set(index, False)
+
+    def get_range(self, start: int, end: int) -> list:
+        """ Returns the integers of the set in [start, end) """
+        result = []
+        chunk_index, data = None, b''
+
+        for index in range(start, end):
+            if index // self._chunk_bits != chunk_index:
+                chunk_index = index // self._chunk_bits
+                data = self._read_chunk(chunk_index)
+            if BitmapDB._bit(data, index % self._chunk_bits):
+                result.append(index)
+
+        return result
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from .auth import *
+from .consts import *
+
+
+class DatabaseCacheInconsistency(Exception):
+    pass
+
+
+class CachedDatabase:
+    """ CachedDatabase gives an IconScoreDatabase-like access to the database through a DatabaseCache """
+
+    def __init__(self, cache: 'DatabaseCache', db: IconScoreDatabase, path: tuple = ()):
+        self._cache = cache
+        self._db = db
+        self._path = path
+
+    @property
+    def address(self) -> Address:
+        return self._db.address
+
+    @staticmethod
+    def _key(key) -> tuple:
+        # Keys are either raw bytes or iconservice typed keys
+        if isinstance(key, bytes):
+            return (key, None)
+        return (key.value, key.type.name)
+
+    def get_sub_db(self, prefix) -> 'CachedDatabase':
+        return CachedDatabase(self._cache, self._db.get_sub_db(prefix), self._path + (CachedDatabase._key(prefix),))
+
+    def get(self, key) -> bytes:
+        return self._cache.read(self._path + (CachedDatabase._key(key),), self._db, key)
+
+    def put(self, key, value: bytes) -> None:
+        self._cache.write(self._path + (CachedDatabase._key(key),), self._db, key, value)
+
+    def delete(self, key) -> None:
+        self._cache.write(self._path + (CachedDatabase._key(key),), self._db, key, None)
+
+
+class DatabaseCache:
+    """ DatabaseCache is a read-through / write-behind cache over the database of a SCORE,
+        opened by `defer_writes` for the duration of an external call.
+        Reads are memoized, and the writes are kept in memory : repeated writes to the same key
+        are coalesced, then written in their first write order when the cache is flushed.
+        The cache belongs to the SCORE instance serving the call, so it is never shared with
+        the other calls, which are served by other instances.
+    """
+
+    def __init__(self, db: IconScoreDatabase):
+        self._values = {}
+        self._dirty = {}
+        self.db = CachedDatabase(self, db)
+        # Wallet owner uid of the sender, resolved once by the guard of the call
+        self.sender_uid = 0
+
+    @staticmethod
+    def current(score: object) -> 'DatabaseCache':
+        """ Returns the cache of the call served by a SCORE instance, None if there is none """
+        return score.__dict__.get('_database_cache')
+
+    # ================================================
+    #  Internal methods
+    # ================================================
+    def read(self, path: tuple, db: IconScoreDatabase, key) -> bytes:
+        if path in self._values:
+            value = self._values[path]
+            if CACHE_CONSISTENCY_CHECK and path not in self._dirty and db.get(key) != value:
+                raise DatabaseCacheInconsistency(path, value, db.get(key))
+            return value
+
+        value = db.get(key)
+        self._values[path] = value
+        return value
+
+    def write(self, path: tuple, db: IconScoreDatabase, key, value: bytes) -> None:
+        self._values[path] = value
+        if path not in self._dirty:
+            self._dirty[path] = (db, key)
+
+    def flush(self) -> None:
+        for path, (db, key) in self._dirty.items():
+            value = self._values[path]
+            if value is None:
+                db.delete(key)
+            else:
+                db.put(key, value)
+        self._dirty = {}
+
+    def flush_before_call(self) -> None:
+        """ Write the pending writes before calling another SCORE, so it reads the latest state.
+            The callee may call this SCORE back, so the values read so far are read again afterwards """
+        self.flush()
+        self._values = {}
+
+
+def defer_writes(func):
+    if not isfunction(func):
+        raise NotAFunctionError
+
+    @wraps(func)
+    def __wrapper(self: object, *args, **kwargs):
+        if DatabaseCache.current(self):
+            # The method is called by another method of the same call
+            return func(self, *args, **kwargs)
+
+        cache = DatabaseCache(self.db)
+        self._database_cache = cache
+        try:
+            result = func(self, *args, **kwargs)
+            cache.flush()
+            return result
+        finally:
+            # A failed call discards its pending writes
+            self._database_cache = None
+    return __wrapper
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+
+class InvalidCodecValueType(Exception):
+    pass
+
+
+class MalformedCodecData(Exception):
+    pass
+
+
+class Codec:
+    """ Codec packs several SCORE values into a single compact bytes record,
+        so they can be stored under one key and read with a single DB access.
+        Each field is encoded as a varint length followed by its payload.
+    """
+
+    # ================================================
+    #  Values
+    # ================================================
+    @staticmethod
+    def encode_value(value) -> bytes:
+        """ Encode a value the same way the SCORE containers do.
+            None and default values are encoded as an empty payload """
+        if value is None:
+            return b''
+        if isinstance(value, bool):
+            value = int(value)
+        if isinstance(value, int):
+            if value == 0:
+                return b''
+            return value.to_bytes((value.bit_length() + 8) // 8, 'big', signed=True)
+        if isinstance(value, str):
+            return value.encode('utf-8')
+        if isinstance(value, Address):
+            return value.to_bytes()
+        if isinstance(value, bytes):
+            return value
+        raise InvalidCodecValueType(type(value))
+
+    @staticmethod
+    def decode_value(data: bytes, value_type: type):
+        """ Decode a payload encoded with `encode_value`.
+            An empty payload is decoded as the default value of the type """
+        if value_type == int:
+            return int.from_bytes(data, 'big', signed=True) if data else 0
+        if value_type == bool:
+            return bool(int.from_bytes(data, 'big', signed=True)) if data else False
+        if value_type == str:
+            return data.decode('utf-8')
+        if value_type == Address:
+            return Address.from_bytes(data) if data else None
+        if value_type == bytes:
+            return data if data else None
+        raise InvalidCodecValueType(value_type)
+
+    # ================================================
+    #  Varints
+    # ================================================
+    @staticmethod
+    def encode_varint(value: int) -> bytes:
+        """ Encode an unsigned integer using a variable amount of bytes (LEB128) """
+        result = bytearray()
+        while value >= 0x80:
+            result.append((value & 0x7f) | 0x80)
+            value >>= 7
+        result.append(value)
+        return bytes(result)
+
+    @staticmethod
+    def decode_varint(data: bytes, offset: int) -> tuple:
+        """ Decode a varint at a given offset, returns the value and the next offset """
+        value = 0
+        shift = 0
+        while True:
+            if offset >= len(data):
+                raise MalformedCodecData(data)
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7f) << shift
+            if not byte & 0x80:
+                return value, offset
+            shift += 7
+
+    # ================================================
+    #  Records
+    # ================================================
+    @staticmethod
+    def pack(values: list) -> bytes:
+        """ Pack a list of values in a single record """
+        result = bytearray()
+        for value in values:
+            payload = Codec.encode_value(value)
+            result += Codec.encode_varint(len(payload))
+            result += payload
+        return bytes(result)
+
+    @staticmethod
+    def split(data: bytes, count: int = None) -> list:
+        """ Split a record packed with `pack` into the raw payloads of its values.
+            If count is specified, only the first `count` payloads are returned """
+        result = []
+        offset = 0
+        while offset < len(data) and (count is None or len(result) < count):
+            size, offset = Codec.decode_varint(data, offset)
+            payload = data[offset:offset + size]
+            if len(payload) != size:
+                raise MalformedCodecData(data)
+            offset += size
+            result.append(payload)
+        return result
+
+    @staticmethod
+    def unpack(data: bytes, value_types: list) -> list:
+        """ Unpack a record packed with `pack`, given the types of its values.
+            Missing trailing values are decoded as default values, so new
+            fields may be appended to a record without breaking older ones """
+        payloads = Codec.split(data, len(value_types))
+        payloads += [b''] * (len(value_types) - len(payloads))
+        return [
+            Codec.decode_value(payload, value_type)
+            for payload, value_type in zip(payloads, value_types)
+        ]
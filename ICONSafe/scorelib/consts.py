@@ -20,3 +20,7 @@ from iconservice import *
 #  Consts
 # ================================================
 MAX_ITERATION_LOOP = 100
+# Amount of records left by the previous epochs of a container collected on each write
+MAX_GARBAGE_COLLECTION_LOOP = 4
+# Check every value read from the call cache against the database (debug only)
+CACHE_CONSISTENCY_CHECK = False
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from .key import *
+from .record import *
+
+
+class EntityDB:
+    """ EntityDB is the base class of the entities stored in a single RecordDB.
+        The fields are declared in `_FIELDS`, and the accessor of a field `name`
+        is only created when `self._name` is first used.
+        Entities created before the record layout stored each field in a VarDB
+        named `{key}_{field}`, and are recognized by their `_LEGACY_FIELD` being set.
+        Entities declaring a `_NAMESPACE` are stored under the compact key of their uid.
+        The writes of an entity aren't tracked by the entity itself : during an external call,
+        the DatabaseCache opened by `defer_writes` holds the dirty record until the call ends.
+    """
+
+    # List of (name, type) of the entity fields
+    _FIELDS = []
+    # Field always set on a legacy entity
+    _LEGACY_FIELD = None
+    # Namespace of the compact keys of the entity
+    _NAMESPACE = None
+
+    # ================================================
+    #  Initialization
+    # ================================================
+    def __init__(self, key: str, db: IconScoreDatabase, uid: int = None):
+        self._key = key
+        self._db = db
+        compact_key = None
+        if self._NAMESPACE is not None and uid is not None:
+            compact_key = CompactKey.make(self._NAMESPACE, uid)
+        self._record = RecordDB(key, db, self._FIELDS,
+                                legacy_loader=self._load_legacy,
+                                legacy_remover=self._remove_legacy,
+                                key=compact_key)
+
+    def __getattr__(self, attribute: str):
+        # Only called if the attribute hasn't been found, i.e. the field accessor doesn't exist yet
+        fields = [f"_{name}" for name, _ in self._FIELDS]
+        if '_record' not in self.__dict__ or attribute not in fields:
+            raise AttributeError(attribute)
+
+        accessor = self._record.field(attribute[1:])
+        setattr(self, attribute, accessor)
+        return accessor
+
+    def remove(self) -> None:
+        """ Delete the entity """
+        self._record.remove()
+
+    # ================================================
+    #  Legacy
+    # ================================================
+    def _legacy_fields(self) -> dict:
+        return {
+            name: VarDB(f"{self._key}_{name}", self._db, value_type=value_type)
+            for name, value_type in self._FIELDS
+        }
+
+    def _load_legacy(self) -> dict:
+        if self._LEGACY_FIELD is None:
+            return None
+
+        fields = self._legacy_fields()
+        if not fields[self._LEGACY_FIELD].get():
+            return None
+
+        return {name: field.get() for name, field in fields.items()}
+
+    def _remove_legacy(self) -> None:
+        for field in self._legacy_fields().values():
+            field.remove()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from .codec import *
+
+
+class EpochDB:
+    """ EpochDB is the generation counter of a container.
+        The records of a container are stored under a key suffix depending on its current epoch,
+        so clearing a container only requires moving to the next epoch.
+        The records of the previous epochs become unreachable, and are collected afterward.
+    """
+
+    _NAME = '_EPOCH'
+
+    def __init__(self, var_key: str, db: IconScoreDatabase):
+        self._record = VarDB(var_key + EpochDB._NAME, db, value_type=bytes)
+        self._current, self._collected = Codec.unpack(self._record.get() or b'', [int, int])
+
+    def _save(self) -> None:
+        self._record.set(Codec.pack([self._current, self._collected]))
+
+    def get(self) -> int:
+        """ Returns the current epoch """
+        return self._current
+
+    def suffix(self, epoch: int = None) -> str:
+        """ Returns the key suffix of the records of a given epoch (current epoch by default).
+            Records of the initial epoch don't have any suffix """
+        if epoch is None:
+            epoch = self._current
+        return f'_EPOCH{epoch}' if epoch else ''
+
+    def next(self) -> None:
+        """ Move to the next epoch """
+        self._current += 1
+        self._save()
+
+    def has_garbage(self) -> bool:
+        """ Returns True if some previous epochs haven't been collected yet """
+        return self._collected < self._current
+
+    def garbage(self) -> int:
+        """ Returns the oldest epoch that hasn't been collected yet """
+        return self._collected
+
+    def collected(self) -> None:
+        """ Mark the oldest uncollected epoch as collected """
+        self._collected += 1
+        self._save()
+
+    def remove(self) -> None:
+        """ Go back to the initial epoch, once all the previous epochs have been collected """
+        self._record.remove()
+        self._current = self._collected = 0
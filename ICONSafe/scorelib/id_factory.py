@@ -30,5 +30,20 @@ class IdFactory:
     def get_uid(self) -> int:
         # UID = 0 is forbidden in order to prevent conflict with uninitialized uid
         # Starts with UID 1
-        self._uid.set(self._uid.get() + 1)
+        uid = self._uid.get() + 1
+        self._uid.set(uid)
+        return uid
+
+    def get_last_uid(self) -> int:
+        """ Returns the latest uid generated, 0 if none """
         return self._uid.get()
+
+    def reserve(self, count: int) -> range:
+        """ Reserve a contiguous range of `count` uids at once """
+        first = self._uid.get() + 1
+        if count > 0:
+            self._uid.set(first + count - 1)
+        return range(first, first + max(count, 0))
+
+    def delete(self) -> None:
+        self._uid.remove()
@@ -17,6 +17,7 @@
 from iconservice import *
 from .set import *
 from .consts import *
+from .epoch import *
 
 
 class IterableDictDB(object):
@@ -24,15 +25,26 @@ class IterableDictDB(object):
     Utility class wrapping the state DB.
     IterableDictDB behaves like a DictDB, but supports iterator operation at a higher step cost.
     Order of retrieval during iteration is *optionally* significant (*not* significant by default)
+    The records of the dict are keyed by its current epoch, so clearing it is done
+    in constant time. The items of the previous epochs are deleted progressively
+    during the next writes.
     """
 
     _NAME = '_ITERABLE_DICTDB'
 
     def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type, order=False):
         self._name = var_key + IterableDictDB._NAME
-        self._keys = SetDB(f'{self._name}_keys', db, value_type, order)
-        self._values = DictDB(f'{self._name}_values', db, value_type)
+        self._epoch = EpochDB(self._name, db)
+        self._value_type = value_type
+        self._order = order
         self._db = db
+        self._bind(self._epoch.suffix())
+
+    def _bind(self, suffix: str) -> None:
+        """ Select the records of the epoch matching a given key suffix """
+        name = self._name + suffix
+        self._keys = SetDB(f'{name}_keys', self._db, self._value_type, self._order)
+        self._values = DictDB(f'{name}_values', self._db, self._value_type)
 
     def __iter__(self):
         for key in self._keys:
@@ -53,6 +65,8 @@ class IterableDictDB(object):
         return len(self._keys)
 
     def __setitem__(self, key, value) -> None:
+        if self._epoch.has_garbage():
+            self.collect_garbage(MAX_GARBAGE_COLLECTION_LOOP)
         self._keys.add(key)
         self._values[key] = value
 
@@ -92,10 +106,54 @@ class IterableDictDB(object):
 
         return {k: v for k, v in result}
 
+    def select_page(self, cursor: int = 0, cond=None, **kwargs) -> tuple:
+        """ Returns a limited amount of items in the IterableDictDB that optionally fulfills a condition,
+            starting from a given key index.
+            Returns the items, the key index of the next page (0 if none) and whether there are more items.
+            As with BagDB.select_page, a compaction of the keys between two pages may shift the key indexes """
+        keys, next_cursor, has_more = self._keys.select_page(cursor)
+        result = []
+
+        for key in keys:
+            item = (key, self._values[key])
+            if cond:
+                if cond(self._db, item, **kwargs):
+                    result.append(item)
+            else:
+                result.append(item)
+
+        return {k: v for k, v in result}, next_cursor, has_more
+
     def clear(self):
         """ Remove all key,value pairs in the dict """
-        # Removes values
-        for key in self.keys():
-            del self._values[key]
-        # Remove keys
-        self._keys.clear()
+        if not len(self._keys):
+            return
+
+        # The items of the current epoch become unreachable
+        self._epoch.next()
+        self._bind(self._epoch.suffix())
+
+    def has_garbage(self) -> bool:
+        """ Returns True if some records of the previous epochs haven't been deleted yet """
+        return self._epoch.has_garbage()
+
+    def collect_garbage(self, max_count: int = MAX_ITERATION_LOOP) -> int:
+        """ Delete a limited amount of items left by the previous epochs of the dict.
+            Returns the amount of records deleted """
+        count = 0
+
+        try:
+            while count < max_count and self._epoch.has_garbage():
+                self._bind(self._epoch.suffix(self._epoch.garbage()))
+
+                # Delete the keys of the stale dict, along with their values
+                count += self._keys._collect_items(max_count - count, self._values.remove)
+
+                if not self._keys._items:
+                    self._keys._remove_metadata()
+                    self._epoch.collected()
+                    count += 1
+        finally:
+            self._bind(self._epoch.suffix())
+
+        return count
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from .codec import *
+
+
+class InvalidKeyNamespace(Exception):
+    pass
+
+
+class CompactKey:
+    """ CompactKey builds short binary storage keys made of a one byte namespace
+        followed by the big endian encoding of an uid.
+        Namespaces are below 0x20, so a compact key never collides with the
+        printable names used by the other containers.
+        Only the entities use compact keys, the containers and managers keep their named keys.
+    """
+
+    _MAX_NAMESPACE = 0x1F
+
+    @staticmethod
+    def make(namespace: int, uid: int) -> bytes:
+        if not 0 < namespace <= CompactKey._MAX_NAMESPACE:
+            raise InvalidKeyNamespace(namespace)
+        return bytes([namespace]) + Codec.encode_value(uid)
+
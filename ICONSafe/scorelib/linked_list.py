@@ -17,6 +17,8 @@
 from iconservice import *
 from .id_factory import *
 from .consts import *
+from .codec import *
+from .epoch import *
 
 
 class EmptyLinkedListException(Exception):
@@ -35,49 +37,118 @@ class LinkedNodeCannotMoveItself(Exception):
     pass
 
 
+class _LegacyNodeDB:
+    """ LegacyNodeDB is the previous storage layout of a NodeDB, where each field
+        of the node was stored in its own VarDB.
+        It is only used for reading and migrating nodes created before the packed layout.
+    """
+    _UNINITIALIZED = 0
+
+    def __init__(self, name: str, db: IconScoreDatabase, value_type: type):
+        self._init = VarDB(f'{name}_init', db, int)
+        self._value = VarDB(f'{name}_value', db, value_type)
+        self._next = VarDB(f'{name}_next', db, int)
+        self._prev = VarDB(f'{name}_prev', db, int)
+
+    def exists(self) -> bool:
+        return self._init.get() != _LegacyNodeDB._UNINITIALIZED
+
+    def load(self) -> tuple:
+        return self._value.get(), self._prev.get(), self._next.get()
+
+    def delete(self) -> None:
+        self._value.remove()
+        self._prev.remove()
+        self._next.remove()
+        self._init.remove()
+
+
 class _NodeDB:
     """ NodeDB is an item of the LinkedListDB
+        The value, the previous and the next node ids are packed in a single record,
+        so a node is fetched with one read and stored with one write.
+        Modifications are kept in memory until `save` is called.
         Its structure is internal and shouldn't be manipulated outside of this module
     """
     _NAME = '_NODEDB'
-    _UNINITIALIZED = 0
-    _INITIALIZED = 1
 
     def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type):
         self._name = var_key + _NodeDB._NAME
-        self._init = VarDB(f'{self._name}_init', db, int)
-        self._value = VarDB(f'{self._name}_value', db, value_type)
-        self._next = VarDB(f'{self._name}_next', db, int)
-        self._prev = VarDB(f'{self._name}_prev', db, int)
+        self._record = VarDB(f'{self._name}_record', db, bytes)
+        self._value_type = value_type
         self._db = db
+        self._loaded = False
+        self._legacy = None
+        self._exists = False
+        self._value = None
+        self._prev = 0
+        self._next = 0
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+
+        self._loaded = True
+        record = self._record.get()
+
+        if record is not None:
+            self._exists = True
+            self._value, self._prev, self._next = Codec.unpack(record, [self._value_type, int, int])
+            return
+
+        # Nodes created before the packed layout are migrated on their next write
+        legacy = _LegacyNodeDB(self._name, self._db, self._value_type)
+        if legacy.exists():
+            self._exists = True
+            self._legacy = legacy
+            self._value, self._prev, self._next = legacy.load()
+
+    def save(self) -> None:
+        self._record.set(Codec.pack([self._value, self._prev, self._next]))
+        self._exists = True
+        self._loaded = True
+
+        if self._legacy:
+            self._legacy.delete()
+            self._legacy = None
 
     def delete(self) -> None:
-        self._value.remove()
-        self._prev.remove()
-        self._next.remove()
-        self._init.remove()
+        self._load()
+        self._record.remove()
+
+        if self._legacy:
+            self._legacy.delete()
+            self._legacy = None
+
+        self._exists = False
 
     def exists(self) -> bool:
-        return self._init.get() != _NodeDB._UNINITIALIZED
+        self._load()
+        return self._exists
 
     def get_value(self):
-        return self._value.get()
+        self._load()
+        return self._value
 
     def set_value(self, value) -> None:
-        self._init.set(_NodeDB._INITIALIZED)
-        self._value.set(value)
+        self._load()
+        self._value = value
 
     def get_next(self) -> int:
-        return self._next.get()
+        self._load()
+        return self._next
 
     def set_next(self, next_id: int) -> None:
-        self._next.set(next_id)
+        self._load()
+        self._next = next_id
 
     def get_prev(self) -> int:
-        return self._prev.get()
+        self._load()
+        return self._prev
 
     def set_prev(self, prev_id: int) -> None:
-        self._prev.set(prev_id)
+        self._load()
+        self._prev = prev_id
 
 
 class LinkedListDB:
@@ -85,23 +156,34 @@ class LinkedListDB:
         Order of retrieval is preserved.
         Circular linked listing or duplicates nodes in the same linkedlist is *not allowed*
         in order to prevent infinite loops.
+        The records of the linkedlist are keyed by its current epoch, so clearing it
+        is done in constant time. The nodes of the previous epochs are deleted
+        progressively during the next writes.
     """
 
     _NAME = '_LINKED_LISTDB'
 
-    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type):
+    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type, nodes_key: str = None):
         self._name = var_key + LinkedListDB._NAME
-        self._head_id = VarDB(f'{self._name}_head_id', db, int)
-        self._tail_id = VarDB(f'{self._name}_tail_id', db, int)
-        self._length = VarDB(f'{self._name}_length', db, int)
+        self._key = self._name
+        # Nodes are stored under the name of the linkedlist unless specified otherwise
+        self._nodes_key = nodes_key or self._key
+        self._epoch = EpochDB(self._key, db)
         self._value_type = value_type
         self._db = db
+        self._bind(self._epoch.suffix())
+
+    def _bind(self, suffix: str) -> None:
+        """ Select the records of the epoch matching a given key suffix """
+        name = self._key + suffix
+        self._head_id = VarDB(f'{name}_head_id', self._db, int)
+        self._tail_id = VarDB(f'{name}_tail_id', self._db, int)
+        self._length = VarDB(f'{name}_length', self._db, int)
+        self._id_factory = IdFactory(name + '_nodedb', self._db)
+        self._nodes_prefix = self._nodes_key + suffix
 
     def delete(self) -> None:
         self.clear()
-        self._head_id.remove()
-        self._tail_id.remove()
-        self._length.remove()
 
     def __len__(self) -> int:
         return self._length.get()
@@ -111,25 +193,47 @@ class LinkedListDB:
 
         # Empty linked list
         if not cur_id:
-            return iter(())
+            return
 
-        node = self._get_node(cur_id)
-        yield (cur_id, node.get_value())
         tail_id = self._tail_id.get()
 
         # Iterate until tail
-        while cur_id != tail_id:
+        while True:
+            node = self._get_node(cur_id)
+            yield (cur_id, node.get_value())
+            if cur_id == tail_id:
+                break
             cur_id = node.get_next()
+
+    def __reversed__(self):
+        cur_id = self._tail_id.get()
+
+        # Empty linked list
+        if not cur_id:
+            return
+
+        head_id = self._head_id.get()
+
+        # Iterate backward until head
+        while True:
             node = self._get_node(cur_id)
             yield (cur_id, node.get_value())
-            tail_id = self._tail_id.get()
+            if cur_id == head_id:
+                break
+            cur_id = node.get_prev()
+
+    def _make_item(self, node_id: int, value):
+        return (node_id, value)
 
     def _node(self, node_id) -> _NodeDB:
-        return _NodeDB(str(node_id) + self._name, self._db, self._value_type)
+        return _NodeDB(str(node_id) + self._nodes_prefix, self._db, self._value_type)
 
     def _create_node(self, value, node_id: int = None) -> tuple:
+        if self._epoch.has_garbage():
+            self.collect_garbage(MAX_GARBAGE_COLLECTION_LOOP)
+
         if node_id is None:
-            node_id = IdFactory(self._name + '_nodedb', self._db).get_uid()
+            node_id = self._id_factory.get_uid()
 
         node = self._node(node_id)
 
@@ -146,17 +250,85 @@ class LinkedListDB:
             raise LinkedNodeNotFound(self._name, node_id)
         return node
 
-    def _get_tail_node(self) -> _NodeDB:
-        tail_id = self._tail_id.get()
-        if not tail_id:
-            raise EmptyLinkedListException(self._name)
-        return self._get_node(tail_id)
+    def _fetch_node(self, nodes: dict, node_id: int) -> _NodeDB:
+        # Nodes touched by a same operation are shared, so each of them is written only once
+        if node_id not in nodes:
+            nodes[node_id] = self._get_node(node_id)
+        return nodes[node_id]
 
-    def _get_head_node(self) -> _NodeDB:
-        head_id = self._head_id.get()
-        if not head_id:
-            raise EmptyLinkedListException(self._name)
-        return self._get_node(head_id)
+    @staticmethod
+    def _save_nodes(nodes: dict) -> None:
+        for node in nodes.values():
+            node.save()
+
+    def _unlink(self, nodes: dict, cur_id: int) -> None:
+        """ Detach an existing node from its neighbours """
+        cur = self._fetch_node(nodes, cur_id)
+        curprev_id = cur.get_prev()
+        curnext_id = cur.get_next()
+
+        # curprev>nid
+        if cur_id == self._head_id.get():
+            # cur was head, set new head
+            self._head_id.set(curnext_id)
+        else:
+            self._fetch_node(nodes, curprev_id).set_next(curnext_id)
+
+        # curnext>pid
+        if cur_id == self._tail_id.get():
+            # cur was tail, set new tail
+            self._tail_id.set(curprev_id)
+        else:
+            self._fetch_node(nodes, curnext_id).set_prev(curprev_id)
+
+        cur.set_prev(0)
+        cur.set_next(0)
+
+    def _link_after(self, nodes: dict, cur_id: int, after_id: int) -> None:
+        """ Attach a detached node after an existing node """
+        cur = self._fetch_node(nodes, cur_id)
+        after = self._fetch_node(nodes, after_id)
+
+        if after_id == self._tail_id.get():
+            afternext_id = 0
+            # cur becomes the new tail
+            self._tail_id.set(cur_id)
+        else:
+            afternext_id = after.get_next()
+            # after>next>pid
+            self._fetch_node(nodes, afternext_id).set_prev(cur_id)
+
+        # after>nid
+        after.set_next(cur_id)
+        # cur>nid
+        cur.set_next(afternext_id)
+        # cur>pid
+        cur.set_prev(after_id)
+
+    def _link_before(self, nodes: dict, cur_id: int, before_id: int) -> None:
+        """ Attach a detached node before an existing node """
+        cur = self._fetch_node(nodes, cur_id)
+        before = self._fetch_node(nodes, before_id)
+
+        if before_id == self._head_id.get():
+            beforeprev_id = 0
+            # cur becomes the new head
+            self._head_id.set(cur_id)
+        else:
+            beforeprev_id = before.get_prev()
+            # before>prev>nid
+            self._fetch_node(nodes, beforeprev_id).set_next(cur_id)
+
+        # before>pid
+        before.set_prev(cur_id)
+        # cur>nid
+        cur.set_next(before_id)
+        # cur>pid
+        cur.set_prev(beforeprev_id)
+
+    def has_node(self, node_id: int) -> bool:
+        """ Returns True if a given node id exists in the linkedlist """
+        return self._node(node_id).exists()
 
     def node_value(self, cur_id: int):
         """ Returns the value of a given node id """
@@ -190,66 +362,93 @@ class LinkedListDB:
 
     def clear(self) -> None:
         """ Delete all nodes from the linkedlist """
-        cur_id = self._head_id.get()
-        if not cur_id:
+        if not self._head_id.get():
             # Empty list
             return
 
-        node = self._get_node(cur_id)
-        tail_id = self._tail_id.get()
+        # The nodes of the current epoch become unreachable
+        self._epoch.next()
+        self._bind(self._epoch.suffix())
 
-        # Iterate until tail
-        while cur_id != tail_id:
-            cur_id = node.get_next()
-            # We're done with this node
-            node.delete()
-            # Iterate to the next node
-            node = self._get_node(cur_id)
+    def has_garbage(self) -> bool:
+        """ Returns True if some records of the previous epochs haven't been deleted yet """
+        return self._epoch.has_garbage()
 
-        # Delete the last node
-        node.delete()
+    def collect_garbage(self, max_count: int = MAX_ITERATION_LOOP) -> int:
+        """ Delete a limited amount of nodes left by the previous epochs of the linkedlist.
+            Returns the amount of records deleted """
+        count = 0
 
-        self._tail_id.remove()
-        self._head_id.remove()
-        self._length.set(0)
+        try:
+            while count < max_count and self._epoch.has_garbage():
+                self._bind(self._epoch.suffix(self._epoch.garbage()))
+                cur_id = self._head_id.get()
+                tail_id = self._tail_id.get()
+
+                # Delete the nodes from the head of the stale linkedlist
+                while cur_id and count < max_count:
+                    node = self._get_node(cur_id)
+                    next_id = node.get_next() if cur_id != tail_id else 0
+                    node.delete()
+                    count += 1
+                    cur_id = next_id
+
+                if cur_id:
+                    # Resume from there next time
+                    self._head_id.set(cur_id)
+                else:
+                    self._head_id.remove()
+                    self._tail_id.remove()
+                    self._length.remove()
+                    self._id_factory.delete()
+                    self._epoch.collected()
+                    count += 1
+        finally:
+            self._bind(self._epoch.suffix())
+
+        return count
+
+    def forget_epochs(self) -> None:
+        """ Remove the epoch record of a cleared linkedlist, once its previous epochs have been collected """
+        if not self._epoch.has_garbage() and not self._length.get():
+            self._epoch.remove()
+            self._bind(self._epoch.suffix())
 
     def append(self, value, node_id: int = None) -> int:
         """ Append an element at the end of the linkedlist """
         cur_id, cur = self._create_node(value, node_id)
+        nodes = {cur_id: cur}
+        length = self._length.get()
 
-        if self._length.get() == 0:
+        if length == 0:
             # Empty LinkedList
             self._head_id.set(cur_id)
             self._tail_id.set(cur_id)
         else:
             # Append to tail
-            tail = self._get_tail_node()
-            tail.set_next(cur_id)
-            cur.set_prev(self._tail_id.get())
-            # Update tail to cur node
-            self._tail_id.set(cur_id)
+            self._link_after(nodes, cur_id, self._tail_id.get())
 
-        self._length.set(self._length.get() + 1)
+        self._save_nodes(nodes)
+        self._length.set(length + 1)
 
         return cur_id
 
     def prepend(self, value, node_id: int = None) -> int:
         """ Prepend an element at the beginning of the linkedlist """
         cur_id, cur = self._create_node(value, node_id)
+        nodes = {cur_id: cur}
+        length = self._length.get()
 
-        if self._length.get() == 0:
+        if length == 0:
             # Empty LinkedList
             self._head_id.set(cur_id)
             self._tail_id.set(cur_id)
         else:
             # Prepend to head
-            head = self._get_head_node()
-            head.set_prev(cur_id)
-            cur.set_next(self._head_id.get())
-            # Update head to cur node
-            self._head_id.set(cur_id)
+            self._link_before(nodes, cur_id, self._head_id.get())
 
-        self._length.set(self._length.get() + 1)
+        self._save_nodes(nodes)
+        self._length.set(length + 1)
 
         return cur_id
 
@@ -260,19 +459,11 @@ class LinkedListDB:
 
         after = self._get_node(after_id)
         cur_id, cur = self._create_node(value, node_id)
+        nodes = {cur_id: cur, after_id: after}
 
-        afternext_id = after.get_next()
-        afternext = self._get_node(afternext_id)
-
-        # after>nid
-        after.set_next(cur_id)
-        # after>next>pid
-        afternext.set_prev(cur_id)
-        # cur>nid
-        cur.set_next(afternext_id)
-        # cur>pid
-        cur.set_prev(after_id)
+        self._link_after(nodes, cur_id, after_id)
 
+        self._save_nodes(nodes)
         self._length.set(self._length.get() + 1)
         return cur_id
 
@@ -283,19 +474,11 @@ class LinkedListDB:
 
         before = self._get_node(before_id)
         cur_id, cur = self._create_node(value, node_id)
+        nodes = {cur_id: cur, before_id: before}
 
-        beforeprev_id = before.get_prev()
-        beforeprev = self._get_node(beforeprev_id)
-
-        # before>pid
-        before.set_prev(cur_id)
-        # before>prev>nid
-        beforeprev.set_next(cur_id)
-        # cur>nid
-        cur.set_next(before_id)
-        # cur>pid
-        cur.set_prev(beforeprev_id)
+        self._link_before(nodes, cur_id, before_id)
 
+        self._save_nodes(nodes)
         self._length.set(self._length.get() + 1)
         return cur_id
 
@@ -304,185 +487,86 @@ class LinkedListDB:
         if cur_id == after_id:
             raise LinkedNodeCannotMoveItself(self._name, cur_id)
 
-        if after_id == self._tail_id.get():
-            return self.move_node_tail(cur_id)
-
         cur = self._get_node(cur_id)
 
-        if after_id == cur.get_prev():
+        if after_id == cur.get_prev() and cur_id != self._head_id.get():
             # noop
             return
 
-        after = self._get_node(after_id)
-        afternext_id = after.get_next()
-        afternext = self._get_node(afternext_id)
-        curprev_id = cur.get_prev()
-        if curprev_id:  # cur may be the head
-            curprev = self._get_node(curprev_id)
-        curnext_id = cur.get_next()
-        if curnext_id:  # cur may be the tail
-            curnext = self._get_node(curnext_id)
-
-        # after>nid
-        after.set_next(cur_id)
-        # after>next>pid
-        afternext.set_prev(cur_id)
-        # curprev>nid
-        if curprev_id:
-            curprev.set_next(curnext_id)
-        else:
-            # cur was head, set new head
-            self._head_id.set(curnext_id)
-        # curnext>pid
-        if curnext_id:
-            curnext.set_prev(curprev_id)
-        else:
-            # cur was tail, set new tail
-            self._tail_id.set(curprev_id)
-        # cur>nid
-        cur.set_next(afternext_id)
-        # cur>pid
-        cur.set_prev(after_id)
+        nodes = {cur_id: cur}
+        self._unlink(nodes, cur_id)
+        self._link_after(nodes, cur_id, after_id)
+        self._save_nodes(nodes)
 
     def move_node_before(self, cur_id: int, before_id: int) -> None:
         """ Move an existing node before another existing node """
         if cur_id == before_id:
             raise LinkedNodeCannotMoveItself(self._name, cur_id)
 
-        if before_id == self._head_id.get():
-            return self.move_node_head(cur_id)
-
         cur = self._get_node(cur_id)
 
-        if before_id == cur.get_next():
+        if before_id == cur.get_next() and cur_id != self._tail_id.get():
             # noop
             return
 
-        before = self._get_node(before_id)
-        beforeprev_id = before.get_prev()
-        beforeprev = self._get_node(beforeprev_id)
-        curprev_id = cur.get_prev()
-        if curprev_id:  # cur may be the head
-            curprev = self._get_node(curprev_id)
-        curnext_id = cur.get_next()
-        if curnext_id:  # cur may be the tail
-            curnext = self._get_node(curnext_id)
-
-        # before>pid
-        before.set_prev(cur_id)
-        # before>prev>nid
-        beforeprev.set_next(cur_id)
-        # curprev>nid
-        if curprev_id:
-            curprev.set_next(curnext_id)
-        else:
-            # cur was head, set new head
-            self._head_id.set(curnext_id)
-        # curnext>pid
-        if curnext_id:
-            curnext.set_prev(curprev_id)
-        else:
-            # cur was tail, set new tail
-            self._tail_id.set(curprev_id)
-        # cur>nid
-        cur.set_next(before_id)
-        # cur>pid
-        cur.set_prev(beforeprev_id)
+        nodes = {cur_id: cur}
+        self._unlink(nodes, cur_id)
+        self._link_before(nodes, cur_id, before_id)
+        self._save_nodes(nodes)
 
     def move_node_tail(self, cur_id: int) -> None:
         """ Move an existing node at the tail of the linkedlist """
         if cur_id == self._tail_id.get():
             raise LinkedNodeCannotMoveItself(self._name, cur_id)
 
-        cur = self._get_node(cur_id)
-        tail_id = self._tail_id.get()
-        tail = self._get_node(tail_id)
-        curprev_id = cur.get_prev()
-        curprev = self._get_node(curprev_id)
-        curnext_id = cur.get_next()
-        curnext = self._get_node(curnext_id)
-
-        # curprev>nid
-        curprev.set_next(curnext_id)
-        # curnext>pid
-        curnext.set_prev(curprev_id)
-        # tail>nid
-        tail.set_next(cur_id)
-        # cur>pid
-        cur.set_prev(tail_id)
-        # update tail
-        self._tail_id.set(cur_id)
+        nodes = {}
+        self._unlink(nodes, cur_id)
+        self._link_after(nodes, cur_id, self._tail_id.get())
+        self._save_nodes(nodes)
 
     def move_node_head(self, cur_id: int) -> None:
         """ Move an existing node at the head of the linkedlist """
         if cur_id == self._head_id.get():
             raise LinkedNodeCannotMoveItself(self._name, cur_id)
 
-        cur = self._get_node(cur_id)
-        head_id = self._head_id.get()
-        head = self._get_node(head_id)
-        curprev_id = cur.get_prev()
-        curprev = self._get_node(curprev_id)
-        curnext_id = cur.get_next()
-        curnext = self._get_node(curnext_id)
-
-        # curprev>nid
-        curprev.set_next(curnext_id)
-        # curnext>pid
-        curnext.set_prev(curprev_id)
-        # head>pid
-        head.set_prev(cur_id)
-        # cur>nid
-        cur.set_next(head_id)
-        # update head
-        self._head_id.set(cur_id)
+        nodes = {}
+        self._unlink(nodes, cur_id)
+        self._link_before(nodes, cur_id, self._head_id.get())
+        self._save_nodes(nodes)
 
     def remove_head(self) -> None:
         """ Remove the current head from the linkedlist """
-        if self._length.get() == 1:
-            self.clear()
-        else:
-            old_head = self._get_node(self._head_id.get())
-            new_head = old_head.get_next()
-            self._head_id.set(new_head)
-            self._get_node(new_head).set_prev(0)
-            old_head.delete()
-            self._length.set(self._length.get() - 1)
+        self.remove(self._head_id.get())
 
     def remove_tail(self) -> None:
         """ Remove the current tail from the linkedlist """
-        if self._length.get() == 1:
-            self.clear()
-        else:
-            old_tail = self._get_node(self._tail_id.get())
-            new_tail = old_tail.get_prev()
-            self._tail_id.set(new_tail)
-            self._get_node(new_tail).set_next(0)
-            old_tail.delete()
-            self._length.set(self._length.get() - 1)
+        self.remove(self._tail_id.get())
 
     def remove(self, cur_id: int) -> None:
         """ Remove a given node from the linkedlist """
-        if cur_id == self._head_id.get():
-            self.remove_head()
+        length = self._length.get()
+        if length == 0:
+            raise EmptyLinkedListException(self._name)
 
-        elif cur_id == self._tail_id.get():
-            self.remove_tail()
+        if length == 1:
+            # Make sure the node belongs to the linkedlist before deleting it
+            self._get_node(cur_id).delete()
+            self._head_id.remove()
+            self._tail_id.remove()
+            self._length.set(0)
+            return
 
-        else:
-            cur = self._get_node(cur_id)
-            curnext_id = cur.get_next()
-            curnext = self._get_node(curnext_id)
-            curprev_id = cur.get_prev()
-            curprev = self._get_node(curprev_id)
-            curnext.set_prev(curprev_id)
-            curprev.set_next(curnext_id)
-            cur.delete()
-            self._length.set(self._length.get() - 1)
-
-    def select(self, offset: int, cond=None, **kwargs) -> list:
-        """ Returns a limited amount of items in the LinkedListDB that optionally fulfills a condition """
-        items = iter(self)
+        nodes = {}
+        self._unlink(nodes, cur_id)
+        cur = nodes.pop(cur_id)
+        self._save_nodes(nodes)
+        cur.delete()
+        self._length.set(length - 1)
+
+    def select(self, offset: int, cond=None, reverse: bool = False, **kwargs) -> list:
+        """ Returns a limited amount of items in the LinkedListDB that optionally fulfills a condition.
+            If reverse is True, the items are iterated from the tail to the head """
+        items = reversed(self) if reverse else iter(self)
         result = []
 
         # Skip N items until offset
@@ -508,6 +592,40 @@ class LinkedListDB:
 
         return result
 
+    def select_page(self, cursor: int = 0, cond=None, reverse: bool = False, **kwargs) -> tuple:
+        """ Returns a limited amount of items in the LinkedListDB that optionally fulfills a condition,
+            starting from a given node id (or from the head if the cursor is 0).
+            If reverse is True, the items are iterated from the cursor (or from the tail) to the head.
+            Returns the items, the node id of the next page (0 if none) and whether there are more items """
+        if reverse:
+            cur_id = cursor or self._tail_id.get()
+            last_id = self._head_id.get()
+        else:
+            cur_id = cursor or self._head_id.get()
+            last_id = self._tail_id.get()
+        result = []
+
+        # Do a maximum iteration count of MAX_ITERATION_LOOP
+        for _ in range(MAX_ITERATION_LOOP):
+            if not cur_id:
+                # End of list : stop here
+                break
+
+            node = self._get_node(cur_id)
+            item = self._make_item(cur_id, node.get_value())
+            if cond:
+                if cond(self._db, item, **kwargs):
+                    result.append(item)
+            else:
+                result.append(item)
+
+            if cur_id == last_id:
+                cur_id = 0
+            else:
+                cur_id = node.get_prev() if reverse else node.get_next()
+
+        return result, cur_id, cur_id != 0
+
 
 class UIDLinkedListDB(LinkedListDB):
     """
@@ -521,7 +639,7 @@ class UIDLinkedListDB(LinkedListDB):
 
     def __init__(self, address: Address, db: IconScoreDatabase):
         name = f'{str(address)}_{UIDLinkedListDB._NAME}'
-        super().__init__(name, db, int)
+        super().__init__(name, db, int, nodes_key=name)
         self._name = name
 
     def append(self, uid: int, _: int = None) -> None:
@@ -539,3 +657,10 @@ class UIDLinkedListDB(LinkedListDB):
     def __iter__(self):
         for node_id, uid in super().__iter__():
             yield uid
+
+    def __reversed__(self):
+        for node_id, uid in super().__reversed__():
+            yield uid
+
+    def _make_item(self, node_id: int, uid: int) -> int:
+        return uid
@@ -17,6 +17,7 @@
 from iconservice import *
 from .exception import *
 from .auth import *
+from .cache import *
 from .utils import *
 from .state import *
 
@@ -25,6 +26,7 @@ class ScoreInMaintenanceException(Exception):
     pass
 
 
+@state_enum
 class IconScoreMaintenanceStatus:
     UNINITIALIZED = 0
     DISABLED = 1
@@ -63,19 +65,21 @@ class IconScoreMaintenance:
     @catch_exception
     @external
     @only_owner
+    @defer_writes
     def maintenance_enable(self) -> None:
         self._status.set(IconScoreMaintenanceStatus.ENABLED)
 
     @catch_exception
     @external
     @only_owner
+    @defer_writes
     def maintenance_disable(self) -> None:
         self._status.set(IconScoreMaintenanceStatus.DISABLED)
 
     @catch_exception
     @external(readonly=True)
     def maintenance_status(self) -> str:
-        return Utils.get_enum_name(IconScoreMaintenanceStatus, self._status.get())
+        return self._status.get_name()
 
 
 # --- Wrapper ---
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+
+class InvalidPackedIntValue(Exception):
+    pass
+
+
+class PackedIntArrayDB:
+    """ PackedIntArrayDB is an array of fixed width signed integers,
+        stored in chunks of `chunk_size` items.
+        Reading, writing, appending or popping an item reads and writes a single chunk,
+        and iterating n items reads n / chunk_size records.
+    """
+
+    _NAME = '_PACKED_INT_ARRAYDB'
+
+    def __init__(self, var_key: str, db: IconScoreDatabase, width: int = 8, chunk_size: int = 32):
+        self._name = var_key + PackedIntArrayDB._NAME
+        self._size = VarDB(f'{self._name}_size', db, value_type=int)
+        self._width = width
+        self._chunk_size = chunk_size
+        self._db = db
+
+    # ================================================
+    #  Chunks
+    # ================================================
+    def _chunk(self, chunk_index: int) -> VarDB:
+        return VarDB(f'{self._name}_{chunk_index}', self._db, value_type=bytes)
+
+    def _read_chunk(self, chunk_index: int) -> bytes:
+        return self._chunk(chunk_index).get() or b''
+
+    def _write_chunk(self, chunk_index: int, data: bytes) -> None:
+        if data:
+            self._chunk(chunk_index).set(data)
+        else:
+            self._chunk(chunk_index).remove()
+
+    def _encode(self, value: int) -> bytes:
+        if not isinstance(value, int):
+            raise InvalidPackedIntValue(self._name, value)
+        try:
+            return int(value).to_bytes(self._width, 'big', signed=True)
+        except OverflowError:
+            raise InvalidPackedIntValue(self._name, value)
+
+    def _decode(self, data: bytes, offset: int) -> int:
+        return int.from_bytes(data[offset:offset + self._width], 'big', signed=True)
+
+    def _locate(self, index: int) -> tuple:
+        """ Returns the chunk index and the offset in the chunk of a given item index """
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(self._name, index)
+        return index // self._chunk_size, (index % self._chunk_size) * self._width
+
+    # ================================================
+    #  ArrayDB interface
+    # ================================================
+    def __len__(self) -> int:
+        return self._size.get()
+
+    def __iter__(self):
+        size = len(self)
+        for chunk_index in range((size + self._chunk_size - 1) // self._chunk_size):
+            data = self._read_chunk(chunk_index)
+            for offset in range(0, len(data), self._width):
+                yield self._decode(data, offset)
+
+    def __getitem__(self, index: int) -> int:
+        chunk_index, offset = self._locate(index)
+        return self._decode(self._read_chunk(chunk_index), offset)
+
+    def __setitem__(self, index: int, value: int) -> None:
+        chunk_index, offset = self._locate(index)
+        data = self._read_chunk(chunk_index)
+        self._write_chunk(chunk_index, data[:offset] + self._encode(value) + data[offset + self._width:])
+
+    def __contains__(self, value: int) -> bool:
+        for item in self:
+            if item == value:
+                return True
+        return False
+
+    def get(self, index: int = 0) -> int:
+        return self[index]
+
+    def put(self, value: int) -> None:
+        """ Append an item at the end of the array """
+        encoded = self._encode(value)
+        size = len(self)
+        chunk_index = size // self._chunk_size
+        data = self._read_chunk(chunk_index) if size % self._chunk_size else b''
+        self._write_chunk(chunk_index, data + encoded)
+        self._size.set(size + 1)
+
+    def pop(self) -> int:
+        """ Remove the last item of the array and return it """
+        size = len(self)
+        if size == 0:
+            return None
+        chunk_index, offset = self._locate(size - 1)
+        data = self._read_chunk(chunk_index)
+        self._write_chunk(chunk_index, data[:offset])
+        if size > 1:
+            self._size.set(size - 1)
+        else:
+            self._size.remove()
+        return self._decode(data, offset)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from .cache import *
+from .codec import *
+
+
+class RecordFieldNotFound(Exception):
+    pass
+
+
+class RecordFieldDB:
+    """ RecordFieldDB gives a VarDB-like access to a single field of a RecordDB """
+
+    def __init__(self, record: 'RecordDB', name: str):
+        self._record = record
+        self._name = name
+
+    def get(self):
+        return self._record.get(self._name)
+
+    def set(self, value) -> None:
+        self._record.update({self._name: value})
+
+    def remove(self) -> None:
+        self._record.update({self._name: None})
+
+
+class RecordDB:
+    """ RecordDB stores all the fields of an entity in a single versioned record,
+        so the entity is built and read with one DB access.
+        The schema is fixed : fields are declared in order, and new fields may only be appended.
+        Fields unknown to the current schema (i.e. declared by a subclass) are kept as is.
+        Reads are memoized, writes always apply on the latest record.
+        While a DatabaseCache is opened, the record is read again from the cache on each access,
+        so every instance of the entity sees the writes of the others.
+        Entities created before the record layout are read from their legacy storage
+        with `legacy_loader`, and migrated on their next write.
+        If a compact `key` is given, the record is stored under it instead of the name of the RecordDB.
+    """
+
+    _NAME = '_RECORDDB'
+
+    def __init__(self, var_key: str, db: IconScoreDatabase, fields: list, version: int = 1,
+                 legacy_loader=None, legacy_remover=None, key: bytes = None):
+        self._name = var_key + RecordDB._NAME
+        self._record = VarDB(key or self._name, db, value_type=bytes)
+        self._names = [name for name, _ in fields]
+        self._types = [value_type for _, value_type in fields]
+        self._version = version
+        self._legacy_loader = legacy_loader
+        self._legacy_remover = legacy_remover
+        self._db = db
+        self._data = None
+        self._values = None
+        self._unknown = []
+        self._legacy = False
+
+    def _index(self, name: str) -> int:
+        if name not in self._names:
+            raise RecordFieldNotFound(self._name, name)
+        return self._names.index(name)
+
+    def _load(self, record: bytes) -> None:
+        self._data = record
+        self._legacy = False
+
+        if record is not None:
+            # The first field is the version of the record
+            payloads = Codec.split(record)[1:]
+            # Missing trailing fields are decoded as default values
+            self._values = [
+                Codec.decode_value(payloads[index] if index < len(payloads) else b'', value_type)
+                for index, value_type in enumerate(self._types)
+            ]
+            self._unknown = payloads[len(self._types):]
+            return
+
+        self._values = [Codec.decode_value(b'', value_type) for value_type in self._types]
+
+        legacy = self._legacy_loader() if self._legacy_loader else None
+        if legacy is not None:
+            self._legacy = True
+            for name, value in legacy.items():
+                self._values[self._index(name)] = value
+
+    def _save(self) -> None:
+        self._data = Codec.pack([self._version] + self._values + self._unknown)
+        self._record.set(self._data)
+
+        if self._legacy:
+            if self._legacy_remover:
+                self._legacy_remover()
+            self._legacy = False
+
+    def create(self, values: dict) -> None:
+        """ Write the record of a new entity, without looking up its previous storage """
+        self._values = [Codec.decode_value(b'', value_type) for value_type in self._types]
+        self._unknown = []
+        self._legacy = False
+        for name, value in values.items():
+            self._values[self._index(name)] = value
+        self._save()
+
+    def field(self, name: str) -> RecordFieldDB:
+        self._index(name)
+        return RecordFieldDB(self, name)
+
+    def _refresh(self) -> None:
+        record = self._record.get()
+        if self._values is None or record is not self._data:
+            self._load(record)
+
+    def get(self, name: str):
+        # During a call, other instances of the entity may have written the record
+        if self._values is None or isinstance(self._db, CachedDatabase):
+            self._refresh()
+        return self._values[self._index(name)]
+
+    def update(self, values: dict) -> None:
+        """ Write several fields at once """
+        # Make sure the fields written by other instances are preserved
+        self._refresh()
+        for name, value in values.items():
+            self._values[self._index(name)] = value
+        self._save()
+
+    def remove(self) -> None:
+        """ Delete the record, along with its legacy storage """
+        self._refresh()
+        if self._legacy and self._legacy_remover:
+            self._legacy_remover()
+        self._record.remove()
+        self._values = None
@@ -16,12 +16,15 @@
 
 from iconservice import *
 from .bag import *
+from .consts import *
 
 
 class SetDB(BagDB):
     """
     SetDB is an iterable collection of *unique* items.
     Order of retrieval is *optionally* significant (*not* significant by default)
+    The position of each item is indexed, so membership checks, insertions
+    and removals are done in constant time.
     """
 
     _NAME = '_SETDB'
@@ -32,31 +35,105 @@ class SetDB(BagDB):
         self._name = name
         self._db = db
 
+    def _bind(self, suffix: str) -> None:
+        super()._bind(suffix)
+        name = self._key + suffix
+        # Position of each item in the array, shifted by one so 0 means "not in the set"
+        self._positions = DictDB(f'{name}_positions', self._db, value_type=int)
+        self._indexed = VarDB(f'{name}_indexed', self._db, value_type=bool)
+
+    def _is_indexed(self) -> bool:
+        return self._indexed.get()
+
+    def _migrate(self) -> None:
+        """ Sets created before the position index are indexed in place on their first write """
+        if self._is_indexed():
+            return
+
+        for index, item in enumerate(self._items):
+            self._positions[item] = index + 1
+
+        self._indexed.set(True)
+
+    def _position(self, item) -> int:
+        """ Returns the index of an item in the array, or -1 if it doesn't exist """
+        if self._is_indexed():
+            return self._positions[item] - 1
+
+        # Sets not migrated yet (readonly context)
+        for index, cur in enumerate(self._items):
+            if cur == item:
+                return index
+        return -1
+
+    def _on_move(self, item, index: int) -> None:
+        self._positions[item] = index + 1
+
+    def _on_collect(self, item) -> None:
+        self._positions.remove(item)
+
+    def _remove_metadata(self) -> None:
+        super()._remove_metadata()
+        self._indexed.remove()
+
+    def __contains__(self, item) -> bool:
+        return self._position(item) != -1
+
+    def __setitem__(self, index: int, value):
+        if not self._order:
+            raise BagDBIsNotOrdered(self._name)
+        self._migrate()
+        index = self._array_index(index)
+        self._positions.remove(self._items[index])
+        self._items[index] = value
+        self._positions[value] = index + 1
+
+    def count(self, item) -> int:
+        """ Returns the number of occurences of a given item in the set """
+        return 1 if item in self else 0
+
     def add(self, item) -> None:
         """ Adds an element to the set 
             If it already exists, it *does not raise* any exception
         """
-        if item not in self._items:
-            super().add(item)
+        if self._epoch.has_garbage():
+            self.collect_garbage(MAX_GARBAGE_COLLECTION_LOOP)
+        self._migrate()
+        if self._positions[item] == 0:
+            self._positions[item] = len(self._items) + 1
+            self._items.put(item)
 
     def remove(self, item) -> None:
         """ This operation removes element x from the set.
             If element x does not exist, it raises a ItemNotFound.
         """
-        if item not in self._items:
+        self._migrate()
+        index = self._positions[item] - 1
+        if index == -1:
             raise ItemNotFound(self._name, str(item))
-        super().remove(item)
+        self._positions.remove(item)
+        self._remove_at(index)
 
     def discard(self, item) -> None:
         """ This operation also removes element x from the set.
             If element x does not exist, it *does not raise* a ItemNotFound.
         """
-        if item in self._items:
-            super().remove(item)
+        self._migrate()
+        index = self._positions[item] - 1
+        if index != -1:
+            self._positions.remove(item)
+            self._remove_at(index)
 
     def pop(self):
         """ Removes an element from the set and returns it """
-        return self._items.pop()
+        self._migrate()
+        index = len(self._items) - 1
+        if index == -1:
+            return None
+        item = self._items[index]
+        self._positions.remove(item)
+        self._remove_at(index)
+        return item
 
     def difference(self, other: set):
         """ Returns a set containing the difference between two or more sets """
@@ -30,6 +30,17 @@ class InvalidStateClass(Exception):
     pass
 
 
+def state_enum(cls):
+    """ Class decorator computing the names of the states once.
+        The states must be declared in order, starting with UNINITIALIZED = 0 """
+    names = tuple(Utils.enum_names(cls))
+    if not names or names[0] != "UNINITIALIZED" or Utils.enum_values(cls) != list(range(len(names))):
+        raise InvalidStateClass(f"{cls} needs an UNINITIALIZED state equals to 0 in its declaration, followed by consecutive states")
+
+    cls._STATE_NAMES = names
+    return cls
+
+
 class StateDB:
 
     _NAME = '_STATEDB'
@@ -37,15 +48,17 @@ class StateDB:
     # ================================================
     #  Initialization
     # ================================================
-    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type):
+    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type, field=None):
         self._name = var_key + StateDB._NAME
-        self._state = VarDB(f"{self._name}_state", db, value_type=int)
+        # The state may be stored in a field of another container (i.e. a RecordDB)
+        self._state = field or VarDB(f"{self._name}_state", db, value_type=int)
         self._cls = value_type
         self._db = db
 
-        # Check if the class is conform
-        if Utils.enum_names(value_type)[0] != "UNINITIALIZED":
-            raise InvalidStateClass(f"{value_type} needs an UNINITIALIZED state equals to 0 in its declaration")
+        # Classes not declared with @state_enum are checked once
+        if '_STATE_NAMES' not in value_type.__dict__:
+            state_enum(value_type)
+        self._names = value_type._STATE_NAMES
 
     # ================================================
     #  External methods
@@ -57,7 +70,7 @@ class StateDB:
         return self._state.get()
 
     def get_name(self) -> str:
-        return Utils.enum_names(self._cls)[self._state.get()]
+        return self._names[self._state.get()]
 
     # ================================================
     #  Checks
@@ -70,12 +83,12 @@ class StateDB:
         if self._state.get() != state:
             raise InvalidState(
                 self._name,
-                Utils.enum_names(self._cls)[self._state.get()],
-                Utils.enum_names(self._cls)[state])
+                self._names[self._state.get()],
+                self._names[state])
 
     def check_not(self, state: int) -> None:
         if self._state.get() == state:
             raise InvalidState(
                 self._name,
-                Utils.enum_names(self._cls)[self._state.get()],
-                Utils.enum_names(self._cls)[state])
+                self._names[self._state.get()],
+                self._names[state])
@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from .consts import *
+from .codec import *
+from .linked_list import *
+
+
+class _ChunkDB:
+    """ ChunkDB is a node of the UnrolledUIDListDB.
+        It packs up to `capacity` uids, along with the ids of the previous and the next chunks,
+        in a single record.
+        Modifications are kept in memory until `save` is called.
+        Its structure is internal and shouldn't be manipulated outside of this module
+    """
+
+    def __init__(self, name: str, chunk_id: int, db: IconScoreDatabase):
+        self._record = VarDB(f'{name}_chunk_{chunk_id}', db, bytes)
+        self.chunk_id = chunk_id
+        self.prev = 0
+        self.next = 0
+        self.uids = []
+
+    def load(self) -> '_ChunkDB':
+        record = self._record.get()
+        if record is None:
+            return None
+        self.prev, self.next, *self.uids = [Codec.decode_value(payload, int) for payload in Codec.split(record)]
+        return self
+
+    def save(self) -> None:
+        self._record.set(Codec.pack([self.prev, self.next] + self.uids))
+
+    def delete(self) -> None:
+        self._record.remove()
+
+
+class UnrolledUIDListDB:
+    """ UnrolledUIDListDB is a linked list of unique IDs, where each node packs up to `capacity` uids.
+        Iterating n uids reads about n / capacity records, and appending or prepending an uid
+        writes the chunk at the end of the list and the metadata of the list.
+        The chunk of each uid is indexed, so an uid is removed without iterating the list.
+        Chunks that become too small after a removal are merged with one of their neighbours.
+        Uids are only inserted at the ends of the list, in a new chunk once the end one is full,
+        so a chunk never needs to be split.
+        Pages are still addressed by uid, like with a UIDLinkedListDB.
+
+        If `legacy_key` is specified, the items of the UIDLinkedListDB previously stored under
+        this key are still iterated, before the new items if `legacy_first` is True,
+        after them otherwise. They are moved progressively to the chunks during the next writes.
+    """
+
+    _NAME = '_UNROLLED_UID_LISTDB'
+    _DEFAULT_CAPACITY = 32
+
+    def __init__(self, var_key: str, db: IconScoreDatabase, capacity: int = _DEFAULT_CAPACITY,
+                 legacy_key: str = None, legacy_first: bool = True):
+        self._name = var_key + UnrolledUIDListDB._NAME
+        # Packed (head chunk id, tail chunk id, length, last chunk id, legacy migrated)
+        self._meta = VarDB(f'{self._name}_meta', db, bytes)
+        self._index = DictDB(f'{self._name}_index', db, value_type=int)
+        self._capacity = capacity
+        self._legacy_key = legacy_key
+        self._legacy_first = legacy_first
+        self._db = db
+        self._head = self._tail = self._length = self._last_id = 0
+        self._migrated = legacy_key is None
+        self._load_meta()
+
+    # ================================================
+    #  Storage
+    # ================================================
+    def _load_meta(self) -> None:
+        meta = self._meta.get()
+        if meta is not None:
+            self._head, self._tail, self._length, self._last_id, migrated = Codec.unpack(meta, [int] * 4 + [bool])
+            self._migrated = self._migrated or migrated
+
+    def _save_meta(self) -> None:
+        self._meta.set(Codec.pack([self._head, self._tail, self._length, self._last_id, self._migrated]))
+
+    def _chunk(self, chunk_id: int) -> _ChunkDB:
+        chunk = _ChunkDB(self._name, chunk_id, self._db).load()
+        if chunk is None:
+            raise LinkedNodeNotFound(self._name, chunk_id)
+        return chunk
+
+    def _fetch_chunk(self, chunks: dict, chunk_id: int) -> _ChunkDB:
+        # Chunks touched by a same operation are shared, so each of them is written only once
+        if chunk_id not in chunks:
+            chunks[chunk_id] = self._chunk(chunk_id)
+        return chunks[chunk_id]
+
+    @staticmethod
+    def _save_chunks(chunks: dict) -> None:
+        for chunk in chunks.values():
+            if chunk.uids:
+                chunk.save()
+            else:
+                chunk.delete()
+
+    def _legacy(self) -> UIDLinkedListDB:
+        if self._migrated:
+            return None
+        return UIDLinkedListDB(self._legacy_key, self._db)
+
+    # ================================================
+    #  Chunks
+    # ================================================
+    def _new_chunk(self, chunks: dict, at_head: bool) -> _ChunkDB:
+        self._last_id += 1
+        chunk = _ChunkDB(self._name, self._last_id, self._db)
+        chunks[chunk.chunk_id] = chunk
+
+        if not self._head:
+            self._head = self._tail = chunk.chunk_id
+        elif at_head:
+            self._fetch_chunk(chunks, self._head).prev = chunk.chunk_id
+            chunk.next = self._head
+            self._head = chunk.chunk_id
+        else:
+            self._fetch_chunk(chunks, self._tail).next = chunk.chunk_id
+            chunk.prev = self._tail
+            self._tail = chunk.chunk_id
+
+        return chunk
+
+    def _unlink_chunk(self, chunks: dict, chunk: _ChunkDB) -> None:
+        if chunk.chunk_id == self._head:
+            self._head = chunk.next
+        else:
+            self._fetch_chunk(chunks, chunk.prev).next = chunk.next
+
+        if chunk.chunk_id == self._tail:
+            self._tail = chunk.prev
+        else:
+            self._fetch_chunk(chunks, chunk.next).prev = chunk.prev
+
+        chunk.uids = []
+
+    def _merge_chunks(self, chunks: dict, first: _ChunkDB, second: _ChunkDB) -> None:
+        """ Move the uids of a chunk at the end of the previous one """
+        for uid in second.uids:
+            self._index[uid] = first.chunk_id
+        first.uids += second.uids
+        self._unlink_chunk(chunks, second)
+
+    def _push(self, uids: list, at_head: bool) -> None:
+        """ Insert uids at one end of the list, in the given order """
+        chunks = {}
+
+        for uid in (reversed(uids) if at_head else uids):
+            if self._index[uid]:
+                raise LinkedNodeAlreadyExists(self._name, uid)
+
+            end_id = self._head if at_head else self._tail
+            chunk = self._fetch_chunk(chunks, end_id) if end_id else None
+            if chunk is None or len(chunk.uids) >= self._capacity:
+                chunk = self._new_chunk(chunks, at_head)
+
+            if at_head:
+                chunk.uids.insert(0, uid)
+            else:
+                chunk.uids.append(uid)
+
+            self._index[uid] = chunk.chunk_id
+            self._length += 1
+
+        self._save_chunks(chunks)
+        self._save_meta()
+
+    def _migrate_legacy(self, max_count: int = MAX_GARBAGE_COLLECTION_LOOP) -> None:
+        """ Move a limited amount of uids from the legacy linked list to the chunks """
+        legacy = self._legacy()
+        if legacy is None:
+            return
+
+        uids = []
+        while len(uids) < max_count and len(legacy) > 0:
+            if self._legacy_first:
+                # The legacy items are before the chunks : move its tail at the head of the chunks
+                uids.insert(0, legacy.tail_value())
+                legacy.remove_tail()
+            else:
+                uids.append(legacy.head_value())
+                legacy.remove_head()
+
+        self._migrated = len(legacy) == 0
+        if uids:
+            self._push(uids, at_head=self._legacy_first)
+        elif self._migrated:
+            self._save_meta()
+
+    # ================================================
+    #  Iteration
+    # ================================================
+    def _iter_chunks(self, reverse: bool, start_uid: int = 0):
+        if start_uid:
+            chunk = self._chunk(self._index[start_uid])
+            position = chunk.uids.index(start_uid)
+        else:
+            chunk_id = self._tail if reverse else self._head
+            chunk = self._chunk(chunk_id) if chunk_id else None
+            position = len(chunk.uids) - 1 if chunk and reverse else 0
+
+        while chunk:
+            yield from (reversed(chunk.uids[:position + 1]) if reverse else chunk.uids[position:])
+            chunk_id = chunk.prev if reverse else chunk.next
+            chunk = self._chunk(chunk_id) if chunk_id else None
+            position = len(chunk.uids) - 1 if chunk and reverse else 0
+
+    def _iter_legacy(self, reverse: bool, start_uid: int = 0):
+        legacy = self._legacy()
+        if legacy is None or len(legacy) == 0:
+            return
+
+        cur_id = start_uid or (legacy.tail_value() if reverse else legacy.head_value())
+        while cur_id:
+            yield cur_id
+            try:
+                cur_id = legacy.prev(cur_id) if reverse else legacy.next(cur_id)
+            except StopIteration:
+                break
+
+    def _iter_from(self, reverse: bool, start_uid: int = 0):
+        """ Iterate the uids of the list, optionally starting from a given uid """
+        parts = [self._iter_legacy, self._iter_chunks]
+        if self._legacy_first == reverse:
+            parts.reverse()
+
+        if start_uid:
+            if self._index[start_uid]:
+                start = parts.index(self._iter_chunks)
+            elif self._legacy() is not None and self._legacy().has_node(start_uid):
+                start = parts.index(self._iter_legacy)
+            else:
+                raise LinkedNodeNotFound(self._name, start_uid)
+            yield from parts[start](reverse, start_uid)
+            parts = parts[start + 1:]
+
+        for part in parts:
+            yield from part(reverse)
+
+    def __len__(self) -> int:
+        legacy = self._legacy()
+        return self._length + (len(legacy) if legacy else 0)
+
+    def __iter__(self):
+        return self._iter_from(False)
+
+    def __reversed__(self):
+        return self._iter_from(True)
+
+    # ================================================
+    #  Operations
+    # ================================================
+    def head_value(self) -> int:
+        """ Returns the uid at the head of the list """
+        for uid in self._iter_from(False):
+            return uid
+        raise EmptyLinkedListException(self._name)
+
+    def tail_value(self) -> int:
+        """ Returns the uid at the tail of the list """
+        for uid in self._iter_from(True):
+            return uid
+        raise EmptyLinkedListException(self._name)
+
+    def _insert(self, uid: int, at_head: bool) -> None:
+        self._migrate_legacy()
+
+        legacy = self._legacy()
+        if legacy is not None and at_head == self._legacy_first:
+            # This end of the list is still in the legacy linked list
+            if at_head:
+                legacy.prepend(uid)
+            else:
+                legacy.append(uid)
+            return
+
+        self._push([uid], at_head)
+
+    def append(self, uid: int) -> None:
+        """ Append an uid at the end of the list """
+        self._insert(uid, at_head=False)
+
+    def prepend(self, uid: int) -> None:
+        """ Prepend an uid at the beginning of the list """
+        self._insert(uid, at_head=True)
+
+    def remove(self, uid: int) -> None:
+        """ Remove a given uid from the list """
+        self._migrate_legacy()
+
+        chunk_id = self._index[uid]
+        if not chunk_id:
+            legacy = self._legacy()
+            if legacy is None:
+                raise LinkedNodeNotFound(self._name, uid)
+            legacy.remove(uid)
+            return
+
+        chunk = self._chunk(chunk_id)
+        chunks = {chunk_id: chunk}
+        chunk.uids.remove(uid)
+        del self._index[uid]
+        self._length -= 1
+
+        if not chunk.uids:
+            self._unlink_chunk(chunks, chunk)
+        else:
+            # Merge the chunk with a neighbour if their uids fit in half a chunk
+            threshold = self._capacity // 2
+            if chunk.prev:
+                prev = self._fetch_chunk(chunks, chunk.prev)
+                if len(prev.uids) + len(chunk.uids) <= threshold:
+                    self._merge_chunks(chunks, prev, chunk)
+            if chunk.uids and chunk.next:
+                following = self._fetch_chunk(chunks, chunk.next)
+                if len(chunk.uids) + len(following.uids) <= threshold:
+                    self._merge_chunks(chunks, chunk, following)
+
+        self._save_chunks(chunks)
+        self._save_meta()
+
+    def select(self, offset: int, cond=None, reverse: bool = False, **kwargs) -> list:
+        """ Returns a limited amount of uids in the list that optionally fulfills a condition.
+            If reverse is True, the uids are iterated from the tail to the head """
+        items = self._iter_from(reverse)
+        result = []
+
+        # Skip N items until offset
+        for _ in range(offset):
+            if next(items, None) is None:
+                # Offset is bigger than the size of the list
+                raise StopIteration(self._name)
+
+        # Do a maximum iteration count of MAX_ITERATION_LOOP
+        for _ in range(MAX_ITERATION_LOOP):
+            uid = next(items, None)
+            if uid is None:
+                break
+            if not cond or cond(self._db, uid, **kwargs):
+                result.append(uid)
+
+        return result
+
+    def select_page(self, cursor: int = 0, cond=None, reverse: bool = False, **kwargs) -> tuple:
+        """ Returns a limited amount of uids in the list that optionally fulfills a condition,
+            starting from a given uid (or from the head if the cursor is 0).
+            If reverse is True, the uids are iterated from the cursor (or from the tail) to the head.
+            Returns the uids, the uid of the next page (0 if none) and whether there are more uids """
+        items = self._iter_from(reverse, cursor)
+        result = []
+
+        # Do a maximum iteration count of MAX_ITERATION_LOOP
+        for _ in range(MAX_ITERATION_LOOP):
+            uid = next(items, None)
+            if uid is None:
+                break
+            if not cond or cond(self._db, uid, **kwargs):
+                result.append(uid)
+
+        cursor = next(items, 0)
+        return result, cursor, cursor != 0
@@ -18,6 +18,17 @@ from iconservice import *
 from .consts import *
 
 
+class _ArraySizeKey:
+    """ Records the key an ArrayDB reads its size with, which is typed on the recent iconservice versions """
+    key = b'size'
+
+    def get_sub_db(self, prefix) -> '_ArraySizeKey':
+        return self
+
+    def get(self, key) -> None:
+        self.key = key
+
+
 class Utils():
 
     @staticmethod
@@ -30,4 +41,25 @@ class Utils():
 
     @staticmethod
     def get_enum_name(cls, index):
-        return Utils.enum_names(cls)[index]
+        # Names precomputed by @state_enum
+        names = cls.__dict__.get('_STATE_NAMES') or Utils.enum_names(cls)
+        return names[index]
+
+    @staticmethod
+    def remove_array(array: ArrayDB) -> None:
+        """ Remove all the items of an ArrayDB, along with the size record it keeps once emptied """
+        while array:
+            array.pop()
+        size = _ArraySizeKey()
+        ArrayDB('', size, value_type=int)
+        array._db.delete(size.key)
+
+    @staticmethod
+    def serialize_page(page: tuple, serialize) -> dict:
+        """ Serialize a page returned by a `select_page` call """
+        items, next_cursor, has_more = page
+        return {
+            "items": [serialize(item) for item in items],
+            "next_cursor": next_cursor,
+            "has_more": has_more
+        }
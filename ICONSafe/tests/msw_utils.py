@@ -3,6 +3,8 @@ from tbears.libs.icon_integrate_test import IconIntegrateTestBase, SCORE_INSTALL
 from iconsdk.libs.in_memory_zip import gen_deploy_data_content
 from iconsdk.signed_transaction import SignedTransaction
 from ICONSafe.tests.utils import *
+from io import BytesIO
+from zipfile import ZipFile, ZIP_DEFLATED
 
 import json
 import os
@@ -10,6 +12,21 @@ import os
 DIR_PATH = os.path.abspath(os.path.dirname(__file__))
 
 
+def gen_score_content(project: str) -> bytes:
+    """ Zip the sources of a SCORE with paths relative to the project, without its tests.
+        The deploy fee is charged per byte of content, so it doesn't depend on where the project is """
+    content = BytesIO()
+    with ZipFile(content, 'w', ZIP_DEFLATED, False, compresslevel=9) as zf:
+        for root, folders, files in os.walk(project):
+            folders[:] = sorted(folder for folder in folders
+                                if folder not in ('tests', '__pycache__') and not folder.startswith('.'))
+            for file in sorted(files):
+                if not file.startswith('.'):
+                    full_path = os.path.join(root, file)
+                    zf.write(full_path, os.path.relpath(full_path, project))
+    return content.getvalue()
+
+
 class ICONSafeTests(IconIntegrateTestBase):
 
     TEST_HTTP_ENDPOINT_URI_V3 = "http://127.0.0.1:9000/api/v3"
@@ -65,7 +82,7 @@ class ICONSafeTests(IconIntegrateTestBase):
             .nid(3) \
             .nonce(100) \
             .content_type("application/zip") \
-            .content(gen_deploy_data_content(project)) \
+            .content(gen_score_content(project)) \
             .params(params) \
             .build()
 
@@ -162,6 +179,28 @@ class ICONSafeTests(IconIntegrateTestBase):
             ), 0
         )
 
+    def get_pending_transactions_for_owner_count(self, wallet_owner_uid: int) -> int:
+        return int(
+            icx_call(
+                super(),
+                from_=self._operator.get_address(),
+                to_=self._score_address,
+                method="get_pending_transactions_for_owner_count",
+                params={"wallet_owner_uid": wallet_owner_uid},
+                icon_service=self.icon_service
+            ), 0
+        )
+
+    def get_pending_transactions_for_owner(self, wallet_owner_uid: int, offset: int = 0) -> list:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_pending_transactions_for_owner",
+            params={"wallet_owner_uid": wallet_owner_uid, "offset": offset},
+            icon_service=self.icon_service
+        )
+
     def get_waiting_transactions(self, offset: int = 0) -> list:
         return icx_call(
             super(),
@@ -192,6 +231,46 @@ class ICONSafeTests(IconIntegrateTestBase):
             icon_service=self.icon_service
         )
 
+    def get_waiting_transactions_page(self, cursor: int = 0) -> dict:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_waiting_transactions_page",
+            params={"cursor": cursor},
+            icon_service=self.icon_service
+        )
+
+    def get_all_transactions(self, offset: int = 0, newest_first: bool = False) -> list:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_all_transactions",
+            params={"offset": offset, "newest_first": newest_first},
+            icon_service=self.icon_service
+        )
+
+    def get_all_transactions_page(self, cursor: int = 0, newest_first: bool = False) -> dict:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_all_transactions_page",
+            params={"cursor": cursor, "newest_first": newest_first},
+            icon_service=self.icon_service
+        )
+
+    def get_wallet_owners_page(self, cursor: int = 0) -> dict:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_wallet_owners_page",
+            params={"cursor": cursor},
+            icon_service=self.icon_service
+        )
+
     def get_token_balance_history(self, token: Address, offset: int = 0) -> list:
         return icx_call(
             super(),
@@ -202,6 +281,36 @@ class ICONSafeTests(IconIntegrateTestBase):
             icon_service=self.icon_service
         )
 
+    def get_current_balances(self, offset: int = 0) -> list:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_current_balances",
+            params={"offset": offset},
+            icon_service=self.icon_service
+        )
+
+    def get_balance_at(self, token: Address, timestamp: int) -> dict:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_balance_at",
+            params={"token": str(token), "timestamp": timestamp},
+            icon_service=self.icon_service
+        )
+
+    def get_balance_buckets(self, token: Address, granularity: str, start: int, end: int) -> list:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_balance_buckets",
+            params={"token": str(token), "granularity": granularity, "start": start, "end": end},
+            icon_service=self.icon_service
+        )
+
     def get_transaction(self, transaction_uid: int) -> dict:
         """
         {
@@ -243,6 +352,25 @@ class ICONSafeTests(IconIntegrateTestBase):
             icon_service=self.icon_service
         ), 0)
 
+    def get_last_transaction_uid(self) -> int:
+        return int(icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_last_transaction_uid",
+            icon_service=self.icon_service
+        ), 0)
+
+    def get_transactions_by_uid_range(self, start_uid: int, end_uid: int) -> list:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_transactions_by_uid_range",
+            params={"start_uid": start_uid, "end_uid": end_uid},
+            icon_service=self.icon_service
+        )
+
     def _do_call(self, from_, method, params, success):
         call = transaction_call_success if success else transaction_call_error
         from_ = from_ if from_ else self._operator
@@ -294,6 +422,30 @@ class ICONSafeTests(IconIntegrateTestBase):
             success
         )
 
+    def refresh_balance_history(self, from_=None, success=True):
+        return self._do_call(
+            from_,
+            "refresh_balance_history",
+            {},
+            success
+        )
+
+    def set_balance_history_retention(self, token: Address, max_items: int, from_=None, success=True):
+        return self._do_call(
+            from_,
+            "set_balance_history_retention",
+            {'token': str(token), 'max_items': str(max_items)},
+            success
+        )
+
+    def compact_balance_history(self, token: Address, max_items: int, from_=None, success=True):
+        return self._do_call(
+            from_,
+            "compact_balance_history",
+            {'token': str(token), 'max_items': str(max_items)},
+            success
+        )
+
     def get_transaction_created_uid(self, tx) -> int:
         for eventlog in tx['eventLogs']:
             if eventlog['indexed'][0] == 'TransactionCreated(int,int)':
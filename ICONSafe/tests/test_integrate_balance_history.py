@@ -82,3 +82,101 @@ class TestIntegrateSubmitTransaction(ICONSafeTests):
         irc2_balance_history = self.get_token_balance_history(self._irc2_address)
         self.assertEqual(len(irc2_balance_history), 3)
         self.assertEqual(irc2_balance_history[0]['balance'], 10000 - 1500)
+
+    def test_refresh_balance_history(self):
+        result = self.add_balance_tracker(self._irc2_address)
+        result = self.send_token(10000, self._score_address)
+
+        # The incoming IRC2 only refreshes the IRC2 balance
+        icx_balance_history = self.get_token_balance_history(ICX_TOKEN_ADDRESS)
+        self.assertEqual(len(icx_balance_history), 1)
+        irc2_balance_history = self.get_token_balance_history(self._irc2_address)
+        self.assertEqual(len(irc2_balance_history), 2)
+        self.assertEqual(irc2_balance_history[0]['balance'], 10000)
+
+        # Balances didn't change since then, the full refresh doesn't add any item
+        result = self.refresh_balance_history()
+        self.assertEqual(len(self.get_token_balance_history(ICX_TOKEN_ADDRESS)), 1)
+        self.assertEqual(len(self.get_token_balance_history(self._irc2_address)), 2)
+
+        # Only wallet owners may refresh the balances
+        result = self.refresh_balance_history(from_=self._user, success=False)
+
+    def test_get_current_balances(self):
+        result = self.add_balance_tracker(self._irc2_address)
+        result = self.deposit_icx_to_multisig_score(10000)
+        result = self.send_token(3000, self._score_address)
+
+        balances = {balance['token']: balance for balance in self.get_current_balances()}
+        self.assertEqual(len(balances), 2)
+        self.assertEqual(balances[str(ICX_TOKEN_ADDRESS)]['balance'], 10000)
+        self.assertEqual(balances[str(self._irc2_address)]['balance'], 3000)
+
+        # The latest balances match the head of the histories
+        irc2_balance_history = self.get_token_balance_history(self._irc2_address)
+        self.assertEqual(balances[str(self._irc2_address)]['balance_history_uid'], irc2_balance_history[0]['uid'])
+
+    def test_get_balance_at(self):
+        result = self.add_balance_tracker(self._irc2_address)
+        result = self.send_token(10000, self._score_address)
+        result = self.send_token(5000, self._score_address)
+
+        irc2_balance_history = self.get_token_balance_history(self._irc2_address)
+        self.assertEqual(len(irc2_balance_history), 3)
+        first, second = irc2_balance_history[1]['timestamp'], irc2_balance_history[0]['timestamp']
+
+        self.assertEqual(self.get_balance_at(self._irc2_address, first)['balance'], 10000)
+        self.assertEqual(self.get_balance_at(self._irc2_address, second - 1)['balance'], 10000)
+        self.assertEqual(self.get_balance_at(self._irc2_address, second)['balance'], 15000)
+        self.assertEqual(self.get_balance_at(self._irc2_address, second + 1000000)['uid'], irc2_balance_history[0]['uid'])
+        self.assertEqual(self.get_balance_at(self._irc2_address, 0), {})
+
+    def test_get_balance_buckets(self):
+        result = self.add_balance_tracker(self._irc2_address)
+        result = self.send_token(10000, self._score_address)
+        result = self.send_token(5000, self._score_address)
+
+        timestamp = self.get_token_balance_history(self._irc2_address)[0]['timestamp']
+        for granularity in ['daily', 'weekly', 'monthly']:
+            buckets = self.get_balance_buckets(self._irc2_address, granularity, timestamp, timestamp)
+            self.assertEqual(len(buckets), 1)
+            # The initial balance, and both transfers
+            self.assertEqual(buckets[0]['count'], 3)
+            self.assertEqual(buckets[0]['open'], 0)
+            self.assertEqual(buckets[0]['close'], 15000)
+            self.assertEqual(buckets[0]['min'], 0)
+            self.assertEqual(buckets[0]['max'], 15000)
+
+        # Nothing before the history
+        self.assertEqual(self.get_balance_buckets(self._irc2_address, 'daily', 0, 10 ** 6), [])
+
+    def test_compact_balance_history(self):
+        result = self.add_balance_tracker(self._irc2_address)
+        for _ in range(3):
+            result = self.send_token(1000, self._score_address)
+
+        irc2_balance_history = self.get_token_balance_history(self._irc2_address)
+        self.assertEqual(len(irc2_balance_history), 4)
+        oldest_timestamp = irc2_balance_history[-1]['timestamp']
+        self.assertEqual(self.get_balance_at(self._irc2_address, oldest_timestamp)['balance'], 0)
+
+        # Nothing is compacted without retention
+        result = self.compact_balance_history(self._irc2_address, 10)
+        self.assertEqual(len(self.get_token_balance_history(self._irc2_address)), 4)
+
+        # Keep the last 2 items, in bounded chunks
+        result = self.set_balance_history_retention(self._irc2_address, 2)
+        result = self.compact_balance_history(self._irc2_address, 1)
+        self.assertEqual(len(self.get_token_balance_history(self._irc2_address)), 3)
+        result = self.compact_balance_history(self._irc2_address, 10)
+
+        compacted_history = self.get_token_balance_history(self._irc2_address)
+        self.assertEqual(compacted_history, irc2_balance_history[:2])
+        self.assertEqual(self.get_balance_at(self._irc2_address, oldest_timestamp), {})
+        self.assertEqual(self.get_balance_at(self._irc2_address, compacted_history[0]['timestamp'])['balance'], 3000)
+
+        # The compacted items remain summarized in the buckets
+        buckets = self.get_balance_buckets(self._irc2_address, 'monthly', oldest_timestamp, oldest_timestamp)
+        self.assertEqual(buckets[0]['count'], 4)
+
+        result = self.set_balance_history_retention(self._irc2_address, -1, success=False)
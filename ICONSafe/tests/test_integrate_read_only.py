@@ -75,6 +75,58 @@ class TestIntegrateReadOnly(ICONSafeTests):
         self.assertEqual(str(self._score_address), transaction["sub_transactions"][0]["destination"])
         self.assertEqual("set_wallet_owners_required", transaction["sub_transactions"][0]["method_name"])
 
+    def test_get_transactions_page(self):
+        txcounts = 110
+
+        for _ in range(txcounts):
+            self.set_wallet_owners_required(3)
+
+        # success case: the first page starts from the head
+        page = self.get_waiting_transactions_page()
+        self.assertEqual(100, len(page['items']))
+        self.assertTrue(page['has_more'])
+        self.assertEqual(page['items'][0]['uid'], self.get_waiting_transactions()[0]['uid'])
+
+        # success case: the next page starts from the cursor and ends the list
+        last_page = self.get_waiting_transactions_page(page['next_cursor'])
+        self.assertEqual(txcounts - 100, len(last_page['items']))
+        self.assertFalse(last_page['has_more'])
+        self.assertEqual(0, last_page['next_cursor'])
+
+        # success case: pages are contiguous and ordered
+        uids = [tx['uid'] for tx in page['items'] + last_page['items']]
+        self.assertEqual(uids, sorted(uids))
+        self.assertEqual(len(set(uids)), txcounts)
+        self.assertEqual(page['next_cursor'], last_page['items'][0]['uid'])
+
+        # success case: a cursor in the middle of the list
+        middle_page = self.get_all_transactions_page(uids[50])
+        self.assertEqual(uids[50:], [tx['uid'] for tx in middle_page['items']][:len(uids) - 50])
+
+        # failure case: unknown cursor
+        self.assertRaises(IconScoreException, self.get_waiting_transactions_page, 404)
+
+    def test_get_transactions_newest_first(self):
+        for _ in range(5):
+            self.set_wallet_owners_required(3)
+
+        uids = [tx['uid'] for tx in self.get_all_transactions()]
+        self.assertEqual(5, len(uids))
+
+        # success case: newest transactions are returned first
+        newest_first = [tx['uid'] for tx in self.get_all_transactions(newest_first=True)]
+        self.assertEqual(list(reversed(uids)), newest_first)
+        self.assertEqual(list(reversed(uids))[2:], [tx['uid'] for tx in self.get_all_transactions(2, newest_first=True)])
+
+        # success case: the latest page starts from the tail
+        page = self.get_all_transactions_page(newest_first=True)
+        self.assertEqual(list(reversed(uids)), [tx['uid'] for tx in page['items']])
+        self.assertFalse(page['has_more'])
+
+        # success case: a cursor walks toward the head
+        page = self.get_all_transactions_page(uids[2], newest_first=True)
+        self.assertEqual([uids[2], uids[1], uids[0]], [tx['uid'] for tx in page['items']])
+
     def test_get_wallet_owners(self):
         owners_wallets = [str(create_address()) for x in range(0, 50)]
         owners = list(map(lambda x: {"address": str(x[1]), "name": str(x[0])}, enumerate(owners_wallets)))
@@ -100,6 +152,11 @@ class TestIntegrateReadOnly(ICONSafeTests):
         for i in range(len(actual_owners)):
             self.assertEqual(expected_owners[i]['name'], actual_owners[i]['name'])
 
+        # success case: all the owners fit in a single page
+        page = self.get_wallet_owners_page()
+        self.assertEqual([owner['name'] for owner in owners], [owner['name'] for owner in page['items']])
+        self.assertFalse(page['has_more'])
+
     def test_get_confirmations_and_get_confirmation_count(self):
         owners_wallets = [self._operator] + [self._wallet_array[x] for x in range(0, 49)]
         owners = list(map(lambda x: {"address": x[1].get_address(), "name": str(x[0])}, enumerate(owners_wallets)))
@@ -132,6 +189,45 @@ class TestIntegrateReadOnly(ICONSafeTests):
         # getConfirmationCount should be 26 (submit wallet owner 1 + confirm wallet owner 25)
         self.assertEqual(len(transaction['confirmations']), 25 + 1)
 
+    def test_get_pending_transactions_for_owner(self):
+        result = self.set_wallet_owners_required(2)
+        result = self.confirm_transaction_created(result)
+
+        operator_uid = self.get_wallet_owner_uid(self._operator.get_address())
+        owner2_uid = self.get_wallet_owner_uid(self._owner2.get_address())
+        owner3_uid = self.get_wallet_owner_uid(self._owner3.get_address())
+
+        # success case: a new transaction is pending for every owner
+        result = self.add_wallet_owner(self._user.get_address(), "user")
+        txuid = self.get_transaction_created_uid(result)
+        for owner_uid in [operator_uid, owner2_uid, owner3_uid]:
+            self.assertEqual(1, self.get_pending_transactions_for_owner_count(owner_uid))
+            self.assertEqual([txuid], [tx['uid'] for tx in self.get_pending_transactions_for_owner(owner_uid)])
+
+        # success case: a participation removes the transaction from the owner pending transactions
+        self.confirm_transaction(txuid, from_=self._operator)
+        self.reject_transaction(txuid, from_=self._owner3)
+        self.assertEqual(0, self.get_pending_transactions_for_owner_count(operator_uid))
+        self.assertEqual(1, self.get_pending_transactions_for_owner_count(owner2_uid))
+        self.assertEqual(0, self.get_pending_transactions_for_owner_count(owner3_uid))
+
+        # success case: a revoked participation makes the transaction pending again
+        self.revoke_transaction(txuid, from_=self._operator)
+        self.assertEqual(1, self.get_pending_transactions_for_owner_count(operator_uid))
+
+        # success case: an executed transaction isn't pending anymore
+        self.confirm_transaction(txuid, from_=self._operator)
+        self.confirm_transaction(txuid, from_=self._owner2)
+        self.assertEqual("EXECUTED", self.get_transaction(txuid)['state'])
+        for owner_uid in [operator_uid, owner2_uid, owner3_uid]:
+            self.assertEqual(0, self.get_pending_transactions_for_owner_count(owner_uid))
+
+        # success case: the new owner can participate to the next transactions
+        user_uid = self.get_wallet_owner_uid(self._user.get_address())
+        result = self.set_wallet_owners_required(3)
+        txuid = self.get_transaction_created_uid(result)
+        self.assertEqual([txuid], [tx['uid'] for tx in self.get_pending_transactions_for_owner(user_uid)])
+
     def test_get_total_number_of_wallet_owner(self):
         result = self.set_wallet_owners_required(2)
         result = self.confirm_transaction_created(result)
@@ -158,3 +254,20 @@ class TestIntegrateReadOnly(ICONSafeTests):
 
         count = self.get_wallet_owners_count()
         self.assertEqual(3, count)
+
+    def test_get_transactions_by_uid_range(self):
+        txuids = []
+        for _ in range(5):
+            result = self.set_wallet_owners_required(3)
+            txuids.append(self.get_transaction_created_uid(result))
+
+        self.assertEqual(txuids[-1], self.get_last_transaction_uid())
+
+        # Cancelled transactions are skipped
+        self.cancel_transaction(txuids[1])
+        transactions = self.get_transactions_by_uid_range(txuids[0], txuids[-1])
+        self.assertEqual([txuids[0]] + txuids[2:], [transaction["uid"] for transaction in transactions])
+
+        # The range is bounded by the last uid
+        transactions = self.get_transactions_by_uid_range(txuids[-1], txuids[-1] + 100)
+        self.assertEqual([txuids[-1]], [transaction["uid"] for transaction in transactions])
@@ -347,6 +347,33 @@ class TestIntegrateWalletMethod(ICONSafeTests):
         expected_owners = [self._operator.get_address(), self._owner2.get_address(), self._owner3.get_address(), self._user.get_address()]
         self.assertEqual(expected_owners, owners)
 
+    def test_change_requirement_rejection(self):
+        result = self.set_wallet_owners_required(3)
+        result = self.confirm_transaction_created(result)
+
+        # Create a transaction when the requirement is 3
+        result = self.add_wallet_owner(self._user.get_address(), "new_owner")
+        add_owner_txuid = self.get_transaction_created_uid(result)
+
+        # reject transaction by only 2 owners (should still be waiting)
+        self.reject_transaction(add_owner_txuid, from_=self._operator)
+        self.reject_transaction(add_owner_txuid, from_=self._owner2)
+        self.assertEqual("WAITING", self.get_transaction(add_owner_txuid)['state'])
+
+        # Reduce the requirement to 2
+        result = self.set_wallet_owners_required(2)
+        txuid = self.get_transaction_created_uid(result)
+
+        # confirm transaction
+        self.confirm_transaction(txuid, from_=self._operator)
+        self.confirm_transaction(txuid, from_=self._owner2)
+        result = self.confirm_transaction(txuid, from_=self._owner3)
+
+        # The add owner should have been rejected now
+        self.assertEqual(self.get_transaction_rejection_success_uid(result), add_owner_txuid)
+        self.assertEqual("REJECTED", self.get_transaction(add_owner_txuid)['state'])
+        self.assertEqual(3, self.get_wallet_owners_count())
+
     def test_force_cancel_transaction(self):
         result = self.set_wallet_owners_required(2)
         result = self.confirm_transaction_created(result)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from iconservice.icon_constant import Revision
+from tbears.libs.scoretest.patch.context import Context
+
+from ICONSafe.scorelib import *
+from ICONSafe.tests.unit_utils import ICONSafeUnitTests
+
+
+class TestUnitBag(ICONSafeUnitTests):
+
+    def test_delete_legacy_set(self):
+        # Sets created before the epochs and the position index
+        self.write_legacy_set([3, 1, 2])
+
+        legacy = SetDB('set', self.db, value_type=int, order=True)
+        self.assertEqual(list(legacy), [3, 1, 2])
+        legacy.delete()
+        self.assertEqual(self.stored_keys(), [])
+
+    def test_delete_cleared_set(self):
+        set_db = SetDB('set', self.db, value_type=int, order=True)
+        for item in range(4):
+            set_db.add(item)
+        set_db.clear()
+        set_db.add(5)
+        set_db.remove(5)
+
+        set_db.delete()
+        self.assertEqual(len(set_db), 0)
+        self.assertEqual(self.stored_keys(), [])
+
+    def test_ordered_remove_last_occurrence(self):
+        bag = BagDB('bag', self.db, value_type=int, order=True)
+        for item in (1, 2, 1, 3):
+            bag.add(item)
+
+        bag.remove(1)
+        self.assertEqual(list(bag), [1, 2, 3])
+        bag.remove(4)
+        self.assertEqual(list(bag), [1, 2, 3])
+
+        # Unordered bags keep removing the first occurrence
+        unordered = BagDB('unordered', self.db, value_type=int)
+        for item in (1, 2, 1, 3):
+            unordered.add(item)
+        unordered.remove(1)
+        self.assertEqual(list(unordered), [3, 2, 1])
+
+    def test_tombstones(self):
+        bag = BagDB('bag', self.db, value_type=int, order=True)
+        for item in range(6):
+            bag.add(item)
+
+        bag.remove(2)
+        bag.remove(0)
+        self.assertEqual(list(bag), [1, 3, 4, 5])
+        self.assertEqual(len(bag), 4)
+        self.assertEqual((bag[0], bag[1], bag[-1]), (1, 3, 5))
+        self.assertEqual((bag.first(), bag.last()), (1, 5))
+        self.assertEqual(bag._start.get(), 1)
+        self.assertEqual(bag._tombstones_count.get(), 1)
+
+        # Removing the tail also drops the tombstones preceding it
+        bag.remove(4)
+        bag.remove(5)
+        self.assertEqual(list(bag), [1, 3])
+        self.assertEqual(len(bag._items), 4)
+        self.assertEqual(bag._tombstones_count.get(), 1)
+        self.assertEqual(bag.last(), 3)
+
+        # A removed slot is skipped when the item is found again
+        bag.add(2)
+        bag.remove(2)
+        self.assertEqual(list(bag), [1, 3])
+        self.assertEqual(bag.select_page(), ([1, 3], 0, False))
+
+    def test_compaction(self):
+        bag = BagDB('bag', self.db, value_type=int, order=True)
+        for item in range(8):
+            bag.add(item)
+
+        for item in (1, 3, 5):
+            bag.remove(item)
+        self.assertEqual(len(bag._items), 8)
+        self.assertEqual(bag._tombstones_count.get(), 3)
+
+        # The fourth removed slot outnumbers the items left
+        bag.remove(0)
+        bag.remove(6)
+        self.assertEqual(list(bag), [2, 4, 7])
+        self.assertEqual(list(bag._items), [2, 4, 7])
+        self.assertEqual(bag._start.get(), 0)
+        self.assertEqual(bag._tombstones_count.get(), 0)
+
+        for item in (2, 4, 7):
+            bag.remove(item)
+        self.assertEqual(len(bag), 0)
+        self.assertEqual(len(bag._items), 0)
+
+    def test_select_page_skips_tombstones(self):
+        bag = BagDB('bag', self.db, value_type=int, order=True)
+        for item in range(MAX_ITERATION_LOOP + 3):
+            bag.add(item)
+        bag.remove(1)
+
+        items, cursor, has_more = bag.select_page()
+        self.assertEqual(items, [0] + list(range(2, MAX_ITERATION_LOOP + 1)))
+        self.assertEqual((cursor, has_more), (MAX_ITERATION_LOOP + 1, True))
+        items, cursor, has_more = bag.select_page(cursor, lambda db, item: item % 2 == 0)
+        self.assertEqual(items, [MAX_ITERATION_LOOP + 2])
+        self.assertEqual((cursor, has_more), (0, False))
+
+    def write_legacy_set(self, items: list) -> None:
+        """ Store a set in the layout used before the position index """
+        array = ArrayDB('set_SETDB_BAGDB_items', self.db, value_type=int)
+        for item in items:
+            array.put(item)
+
+    def test_read_legacy_set(self):
+        self.write_legacy_set([3, 1, 2])
+        set_db = SetDB('set', self.db, value_type=int, order=True)
+
+        # Sets are read without being indexed
+        self.assertIn(1, set_db)
+        self.assertNotIn(4, set_db)
+        self.assertEqual(set_db.count(2), 1)
+        self.assertEqual(list(set_db), [3, 1, 2])
+        self.assertFalse(set_db._is_indexed())
+
+    def test_modify_legacy_set(self):
+        self.write_legacy_set([3, 1, 2])
+        set_db = SetDB('set', self.db, value_type=int)
+
+        set_db.add(1)
+        self.assertTrue(set_db._is_indexed())
+        self.assertEqual(list(set_db), [3, 1, 2])
+        set_db.add(4)
+        set_db.remove(3)
+        self.assertRaises(ItemNotFound, set_db.remove, 3)
+        self.assertEqual(list(set_db), [4, 1, 2])
+        set_db.discard(1)
+        self.assertEqual(list(set_db), [4, 2])
+        self.assertEqual(set_db.pop(), 2)
+        self.assertIn(4, set_db)
+        self.assertNotIn(2, set_db)
+
+    def test_remove_array_rlp_keys(self):
+        # The size of an ArrayDB is stored under a typed key, encoded differently from USE_RLP
+        Context.get_context().revision = Revision.USE_RLP.value
+        array = ArrayDB('array', self.db, value_type=int)
+        for item in range(3):
+            array.put(item)
+        Utils.remove_array(array)
+        self.assertEqual(self.stored_keys(), [])
+
+        bag = BagDB('bag', self.db, value_type=int, order=True)
+        for item in range(3):
+            bag.add(item)
+        bag.remove(0)
+        bag._remove_metadata()
+        self.assertEqual(self.stored_keys(), [])
+
+        # Through the cache of a call
+        cache = DatabaseCache(self.db)
+        array = ArrayDB('array', cache.db, value_type=int)
+        array.put(1)
+        cache.flush()
+        Utils.remove_array(array)
+        cache.flush()
+        self.assertEqual(self.stored_keys(), [])
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from tbears.libs.scoretest.patch.context import Context
+from tbears.libs.scoretest.score_test_case import ScoreTestCase
+
+from ICONSafe.main import ICONSafe
+from ICONSafe.balance_history_manager.balance_history import *
+
+DAY = 24 * 3600 * 10 ** 6
+
+
+class TestUnitBalanceHistory(ScoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.owners = [self.test_account1, self.test_account2]
+        self.score = self.get_score_instance(ICONSafe, self.genesis_address, on_install_params={
+            'owners': [{'address': str(owner), 'name': 'owner'} for owner in self.owners],
+            'owners_required': 2})
+        self.token = Address.from_string('cx' + '1' * 40)
+        self.allow_writes()
+
+        # Balance history items created before the indexes are only in the token balance history
+        for day, balance in enumerate((100, 200, 150)):
+            balance_history_uid = BalanceHistoryFactory.create(self.score.db, 0, self.token, balance, day * DAY)
+            self.score._token_balance_history(self.token).prepend(balance_history_uid)
+
+    def allow_writes(self) -> None:
+        """ Allow the writes outside of a SCORE method, a readonly call disallows them """
+        context = Context.get_context()
+        # A reverted call doesn't pop its method flag
+        context.method_flag_trace.clear()
+        Context._set_invoke_context(context)
+        context.current_address = self.score.address
+
+    def test_balance_buckets_not_indexed(self):
+        self.assertRaises(IconScoreException, self.score.get_balance_buckets, self.token, 'daily', 0, 2 * DAY)
+
+        self.set_msg(self.test_account1)
+        self.allow_writes()
+        self.score.index_balance_history(2)
+        self.assertRaises(IconScoreException, self.score.get_balance_buckets, self.token, 'daily', 0, 2 * DAY)
+
+        self.allow_writes()
+        self.score.index_balance_history(2)
+        buckets = self.score.get_balance_buckets(self.token, 'daily', 0, 2 * DAY)
+        self.assertEqual([(bucket['period'], bucket['close']) for bucket in buckets], [(0, 100), (1, 200), (2, 150)])
+
+    def test_compact_during_indexing(self):
+        self.set_msg(self.test_account1)
+        self.score.set_balance_history_retention(self.token, 1)
+        self.assertRaises(IconScoreException, self.score.compact_balance_history, self.token, 10)
+
+        self.allow_writes()
+        self.score.index_balance_history(2)
+        self.assertRaises(IconScoreException, self.score.compact_balance_history, self.token, 10)
+
+        # A new balance indexes the remaining items
+        self.allow_writes()
+        self.score._update_token_balance(0, self.token, 300)
+        self.score.compact_balance_history(self.token, 2)
+        self.score.compact_balance_history(self.token, 10)
+
+        token_balance_history = self.score._token_balance_history(self.token)
+        self.assertEqual(len(token_balance_history), 1)
+        self.assertEqual(self.score._latest_balance(self.token)[0], 300)
+        buckets = self.score.get_balance_buckets(self.token, 'daily', 0, 2 * DAY)
+        self.assertEqual([(bucket['period'], bucket['close']) for bucket in buckets], [(0, 100), (1, 200), (2, 150)])
+        self.assertEqual(self.score.get_balance_at(self.token, DAY), {})
+
+        # The newest compacted item summarizes the balance until the oldest item retained
+        self.assertEqual(self.score.get_balance_at(self.token, 2 * DAY + 1)['balance'], 150)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+from ICONSafe.scorelib import *
+from ICONSafe.tests.unit_utils import ICONSafeUnitTests
+
+
+class Item(EntityDB):
+
+    _FIELDS = [('name', str), ('value', int)]
+
+    def __init__(self, uid: int, db: IconScoreDatabase):
+        super().__init__(f'item_{uid}', db)
+
+
+class Score:
+
+    def __init__(self, db: IconScoreDatabase):
+        self._db = db
+
+    @property
+    def db(self) -> IconScoreDatabase:
+        cache = DatabaseCache.current(self)
+        return cache.db if cache else self._db
+
+    @defer_writes
+    def write(self, value: int, reader: 'Score' = None, fail: bool = False) -> int:
+        VarDB('value', self.db, value_type=int).set(value)
+        if fail:
+            raise Exception('fail')
+        # Another call doesn't read the pending writes of this call
+        return VarDB('value', reader.db, value_type=int).get() if reader else None
+
+    @defer_writes
+    def write_before_call(self, value: int, reader: 'Score') -> int:
+        VarDB('value', self.db, value_type=int).set(value)
+        DatabaseCache.current(self).flush_before_call()
+        return VarDB('value', reader.db, value_type=int).get()
+
+    @defer_writes
+    def write_entity(self) -> tuple:
+        first, second = Item(1, self.db), Item(1, self.db)
+        first._name.set('item')
+        first._value.set(1)
+        second._value.set(2)
+        # Every instance of the entity reads the pending writes, held in a single dirty record
+        stored = VarDB('item_1_RECORDDB', self._db, value_type=bytes).get()
+        return first._value.get(), second._name.get(), len(DatabaseCache.current(self)._dirty), stored
+
+
+class TestUnitCache(ICONSafeUnitTests):
+
+    def test_deferred_writes(self):
+        score, reader = Score(self.db), Score(self.db)
+        self.assertEqual(score.write(1, reader), 0)
+        self.assertEqual(VarDB('value', reader.db, value_type=int).get(), 1)
+        self.assertIsNone(DatabaseCache.current(score))
+
+    def test_failed_call(self):
+        score = Score(self.db)
+        score.write(1)
+        self.assertRaises(Exception, score.write, 2, fail=True)
+        self.assertIsNone(DatabaseCache.current(score))
+        self.assertEqual(VarDB('value', score.db, value_type=int).get(), 1)
+
+    def test_flush_before_call(self):
+        score, reader = Score(self.db), Score(self.db)
+        self.assertEqual(score.write_before_call(3, reader), 3)
+
+    def test_entity_deferred_writes(self):
+        score = Score(self.db)
+        item = Item(1, self.db)
+        self.assertNotIn('_name', item.__dict__)
+        self.assertEqual(score.write_entity(), (2, 'item', 1, None))
+
+        self.assertEqual((item._name.get(), item._value.get()), ('item', 2))
+        self.assertIn('_name', item.__dict__)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+from ICONSafe.scorelib import *
+from ICONSafe.balance_history_manager.balance_history import *
+from ICONSafe.tests.unit_utils import ICONSafeUnitTests
+from ICONSafe.wallet_owner_manager.wallet_owner import *
+
+TOKEN = Address.from_string('cx' + '1' * 40)
+OWNER = Address.from_string('hx' + '2' * 40)
+
+
+class TestUnitEntity(ICONSafeUnitTests):
+
+    def setUp(self):
+        super().setUp()
+        # Entities stored before the single records, one VarDB per field
+        VarDB('WALLET_OWNER_1_address', self.db, value_type=Address).set(OWNER)
+        VarDB('WALLET_OWNER_1_name', self.db, value_type=str).set('owner')
+        VarDB('BALANCE_HISTORY_1_token', self.db, value_type=Address).set(TOKEN)
+        VarDB('BALANCE_HISTORY_1_transaction_uid', self.db, value_type=int).set(7)
+        VarDB('BALANCE_HISTORY_1_balance', self.db, value_type=int).set(100)
+        VarDB('BALANCE_HISTORY_1_timestamp', self.db, value_type=int).set(123)
+
+    def test_read_legacy_entities(self):
+        self.assertEqual(WalletOwner(1, self.db).serialize(), {'uid': 1, 'address': str(OWNER), 'name': 'owner'})
+        self.assertTrue(WalletOwner(1, self.db).same_address(OWNER))
+        self.assertEqual(BalanceHistory(1, self.db).serialize(), {
+            'uid': 1, 'transaction_uid': 7, 'token': str(TOKEN), 'balance': 100, 'timestamp': 123})
+
+        # Missing entities are read as default values
+        self.assertIsNone(WalletOwner(2, self.db)._address.get())
+        self.assertEqual(BalanceHistory(2, self.db)._balance.get(), 0)
+
+    def test_modify_legacy_entities(self):
+        WalletOwner(1, self.db)._name.set('renamed')
+        BalanceHistory(1, self.db)._balance.set(100)
+
+        # Each entity is moved to a single record
+        self.assertEqual(len(self.stored_keys()), 2)
+        self.assertEqual(WalletOwner(1, self.db).serialize(), {'uid': 1, 'address': str(OWNER), 'name': 'renamed'})
+        self.assertEqual(BalanceHistory(1, self.db)._timestamp.get(), 123)
+
+        BalanceHistory(1, self.db).remove()
+        self.assertEqual(len(self.stored_keys()), 1)
+        self.assertIsNone(BalanceHistory(1, self.db)._token.get())
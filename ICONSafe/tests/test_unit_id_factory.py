@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+from ICONSafe.scorelib import *
+from ICONSafe.tests.unit_utils import ICONSafeUnitTests
+
+
+class TestUnitIdFactory(ICONSafeUnitTests):
+
+    def test_legacy_counter(self):
+        # Counter written by the previous version, before the reservations
+        VarDB('factory_ID_FACTORY_uid', self.db, value_type=int).set(5)
+        factory = IdFactory('factory', self.db)
+
+        self.assertEqual(factory.get_last_uid(), 5)
+        self.assertEqual(factory.get_uid(), 6)
+        self.assertEqual(list(factory.reserve(3)), [7, 8, 9])
+        self.assertEqual(list(factory.reserve(0)), [])
+        self.assertEqual(IdFactory('factory', self.db).get_uid(), 10)
+        self.assertEqual(VarDB('factory_ID_FACTORY_uid', self.db, value_type=int).get(), 10)
+
+    def test_new_counter(self):
+        factory = IdFactory('factory', self.db)
+        self.assertEqual(factory.get_last_uid(), 0)
+        self.assertEqual(list(factory.reserve(2)), [1, 2])
+        self.assertEqual(factory.get_uid(), 3)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+from ICONSafe.scorelib import *
+from ICONSafe.tests.unit_utils import ICONSafeUnitTests
+
+
+class TestUnitIterableDict(ICONSafeUnitTests):
+
+    def create_legacy_dict(self, size: int) -> IterableDictDB:
+        # Dicts created before the epochs and the position index of their keys
+        keys = ArrayDB('dict_ITERABLE_DICTDB_keys_SETDB_BAGDB_items', self.db, value_type=str)
+        values = DictDB('dict_ITERABLE_DICTDB_values', self.db, value_type=str)
+        for index in range(size):
+            keys.put(f'key{index}')
+            values[f'key{index}'] = f'value{index}'
+        return IterableDictDB('dict', self.db, value_type=str)
+
+    def test_legacy_dict(self):
+        iterable_dict = self.create_legacy_dict(3)
+        self.assertEqual(len(iterable_dict), 3)
+        self.assertEqual(iterable_dict['key1'], 'value1')
+
+        del iterable_dict['key0']
+        iterable_dict['key3'] = 'value3'
+        self.assertEqual(sorted(iterable_dict.keys()), ['key1', 'key2', 'key3'])
+
+    def test_collect_legacy_keys(self):
+        iterable_dict = self.create_legacy_dict(10)
+        iterable_dict.clear()
+        self.assertEqual(len(iterable_dict), 0)
+
+        # The stale keys are deleted from the end of their array, without indexing them
+        self.assertEqual(iterable_dict.collect_garbage(4), 4)
+        self.assertIsNone(VarDB('dict_ITERABLE_DICTDB_keys_SETDB_indexed', self.db, value_type=bytes).get())
+        self.assertEqual(len(ArrayDB('dict_ITERABLE_DICTDB_keys_SETDB_BAGDB_items', self.db, value_type=str)), 6)
+        self.assertIsNone(DictDB('dict_ITERABLE_DICTDB_values', self.db, value_type=bytes)['key9'])
+        self.assertEqual(DictDB('dict_ITERABLE_DICTDB_values', self.db, value_type=str)['key5'], 'value5')
+
+        while iterable_dict.has_garbage():
+            iterable_dict.collect_garbage(4)
+        self.assertEqual(len(self.stored_keys()), 1)
+
+    def test_collect_with_new_items(self):
+        iterable_dict = IterableDictDB('dict', self.db, value_type=int, order=True)
+        for key in range(5):
+            iterable_dict[key] = key * 10
+        del iterable_dict[2]
+        iterable_dict.clear()
+
+        iterable_dict[7] = 70
+        self.assertEqual(list(iterable_dict), [(7, 70)])
+        while iterable_dict.has_garbage():
+            iterable_dict.collect_garbage(2)
+        self.assertEqual(list(iterable_dict), [(7, 70)])
+
+        iterable_dict.clear()
+        while iterable_dict.has_garbage():
+            iterable_dict.collect_garbage()
+        # Only the epoch of the dict is left
+        self.assertEqual(len(self.stored_keys()), 1)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+from ICONSafe.scorelib import *
+from ICONSafe.tests.unit_utils import ICONSafeUnitTests
+from ICONSafe.wallet_owner_manager.wallet_owner import *
+
+
+class TestUnitKey(ICONSafeUnitTests):
+
+    def test_compact_key(self):
+        self.assertEqual(CompactKey.make(1, 0x1234), b'\x01\x12\x34')
+        self.assertRaises(InvalidKeyNamespace, CompactKey.make, 0x20, 1)
+        self.assertRaises(InvalidKeyNamespace, CompactKey.make, 0, 1)
+
+
+    def test_entity_record_key(self):
+        WalletOwner(300, self.db)._record.create({'address': self.test_account1, 'name': 'owner'})
+
+        # The record key replaces the 25 bytes of 'WALLET_OWNER_300_RECORDDB'
+        key, = self.stored_keys()
+        self.assertTrue(key.endswith(CompactKey.make(3, 300)))
+        self.assertLess(len(key) - len(self.db.address.to_bytes()), 8)
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+from ICONSafe.scorelib import *
+from ICONSafe.tests.unit_utils import ICONSafeUnitTests
+
+
+class TestUnitLinkedList(ICONSafeUnitTests):
+
+    def write_legacy_list(self, values: list) -> None:
+        """ Store a list in the layout used before the packed nodes, one VarDB per node field """
+        name = 'list_LINKED_LISTDB'
+        for node_id, value in enumerate(values, start=1):
+            node = f'{node_id}{name}_NODEDB'
+            VarDB(f'{node}_init', self.db, int).set(1)
+            VarDB(f'{node}_value', self.db, int).set(value)
+            VarDB(f'{node}_prev', self.db, int).set(node_id - 1)
+            VarDB(f'{node}_next', self.db, int).set(node_id + 1 if node_id < len(values) else 0)
+        VarDB(f'{name}_head_id', self.db, int).set(1)
+        VarDB(f'{name}_tail_id', self.db, int).set(len(values))
+        VarDB(f'{name}_length', self.db, int).set(len(values))
+        VarDB(f'{name}_nodedb_ID_FACTORY_uid', self.db, int).set(len(values))
+
+    def legacy_fields(self, node_id: int) -> list:
+        node = f'{node_id}list_LINKED_LISTDB_NODEDB'
+        return [VarDB(f'{node}_{field}', self.db, bytes).get() for field in ('init', 'value', 'prev', 'next')]
+
+    def test_read_legacy_nodes(self):
+        self.write_legacy_list([10, 20, 30])
+        linked_list = LinkedListDB('list', self.db, value_type=int)
+
+        self.assertEqual(list(linked_list), [(1, 10), (2, 20), (3, 30)])
+        self.assertEqual(list(reversed(linked_list)), [(3, 30), (2, 20), (1, 10)])
+        self.assertEqual(linked_list.node_value(2), 20)
+        self.assertEqual(linked_list.next(1), 2)
+        self.assertEqual(linked_list.prev(3), 2)
+
+    def test_modify_legacy_nodes(self):
+        self.write_legacy_list([10, 20, 30])
+        linked_list = LinkedListDB('list', self.db, value_type=int)
+
+        linked_list.append(40)
+        linked_list.remove(2)
+        linked_list.move_node_head(3)
+        self.assertEqual(list(linked_list), [(3, 30), (1, 10), (4, 40)])
+        self.assertEqual(list(reversed(linked_list)), [(4, 40), (1, 10), (3, 30)])
+
+        # The nodes written are moved to the packed layout, the removed node is deleted
+        for node_id in (1, 2, 3):
+            self.assertEqual(self.legacy_fields(node_id), [None] * 4)
+
+        linked_list.clear()
+        while linked_list.has_garbage():
+            linked_list.collect_garbage()
+        self.assertEqual(len(linked_list), 0)
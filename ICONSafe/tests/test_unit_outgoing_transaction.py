@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+from ICONSafe.scorelib import *
+from ICONSafe.transaction_manager.transaction_factory import *
+from ICONSafe.tests.unit_utils import ICONSafeUnitTests
+
+
+class TestUnitOutgoingTransaction(ICONSafeUnitTests):
+
+    def create_transaction(self) -> OutgoingTransaction:
+        transaction_uid = IdFactory(TransactionFactory._NAME, self.db).get_uid()
+        OutgoingTransaction(transaction_uid, self.db).build(
+            TransactionType.OUTGOING, 0, bytes(32),
+            state=OutgoingTransactionState.WAITING, sub_transactions=Codec.pack([]))
+        return OutgoingTransaction(transaction_uid, self.db)
+
+    def test_high_wallet_owner_uids(self):
+        # Wallet owner uids keep growing as owners are replaced
+        transaction = self.create_transaction()
+        transaction.confirm(1000)
+        transaction.confirm(3)
+        transaction.reject(2 ** 12)
+
+        transaction = OutgoingTransaction(transaction._uid, self.db)
+        self.assertTrue(transaction.has_confirmed(1000))
+        self.assertFalse(transaction.has_confirmed(999))
+        self.assertTrue(transaction.has_rejected(2 ** 12))
+        self.assertEqual(transaction.get_confirmations(), [3, 1000])
+        self.assertEqual(transaction.get_rejections(), [2 ** 12])
+        self.assertEqual(transaction.confirmations_count(), 2)
+        self.assertEqual(transaction.last_confirmer(), 3)
+
+        transaction.revoke(3)
+        self.assertEqual(transaction.get_confirmations(), [1000])
+        self.assertEqual(transaction.last_confirmer(), 1000)
+        transaction.revoke(2 ** 12)
+        self.assertEqual(transaction.get_rejections(), [])
+        self.assertEqual(transaction.last_rejecter(), 0)
+        self.assertEqual(transaction.serialize()['confirmations'], [1000])
+
+    def write_legacy_transaction(self) -> None:
+        """ Store a transaction in the layout used before the single records, one container per field """
+        VarDB('TRANSACTION_1_type_STATEDB_state', self.db, value_type=int).set(TransactionType.OUTGOING)
+        VarDB('TRANSACTION_1_created_timestamp', self.db, value_type=int).set(123)
+        VarDB('TRANSACTION_1_created_txhash', self.db, value_type=bytes).set(bytes([1] * 32))
+        name = 'OUTGOING_TRANSACTION_1'
+        VarDB(f'{name}_state_STATEDB_state', self.db, value_type=int).set(OutgoingTransactionState.WAITING)
+        for field, uids in (('sub_transactions', [1, 2]),
+                            ('confirmations_SETDB_BAGDB_items', [3, 1]),
+                            ('rejections_SETDB_BAGDB_items', [2])):
+            array = ArrayDB(f'{name}_{field}', self.db, value_type=int)
+            for uid in uids:
+                array.put(uid)
+        IdFactory(TransactionFactory._NAME, self.db).get_uid()
+
+    def test_read_legacy_transaction(self):
+        self.write_legacy_transaction()
+        transaction = OutgoingTransaction(1, self.db)
+
+        self.assertEqual(transaction._type.get(), TransactionType.OUTGOING)
+        self.assertEqual(transaction._state.get_name(), 'WAITING')
+        self.assertEqual(transaction.get_sub_transactions(), [1, 2])
+        self.assertEqual(transaction.get_confirmations(), [1, 3])
+        self.assertEqual(transaction.get_rejections(), [2])
+        self.assertEqual(transaction.last_confirmer(), 1)
+        serialized = transaction.serialize()
+        self.assertEqual(serialized['created_timestamp'], 123)
+        self.assertEqual(serialized['created_txhash'], '0x' + '01' * 32)
+
+    def test_modify_legacy_transaction(self):
+        self.write_legacy_transaction()
+        OutgoingTransaction(1, self.db).confirm(4)
+
+        # The whole transaction is moved to its single record, next to the uid of the factory
+        self.assertEqual(len(self.stored_keys()), 2)
+        transaction = OutgoingTransaction(1, self.db)
+        self.assertEqual(transaction.get_confirmations(), [1, 3, 4])
+        self.assertEqual(transaction.confirmations_count(), 3)
+        self.assertEqual(transaction.get_rejections(), [2])
+        self.assertEqual(transaction.get_sub_transactions(), [1, 2])
+        self.assertEqual(transaction._created_timestamp.get(), 123)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+from ICONSafe.scorelib import *
+from ICONSafe.tests.unit_utils import ICONSafeUnitTests
+
+
+class TestUnitPackedArray(ICONSafeUnitTests):
+
+    def test_put_across_chunks(self):
+        array = PackedIntArrayDB('array', self.db, chunk_size=4)
+        for value in range(10):
+            array.put(value * 1000)
+
+        self.assertEqual(len(array), 10)
+        self.assertEqual(list(array), [value * 1000 for value in range(10)])
+        self.assertEqual(array[5], 5000)
+        self.assertEqual(array[-1], 9000)
+        # Three chunks of up to four items
+        self.assertEqual(len(VarDB('array_PACKED_INT_ARRAYDB_2', self.db, value_type=bytes).get()), 2 * 8)
+        self.assertIsNone(VarDB('array_PACKED_INT_ARRAYDB_3', self.db, value_type=bytes).get())
+
+    def test_pop_until_empty(self):
+        array = PackedIntArrayDB('array', self.db, chunk_size=4)
+        for value in range(6):
+            array.put(value)
+
+        self.assertEqual([array.pop() for _ in range(3)], [5, 4, 3])
+        self.assertEqual(list(array), [0, 1, 2])
+        array.put(-7)
+        self.assertEqual(list(array), [0, 1, 2, -7])
+
+        while array.pop() is not None:
+            pass
+        self.assertEqual(len(array), 0)
+        self.assertEqual(list(array), [])
+        self.assertIsNone(VarDB('array_PACKED_INT_ARRAYDB_0', self.db, value_type=bytes).get())
+        self.assertIsNone(VarDB('array_PACKED_INT_ARRAYDB_size', self.db, value_type=bytes).get())
+
+    def test_set_and_contains(self):
+        array = PackedIntArrayDB('array', self.db, chunk_size=4)
+        for value in range(5):
+            array.put(value)
+
+        array[4] = 42
+        array[1] = -1
+        self.assertEqual(list(array), [0, -1, 2, 3, 42])
+        self.assertIn(42, array)
+        self.assertNotIn(4, array)
+        self.assertRaises(IndexError, array.__getitem__, 5)
+
+    def test_invalid_value(self):
+        array = PackedIntArrayDB('array', self.db, width=1)
+        self.assertRaises(InvalidPackedIntValue, array.put, 128)
+        self.assertRaises(InvalidPackedIntValue, array.put, 'value')
+        array.put(-128)
+        self.assertEqual(list(array), [-128])
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+from ICONSafe.scorelib import *
+from ICONSafe.tests.unit_utils import ICONSafeUnitTests
+
+
+class LegacyState:
+    # State class declared without @state_enum
+    UNINITIALIZED = 0
+    FIRST = 1
+    SECOND = 2
+
+
+class TestUnitState(ICONSafeUnitTests):
+
+    def test_legacy_maintenance_state(self):
+        # State written by the previous version
+        VarDB('SCORE_MAINTENANCE_MODE_STATEDB_state', self.db, value_type=int).set(IconScoreMaintenanceStatus.ENABLED)
+        state = StateDB('SCORE_MAINTENANCE_MODE', self.db, IconScoreMaintenanceStatus)
+
+        self.assertEqual(state.get(), IconScoreMaintenanceStatus.ENABLED)
+        self.assertEqual(state.get_name(), 'ENABLED')
+        state.check(IconScoreMaintenanceStatus.ENABLED)
+        self.assertRaises(InvalidState, state.check_not, IconScoreMaintenanceStatus.ENABLED)
+
+        state.set(IconScoreMaintenanceStatus.DISABLED)
+        self.assertEqual(VarDB('SCORE_MAINTENANCE_MODE_STATEDB_state', self.db, value_type=int).get(),
+                         IconScoreMaintenanceStatus.DISABLED)
+
+    def test_undecorated_state_class(self):
+        state = StateDB('state', self.db, LegacyState)
+        self.assertRaises(StateUninitialized, state.check_exists)
+        state.set(LegacyState.SECOND)
+        self.assertEqual(state.get_name(), 'SECOND')
+        self.assertEqual(Utils.get_enum_name(LegacyState, LegacyState.FIRST), 'FIRST')
+        self.assertEqual(LegacyState._STATE_NAMES, ('UNINITIALIZED', 'FIRST', 'SECOND'))
+        self.assertEqual(Utils.enum_names(LegacyState), ['UNINITIALIZED', 'FIRST', 'SECOND'])
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from iconservice import *
+from tbears.libs.scoretest.patch.context import Context
+
+from ICONSafe.scorelib import *
+from ICONSafe.tests.unit_utils import ICONSafeUnitTests
+from ICONSafe.transaction_manager.sub_outgoing_transaction import *
+
+PARAMS = [
+    {'name': '_to', 'type': 'Address', 'value': 'hx' + '1' * 40},
+    {'name': '_value', 'type': 'int', 'value': '0x10'},
+    {'name': '_data', 'type': 'bytes', 'value': '0x1234'},
+    {'name': '_memo', 'type': 'str', 'value': 'memo'},
+    {'name': '_flag', 'type': 'bool', 'value': '0x1'}
+]
+
+
+class TestUnitSubOutgoingTransaction(ICONSafeUnitTests):
+
+    def setUp(self):
+        super().setUp()
+        # json_loads only charges steps from revision 3, the mocked context has no step counter
+        Context.get_context().revision = 0
+
+        # Sub transaction stored before the single records and the compiled params, one VarDB per field
+        name = 'SUB_OUTGOING_TRANSACTION_1'
+        VarDB(f'{name}_destination', self.db, value_type=Address).set(Address.from_string('cx' + '2' * 40))
+        VarDB(f'{name}_method_name', self.db, value_type=str).set('transfer')
+        VarDB(f'{name}_params', self.db, value_type=str).set(json.dumps(PARAMS))
+        VarDB(f'{name}_amount', self.db, value_type=int).set(0)
+        VarDB(f'{name}_description', self.db, value_type=str).set('description')
+
+    def test_convert_legacy_params(self):
+        sub_transaction = SubOutgoingTransaction(1, self.db)
+        self.assertIsNone(sub_transaction._compiled_params.get())
+
+        params = sub_transaction.convert_params()
+        self.assertEqual(params, {
+            '_to': Address.from_string('hx' + '1' * 40),
+            '_value': 16,
+            '_data': b'\x12\x34',
+            '_memo': 'memo',
+            '_flag': True
+        })
+        # The compiled params are decoded to the same values
+        compiled_params = SubOutgoingTransactionFactory._compile_params(PARAMS)
+        self.assertEqual(SubOutgoingTransaction._decode_params(compiled_params), params)
+
+    def test_migrate_legacy_params(self):
+        # The sub transaction is moved to its single record on its next write
+        SubOutgoingTransaction(1, self.db)._description.set('description')
+        self.assertIsNone(VarDB('SUB_OUTGOING_TRANSACTION_1_params', self.db, value_type=bytes).get())
+
+        sub_transaction = SubOutgoingTransaction(1, self.db)
+        self.assertEqual(sub_transaction.convert_params()['_value'], 16)
+        self.assertEqual(sub_transaction.serialize()['params'], json.dumps(PARAMS))
+        self.assertEqual(sub_transaction.serialize()['description'], 'description')
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+from ICONSafe.scorelib import *
+from ICONSafe.tests.unit_utils import ICONSafeUnitTests
+
+
+class TestUnitUnrolledList(ICONSafeUnitTests):
+
+    def legacy_list(self, uids: list) -> UIDLinkedListDB:
+        legacy = UIDLinkedListDB('legacy', self.db)
+        for uid in uids:
+            legacy.append(uid)
+        return legacy
+
+    def test_migration_across_writes(self):
+        legacy = self.legacy_list(range(1, 11))
+        uids = UnrolledUIDListDB('list', self.db, capacity=4, legacy_key='legacy')
+        self.assertEqual(list(uids), list(range(1, 11)))
+
+        # Each write moves four legacy uids to the chunks
+        uids.append(11)
+        self.assertEqual(len(legacy), 6)
+        uids.append(12)
+        self.assertEqual(len(legacy), 2)
+        self.assertEqual(list(uids), list(range(1, 13)))
+        self.assertEqual(list(reversed(uids)), list(range(12, 0, -1)))
+
+        uids.append(13)
+        self.assertEqual(len(legacy), 0)
+        uids = UnrolledUIDListDB('list', self.db, capacity=4, legacy_key='legacy')
+        self.assertIsNone(uids._legacy())
+        self.assertEqual(list(uids), list(range(1, 14)))
+        self.assertEqual(len(uids), 13)
+
+    def test_migration_legacy_last(self):
+        # The new items of a list iterated from its head are prepended
+        legacy = self.legacy_list(range(10, 0, -1))
+        uids = UnrolledUIDListDB('list', self.db, capacity=4, legacy_key='legacy', legacy_first=False)
+
+        uids.prepend(11)
+        self.assertEqual(len(legacy), 6)
+        self.assertEqual(list(uids), list(range(11, 0, -1)))
+        self.assertEqual(uids.head_value(), 11)
+        self.assertEqual(uids.tail_value(), 1)
+        self.assertEqual(uids.select_page(5), ([5, 4, 3, 2, 1], 0, False))
+
+    def test_remove_during_migration(self):
+        legacy = self.legacy_list(range(1, 11))
+        uids = UnrolledUIDListDB('list', self.db, capacity=4, legacy_key='legacy')
+
+        # The removal moves 7 to 10 to the chunks, then removes 9 from them and 2 from the legacy list
+        uids.remove(9)
+        uids.remove(2)
+        self.assertEqual(len(legacy), 1)
+        self.assertEqual(list(uids), [1, 3, 4, 5, 6, 7, 8, 10])
+        self.assertEqual(len(uids), 8)
+        self.assertRaises(LinkedNodeNotFound, uids.remove, 9)
+
+        uids.remove(1)
+        self.assertIsNone(uids._legacy())
+        self.assertEqual(list(uids), [3, 4, 5, 6, 7, 8, 10])
+
+    def test_chunk_merge(self):
+        uids = UnrolledUIDListDB('list', self.db, capacity=4)
+        for uid in range(1, 9):
+            uids.append(uid)
+        self.assertEqual((uids._head, uids._tail), (1, 2))
+
+        # Neighbour chunks are merged once their uids fit in half a chunk
+        for uid in (1, 2, 3, 6, 7):
+            uids.remove(uid)
+        self.assertEqual((uids._head, uids._tail), (1, 2))
+        uids.remove(8)
+        self.assertEqual((uids._head, uids._tail), (1, 1))
+        self.assertEqual(list(uids), [4, 5])
+        self.assertEqual(uids._index[5], 1)
+        self.assertIsNone(VarDB('list_UNROLLED_UID_LISTDB_chunk_2', self.db, value_type=bytes).get())
+
+        uids.append(9)
+        self.assertEqual(list(reversed(uids)), [9, 5, 4])
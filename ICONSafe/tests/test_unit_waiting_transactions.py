@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from tbears.libs.scoretest.patch.context import Context
+from tbears.libs.scoretest.score_test_case import ScoreTestCase
+
+from ICONSafe.main import ICONSafe
+from ICONSafe.scorelib import *
+from ICONSafe.transaction_manager.transaction_factory import *
+
+
+class TestUnitWaitingTransactions(ScoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.owners = [self.test_account1, self.test_account2]
+        self.score = self.get_score_instance(ICONSafe, self.genesis_address, on_install_params={
+            'owners': [{'address': str(owner), 'name': 'owner'} for owner in self.owners],
+            'owners_required': 2})
+
+        wallet_owner_uid = self.score.get_wallet_owner_uid(self.test_account2)
+
+        # Allow the writes outside of a SCORE method
+        context = Context.get_context()
+        Context._set_invoke_context(context)
+        context.current_address = self.score.address
+
+        # Waiting transactions created before the indexes are only in the waiting transactions list
+        for _ in range(3):
+            self.score._waiting_transactions.append(self.create_transaction())
+        OutgoingTransaction(2, self.score.db).confirm(wallet_owner_uid)
+        self.score.on_update_transaction_manager()
+
+    def create_transaction(self) -> int:
+        transaction_uid = IdFactory(TransactionFactory._NAME, self.score.db).get_uid()
+        OutgoingTransaction(transaction_uid, self.score.db).build(
+            TransactionType.OUTGOING, 0, bytes(32),
+            state=OutgoingTransactionState.WAITING, sub_transactions=Codec.pack([]))
+        return transaction_uid
+
+    def submit_transaction(self) -> None:
+        transaction_uid = self.create_transaction()
+        self.score._add_waiting_transaction(OutgoingTransaction(transaction_uid, self.score.db))
+
+    def pending_transactions(self, owner) -> list:
+        wallet_owner_uid = self.score.get_wallet_owner_uid(owner)
+        return [transaction['uid'] for transaction in self.score.get_pending_transactions_for_owner(wallet_owner_uid)]
+
+    def test_pending_transactions_before_indexing(self):
+        self.assertFalse(self.score.is_waiting_transactions_indexed())
+        self.assertEqual(self.pending_transactions(self.test_account1), [1, 2, 3])
+        self.assertEqual(self.pending_transactions(self.test_account2), [1, 3])
+
+        wallet_owner_uid = self.score.get_wallet_owner_uid(self.test_account2)
+        self.assertEqual(self.score.get_pending_transactions_for_owner_count(wallet_owner_uid), 2)
+
+    def test_index_in_batches(self):
+        self.set_msg(self.test_account1)
+        self.score.index_waiting_transactions(2)
+        self.assertFalse(self.score.is_waiting_transactions_indexed())
+        self.score.index_waiting_transactions(2)
+        self.assertTrue(self.score.is_waiting_transactions_indexed())
+
+        # Only the participation indexes are read from now on
+        self.assertEqual(self.pending_transactions(self.test_account1), [1, 2, 3])
+        self.assertEqual(self.pending_transactions(self.test_account2), [1, 3])
+        self.assertEqual(list(self.score._waiting_transactions_confirmed(0)), [3, 1])
+        self.assertEqual(list(self.score._waiting_transactions_confirmed(1)), [2])
+
+    def test_write_during_indexing(self):
+        # Transactions touched before being reached are indexed first
+        self.set_msg(self.test_account1)
+        self.score.confirm_transaction(1)
+        self.submit_transaction()
+        self.assertEqual(self.score._unindexed_waiting_transactions.get(), 0)
+
+        self.assertEqual(self.pending_transactions(self.test_account1), [2, 3, 4])
+        self.assertEqual(self.pending_transactions(self.test_account2), [3, 1, 4])
+        self.assertEqual(list(self.score._waiting_transactions_confirmed(1)), [1, 2])
+
+    def test_owners_required_change_during_indexing(self):
+        self.set_msg(self.test_account1)
+        self.score.reject_transaction(3)
+        self.set_msg(self.test_account2)
+        self.score.reject_transaction(3)
+        self.assertEqual(list(self.score._rejected_transactions), [3])
+
+        self.set_msg(self.score.address)
+        self.score.set_wallet_owners_required(1)
+        self.assertEqual(list(self.score._waiting_transactions), [1])
+        self.assertEqual(list(self.score._executed_transactions), [2])
+
+    def wallet_owner_keys(self, wallet_owner_uid: int) -> list:
+        name = f'_pending_transactions_{wallet_owner_uid}_'.encode()
+        return [key for key in self.score.db._context_db._db if name in key]
+
+    def add_wallet_owner_after_transactions(self, owner: Address) -> None:
+        # More waiting transactions than a single batch
+        self.set_msg(self.test_account1)
+        self.score.index_waiting_transactions(10)
+        for _ in range(6):
+            self.submit_transaction()
+
+        self.set_msg(self.score.address)
+        self.score.add_wallet_owner(owner, 'owner')
+
+    def test_wallet_owner_addition_in_batches(self):
+        owner = Address.from_string('hx' + '3' * 40)
+        self.add_wallet_owner_after_transactions(owner)
+        wallet_owner_uid = self.score.get_wallet_owner_uid(owner)
+        self.assertFalse(self.score.is_waiting_transactions_indexed())
+        self.assertEqual(len(self.score._pending_transactions(wallet_owner_uid)), MAX_GARBAGE_COLLECTION_LOOP)
+
+        # The transactions not indexed yet are filtered from the waiting transactions
+        waiting = [transaction_uid for transaction_uid in self.score._waiting_transactions]
+        pending = self.score.get_pending_transactions_for_owner(wallet_owner_uid)
+        self.assertEqual([transaction['uid'] for transaction in pending], waiting)
+
+        # Confirm a transaction that isn't indexed yet
+        self.set_msg(owner)
+        self.score.confirm_transaction(1)
+
+        self.set_msg(self.test_account1)
+        self.score.index_waiting_transactions(3)
+        self.assertFalse(self.score.is_waiting_transactions_indexed())
+        self.score.index_waiting_transactions(3)
+        self.assertTrue(self.score.is_waiting_transactions_indexed())
+        self.assertEqual(list(self.score._pending_transactions(wallet_owner_uid)), waiting[1:])
+
+    def test_wallet_owner_removal_in_batches(self):
+        self.add_wallet_owner_after_transactions(Address.from_string('hx' + '3' * 40))
+        wallet_owner_uid = self.score.get_wallet_owner_uid(self.test_account2)
+        self.score.remove_wallet_owner(wallet_owner_uid)
+        self.assertNotEqual(self.wallet_owner_keys(wallet_owner_uid), [])
+
+        self.set_msg(self.test_account1)
+        while not self.score.is_waiting_transactions_indexed():
+            self.score.index_waiting_transactions(3)
+        self.assertEqual(self.wallet_owner_keys(wallet_owner_uid), [])
+
+    def test_wallet_owner_addition_older_transactions_removed(self):
+        owner = Address.from_string('hx' + '3' * 40)
+        self.add_wallet_owner_after_transactions(owner)
+        wallet_owner_uid = self.score.get_wallet_owner_uid(owner)
+
+        # The transactions left to index are no longer waiting
+        for transaction_uid in range(1, self.score._unindexed_pending_transactions[wallet_owner_uid] + 1):
+            self.score._remove_waiting_transaction(OutgoingTransaction(transaction_uid, self.score.db))
+
+        self.set_msg(self.test_account1)
+        self.score.index_waiting_transactions(1)
+        self.assertTrue(self.score.is_waiting_transactions_indexed())
+        self.assertEqual(list(self.score._pending_transactions(wallet_owner_uid)), [6, 7, 8, 9])
+
+    def test_execute_transaction_without_cache(self):
+        # A call without a database cache isn't recorded as a failed execution
+        self.score._wallet_owners_required.set(1)
+        with self.assertRaises(AttributeError):
+            self.score.try_execute_transaction(2)
+        self.assertEqual(OutgoingTransaction(2, self.score.db)._state.get(), OutgoingTransactionState.WAITING)
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from tbears.libs.scoretest.score_test_case import ScoreTestCase
+from tbears.libs.scoretest.patch.context import Context
+from tbears.libs.scoretest.patch.score_patcher import ScorePatcher
+
+
+class ICONSafeUnitTests(ScoreTestCase):
+    """ Unit tests of the SCORE storage, working on an in-memory SCORE database """
+
+    def setUp(self):
+        super().setUp()
+        self.db = ScorePatcher.get_score_db()
+        # Allow the writes outside of a SCORE method
+        context = Context.get_context()
+        Context._set_invoke_context(context)
+        context.current_address = self.db.address
+
+    def stored_keys(self) -> list:
+        """ Returns the keys stored in the database of the SCORE """
+        prefix = self.db.address.to_bytes()
+        return [key for key in self.db._context_db._db if key.startswith(prefix)]
@@ -32,11 +32,10 @@ class IncomingTransactionFactory:
                amount: int) -> int:
 
         transaction = IncomingTransaction(transaction_uid, db)
-        transaction.build(TransactionType.INCOMING, timestamp, txhash)
-
-        transaction._token.set(token)
-        transaction._source.set(source)
-        transaction._amount.set(amount)
+        transaction.build(TransactionType.INCOMING, timestamp, txhash,
+                          token=token,
+                          source=source,
+                          amount=amount)
 
         return transaction_uid
 
@@ -45,16 +44,23 @@ class IncomingTransaction(Transaction):
 
     _NAME = 'INCOMING_TRANSACTION'
 
+    _FIELDS = Transaction._FIELDS + [
+        ('token', Address),
+        ('source', Address),
+        ('amount', int)
+    ]
+
     # ================================================
-    #  Initialization
+    #  Legacy
     # ================================================
-    def __init__(self, uid: int, db: IconScoreDatabase):
-        super().__init__(uid, db)
-        name = f"{IncomingTransaction._NAME}_{uid}"
-        self._token = VarDB(f"{name}_token", db, value_type=Address)
-        self._source = VarDB(f"{name}_source", db, value_type=Address)
-        self._amount = VarDB(f"{name}_amount", db, value_type=int)
-        self._db = db
+    def _legacy_fields(self) -> dict:
+        name = f"{IncomingTransaction._NAME}_{self._uid}"
+        return {
+            **super()._legacy_fields(),
+            'token': VarDB(f"{name}_token", self._db, value_type=Address),
+            'source': VarDB(f"{name}_source", self._db, value_type=Address),
+            'amount': VarDB(f"{name}_amount", self._db, value_type=int)
+        }
 
     # ================================================
     #  Internal methods
@@ -33,6 +33,7 @@ class OutgoingTransactionHasParticipation(Exception):
     pass
 
 
+@state_enum
 class OutgoingTransactionState:
     UNINITIALIZED = 0
     WAITING = 1
@@ -59,14 +60,15 @@ class OutgoingTransactionFactory:
         sub_transactions = OutgoingTransactionFactory._convert_sub_transactions(sub_transactions)
 
         # --- OK from here ---
-        transaction = OutgoingTransaction(transaction_uid, db)
-        transaction.build(TransactionType.OUTGOING, timestamp, txhash)
-
-        transaction._state.set(OutgoingTransactionState.WAITING)
+        # Reserve the uids of all the sub transactions at once
+        sub_transactions_uid = IdFactory(SubOutgoingTransactionFactory._NAME, db).reserve(len(sub_transactions))
+        for sub_transaction, sub_transaction_uid in zip(sub_transactions, sub_transactions_uid):
+            SubOutgoingTransactionFactory.create(db, sub_transaction, sub_transaction_uid)
 
-        for sub_transaction in sub_transactions:
-            sub_transaction_uid = SubOutgoingTransactionFactory.create(db, sub_transaction)
-            transaction._sub_transactions.put(sub_transaction_uid)
+        transaction = OutgoingTransaction(transaction_uid, db)
+        transaction.build(TransactionType.OUTGOING, timestamp, txhash,
+                          state=OutgoingTransactionState.WAITING,
+                          sub_transactions=Codec.pack(list(sub_transactions_uid)))
 
         return transaction_uid
 
@@ -75,23 +77,99 @@ class OutgoingTransaction(Transaction):
 
     _NAME = 'OUTGOING_TRANSACTION'
 
+    _FIELDS = Transaction._FIELDS + [
+        ('state', int),
+        # Packed list of the sub transactions uids
+        ('sub_transactions', bytes),
+        ('executed_timestamp', int),
+        ('executed_txhash', bytes),
+        # Confirmations and rejections bitmasks indexed by wallet owner uid.
+        # Uids are never reused, so a mask takes a bit per owner ever added up to its participants
+        ('confirmations', int),
+        ('rejections', int),
+        ('confirmations_count', int),
+        ('rejections_count', int),
+        ('last_confirmer', int),
+        ('last_rejecter', int)
+    ]
+
     # ================================================
-    #  Initialization
+    #  Fields
     # ================================================
-    def __init__(self, uid: int, db: IconScoreDatabase):
-        super().__init__(uid, db)
-        name = f"{OutgoingTransaction._NAME}_{uid}"
-        self._confirmations = SetDB(f"{name}_confirmations", db, value_type=int, order=True)
-        self._rejections = SetDB(f"{name}_rejections", db, value_type=int, order=True)
-        self._state = StateDB(f"{name}_state", db, value_type=OutgoingTransactionState)
-        self._sub_transactions = ArrayDB(f"{name}_sub_transactions", db, value_type=int)
-        self._executed_timestamp = VarDB(f"{name}_executed_timestamp", db, value_type=int)
-        self._executed_txhash = VarDB(f"{name}_executed_txhash", db, value_type=bytes)
-        self._db = db
+    @property
+    def _state(self) -> StateDB:
+        name = f"{OutgoingTransaction._NAME}_{self._uid}"
+        return StateDB(f"{name}_state", self._db, value_type=OutgoingTransactionState, field=self._record.field('state'))
+
+    # ================================================
+    #  Legacy
+    # ================================================
+    def _legacy_fields(self) -> dict:
+        name = f"{OutgoingTransaction._NAME}_{self._uid}"
+        return {
+            **super()._legacy_fields(),
+            'state': VarDB(f"{name}_state{StateDB._NAME}_state", self._db, value_type=int),
+            'executed_timestamp': VarDB(f"{name}_executed_timestamp", self._db, value_type=int),
+            'executed_txhash': VarDB(f"{name}_executed_txhash", self._db, value_type=bytes)
+        }
+
+    def _legacy_containers(self) -> tuple:
+        """ Sub transactions and participations were previously stored in their own containers """
+        name = f"{OutgoingTransaction._NAME}_{self._uid}"
+        return (
+            ArrayDB(f"{name}_sub_transactions", self._db, value_type=int),
+            SetDB(f"{name}_confirmations", self._db, value_type=int, order=True),
+            SetDB(f"{name}_rejections", self._db, value_type=int, order=True)
+        )
+
+    def _load_legacy(self) -> dict:
+        result = super()._load_legacy()
+        if result is None:
+            return None
+
+        sub_transactions, confirmations, rejections = self._legacy_containers()
+        result['sub_transactions'] = Codec.pack(list(sub_transactions))
+
+        # Participations were stored in two ordered sets of wallet owner uids
+        result['confirmations'] = result['rejections'] = 0
+        result['confirmations_count'] = result['rejections_count'] = 0
+        result['last_confirmer'] = result['last_rejecter'] = 0
+
+        for wallet_owner_uid in confirmations:
+            result['confirmations'] |= 1 << wallet_owner_uid
+            result['confirmations_count'] += 1
+            result['last_confirmer'] = wallet_owner_uid
+
+        for wallet_owner_uid in rejections:
+            result['rejections'] |= 1 << wallet_owner_uid
+            result['rejections_count'] += 1
+            result['last_rejecter'] = wallet_owner_uid
+
+        return result
+
+    def _remove_legacy(self) -> None:
+        super()._remove_legacy()
+        sub_transactions, confirmations, rejections = self._legacy_containers()
+
+        Utils.remove_array(sub_transactions)
+        confirmations.delete()
+        rejections.delete()
 
     # ================================================
     #  Private methods
     # ================================================
+    @staticmethod
+    def _mask_to_uids(mask: int) -> list:
+        result = []
+
+        # Only visit the bits set
+        while mask:
+            lowest = mask & -mask
+            result.append(lowest.bit_length() - 1)
+            mask ^= lowest
+
+        return result
+
     def _has_participated(self, wallet_owner_uid: int) -> bool:
         return (self.has_confirmed(wallet_owner_uid) or self.has_rejected(wallet_owner_uid))
 
@@ -107,29 +185,93 @@ class OutgoingTransaction(Transaction):
             raise OutgoingTransactionAlreadyParticipated(self._name, wallet_owner_uid)
 
     def check_no_participation(self) -> None:
-        if (len(self._confirmations) != 0 or len(self._rejections) != 0):
+        if (self.confirmations_count() != 0 or self.rejections_count() != 0):
             raise OutgoingTransactionHasParticipation(self._name)
 
     def has_confirmed(self, wallet_owner_uid: int) -> bool:
-        return wallet_owner_uid in self._confirmations
+        return bool(self._record.get('confirmations') & (1 << wallet_owner_uid))
 
     def has_rejected(self, wallet_owner_uid: int) -> bool:
-        return wallet_owner_uid in self._rejections
+        return bool(self._record.get('rejections') & (1 << wallet_owner_uid))
+
+    # ================================================
+    #  Participation
+    # ================================================
+    def confirm(self, wallet_owner_uid: int) -> None:
+        self._record.update({
+            'confirmations': self._record.get('confirmations') | (1 << wallet_owner_uid),
+            'confirmations_count': self._record.get('confirmations_count') + 1,
+            'last_confirmer': wallet_owner_uid
+        })
+
+    def reject(self, wallet_owner_uid: int) -> None:
+        self._record.update({
+            'rejections': self._record.get('rejections') | (1 << wallet_owner_uid),
+            'rejections_count': self._record.get('rejections_count') + 1,
+            'last_rejecter': wallet_owner_uid
+        })
+
+    def revoke(self, wallet_owner_uid: int) -> None:
+        if self.has_confirmed(wallet_owner_uid):
+            self._record.update({
+                'confirmations': self._record.get('confirmations') & ~(1 << wallet_owner_uid),
+                'confirmations_count': self._record.get('confirmations_count') - 1,
+                'last_confirmer': 0 if self._record.get('last_confirmer') == wallet_owner_uid
+                else self._record.get('last_confirmer')
+            })
+        elif self.has_rejected(wallet_owner_uid):
+            self._record.update({
+                'rejections': self._record.get('rejections') & ~(1 << wallet_owner_uid),
+                'rejections_count': self._record.get('rejections_count') - 1,
+                'last_rejecter': 0 if self._record.get('last_rejecter') == wallet_owner_uid
+                else self._record.get('last_rejecter')
+            })
+
+    def confirmations_count(self) -> int:
+        return self._record.get('confirmations_count')
+
+    def rejections_count(self) -> int:
+        return self._record.get('rejections_count')
+
+    def last_confirmer(self) -> int:
+        """ Returns the last wallet owner who confirmed the transaction.
+            If that confirmation has been revoked, returns the highest confirmer uid """
+        confirmations = self._record.get('confirmations')
+        return self._record.get('last_confirmer') or max(confirmations.bit_length() - 1, 0)
+
+    def last_rejecter(self) -> int:
+        """ Returns the last wallet owner who rejected the transaction.
+            If that rejection has been revoked, returns the highest rejecter uid """
+        rejections = self._record.get('rejections')
+        return self._record.get('last_rejecter') or max(rejections.bit_length() - 1, 0)
+
+    def get_confirmations(self) -> list:
+        return OutgoingTransaction._mask_to_uids(self._record.get('confirmations'))
+
+    def get_rejections(self) -> list:
+        return OutgoingTransaction._mask_to_uids(self._record.get('rejections'))
+
+    def get_sub_transactions(self) -> list:
+        return [
+            Codec.decode_value(payload, int)
+            for payload in Codec.split(self._record.get('sub_transactions') or b'')
+        ]
 
     # ================================================
     #  Internal methods
     # ================================================
     def serialize(self) -> dict:
         result = super().serialize()
+        executed_txhash = self._executed_txhash.get()
         return {
             **result,
-            "confirmations": list(self._confirmations),
-            "rejections": list(self._rejections),
+            "confirmations": self.get_confirmations(),
+            "rejections": self.get_rejections(),
             "state": self._state.get_name(),
             "sub_transactions": [
                 SubOutgoingTransaction(sub_transaction_uid, self._db).serialize()
-                for sub_transaction_uid in self._sub_transactions
+                for sub_transaction_uid in self.get_sub_transactions()
             ],
             "executed_timestamp": self._executed_timestamp.get(),
-            "executed_txhash": f"0x{bytes.hex(self._executed_txhash.get())}" if self._executed_txhash.get() else "None"
+            "executed_txhash": f"0x{bytes.hex(executed_txhash)}" if executed_txhash else "None"
         }
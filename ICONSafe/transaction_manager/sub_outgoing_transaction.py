@@ -41,13 +41,24 @@ class SubOutgoingTransactionFactory:
     #  Checks
     # ================================================
     @staticmethod
-    def _check_params_format_convertible(params: List[TransactionParam]):
+    def _compile_params(params: List[TransactionParam]) -> bytes:
+        """ Convert the params once, and pack their typed values in a single record.
+            The first field contains the type of each param, followed by their names and values """
+        types = bytearray()
+        fields = []
+
         for param in params:
-            ScoreTypeConverter.convert(param["type"], param["value"])
+            value = ScoreTypeConverter.convert(param["type"], param["value"])
+            types.append(SubOutgoingTransaction._PARAM_TYPES.index(type(value)))
+            fields += [param["name"], value]
+
+        return Codec.pack([bytes(types)] + fields)
 
     @staticmethod
     def create(db: IconScoreDatabase,
-               params: SubOutgoingTransactionParam) -> int:
+               params: SubOutgoingTransactionParam,
+               uid: int = None) -> int:
+        """ Create a sub transaction, with a uid previously reserved if specified """
 
         destination: Address = Address.from_string(params['destination'])
         method_name: str = params['method_name']
@@ -56,50 +67,95 @@ class SubOutgoingTransactionFactory:
         description: str = params['description']
 
         # --- Checks ---
+        compiled_params = None
         if tx_params:
-            SubOutgoingTransactionFactory._check_params_format_convertible(json_loads(tx_params))
+            compiled_params = SubOutgoingTransactionFactory._compile_params(json_loads(tx_params))
 
         if not destination.is_contract and (method_name or tx_params):
             raise IconScoreException("Cannot set a method name or params to a EOA transfer transaction")
 
         # --- OK from here ---
-        uid = IdFactory(SubOutgoingTransactionFactory._NAME, db).get_uid()
+        if uid is None:
+            uid = IdFactory(SubOutgoingTransactionFactory._NAME, db).get_uid()
 
         sub_tx = SubOutgoingTransaction(uid, db)
-        sub_tx._destination.set(destination)
-        sub_tx._method_name.set(method_name)
-        sub_tx._params.set(tx_params)
-        sub_tx._amount.set(amount)
-        sub_tx._description.set(description)
+        sub_tx._record.create({
+            'destination': destination,
+            'method_name': method_name,
+            'params': tx_params,
+            'amount': amount,
+            'description': description,
+            'compiled_params': compiled_params
+        })
 
         return uid
 
 
-class SubOutgoingTransaction:
+class SubOutgoingTransaction(EntityDB):
 
     _NAME = 'SUB_OUTGOING_TRANSACTION'
+    # Types of the compiled params, indexed by their code
+    _PARAM_TYPES = [int, str, bool, Address, bytes]
+
+    _FIELDS = [
+        ('destination', Address),
+        ('method_name', str),
+        ('params', str),
+        ('amount', int),
+        ('description', str),
+        ('compiled_params', bytes)
+    ]
+
+    _LEGACY_FIELD = 'destination'
+    _NAMESPACE = 2
 
     # ================================================
     #  Initialization
     # ================================================
     def __init__(self, uid: int, db: IconScoreDatabase):
-        name = f"{SubOutgoingTransaction._NAME}_{uid}"
-        self._destination = VarDB(f"{name}_destination", db, value_type=Address)
-        self._method_name = VarDB(f"{name}_method_name", db, value_type=str)
-        self._params = VarDB(f"{name}_params", db, value_type=str)
-        self._amount = VarDB(f"{name}_amount", db, value_type=int)
-        self._description = VarDB(f"{name}_description", db, value_type=str)
+        super().__init__(f"{SubOutgoingTransaction._NAME}_{uid}", db, uid)
+
+    # ================================================
+    #  Legacy
+    # ================================================
+    def _legacy_fields(self) -> dict:
+        # The compiled params didn't exist before the record layout
+        fields = super()._legacy_fields()
+        del fields['compiled_params']
+        return fields
 
     # ================================================
     #  Internal methods
     # ================================================
     def convert_params(self) -> dict:
+        compiled_params = self._compiled_params.get()
+        if compiled_params is not None:
+            return SubOutgoingTransaction._decode_params(compiled_params)
+
+        # Sub transactions created before the compiled params are converted from their JSON params
         params = {}
         if self._params.get() != "":
             for param in json_loads(self._params.get()):
                 params[param["name"]] = ScoreTypeConverter.convert(param["type"], param["value"])
         return params
 
+    @staticmethod
+    def _decode_params(compiled_params: bytes) -> dict:
+        types = Codec.unpack(compiled_params, [bytes])[0] or b''
+        value_types = [bytes]
+        for code in types:
+            value_types += [str, SubOutgoingTransaction._PARAM_TYPES[code]]
+
+        fields = Codec.unpack(compiled_params, value_types)
+        params = {}
+        for index in range(1, len(fields), 2):
+            value = fields[index + 1]
+            # Empty bytes are decoded as None
+            if value is None and value_types[index + 1] == bytes:
+                value = b''
+            params[fields[index]] = value
+        return params
+
     def serialize(self) -> dict:
         return {
             "destination": str(self._destination.get()),
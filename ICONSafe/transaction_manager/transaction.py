@@ -16,43 +16,74 @@
 
 from iconservice import *
 
+from ..scorelib.entity import *
 from ..scorelib.state import *
 
 
+@state_enum
 class TransactionType:
     UNINITIALIZED = 0
     OUTGOING = 1
     INCOMING = 2
 
 
-class Transaction:
+class Transaction(EntityDB):
 
     _NAME = 'TRANSACTION'
 
+    # Fields of the transaction record, subclasses append their own fields
+    _FIELDS = [
+        ('type', int),
+        ('created_timestamp', int),
+        ('created_txhash', bytes)
+    ]
+    _LEGACY_FIELD = 'type'
+    _NAMESPACE = 1
+
     # ================================================
     #  Initialization
     # ================================================
     def __init__(self, uid: int, db: IconScoreDatabase):
         name = f"{Transaction._NAME}_{uid}"
-        self._type = StateDB(f"{name}_type", db, value_type=TransactionType)
-        self._created_timestamp = VarDB(f"{name}_created_timestamp", db, value_type=int)
-        self._created_txhash = VarDB(f"{name}_created_txhash", db, value_type=bytes)
+        super().__init__(name, db, uid)
         self._uid = uid
         self._name = name
-        self._db = db
 
-    def build(self, txtype: int, timestamp: int, created_txhash: bytes) -> None:
-        self._type.set(txtype)
-        self._created_timestamp.set(timestamp)
-        self._created_txhash.set(created_txhash)
+    def build(self, txtype: int, timestamp: int, created_txhash: bytes, **fields) -> None:
+        self._record.create({
+            'type': txtype,
+            'created_timestamp': timestamp,
+            'created_txhash': created_txhash,
+            **fields
+        })
+
+    # ================================================
+    #  Fields
+    # ================================================
+    @property
+    def _type(self) -> StateDB:
+        return StateDB(f"{self._name}_type", self._db, value_type=TransactionType, field=self._record.field('type'))
+
+    # ================================================
+    #  Legacy
+    # ================================================
+    def _legacy_fields(self) -> dict:
+        """ Transactions created before the record layout stored each field in its own VarDB """
+        name = f"{Transaction._NAME}_{self._uid}"
+        return {
+            'type': VarDB(f"{name}_type{StateDB._NAME}_state", self._db, value_type=int),
+            'created_timestamp': VarDB(f"{name}_created_timestamp", self._db, value_type=int),
+            'created_txhash': VarDB(f"{name}_created_txhash", self._db, value_type=bytes)
+        }
 
     # ================================================
     #  Internal methods
     # ================================================
     def serialize(self) -> dict:
+        created_txhash = self._created_txhash.get()
         return {
             "uid": self._uid,
             "type": self._type.get_name(),
-            "created_txhash": f"0x{bytes.hex(self._created_txhash.get())}" if self._created_txhash.get() else "None",
+            "created_txhash": f"0x{bytes.hex(created_txhash)}" if created_txhash else "None",
             "created_timestamp": self._created_timestamp.get()
         }
@@ -44,3 +44,15 @@ class TransactionFactory:
             return IncomingTransactionFactory.create(db, transaction_uid, txhash, timestamp, *args)
         else:
             raise InvalidTransactionType(TransactionFactory._NAME, transaction_type)
+
+    @staticmethod
+    def get(db: IconScoreDatabase, transaction_uid: int) -> Transaction:
+        """ Build the transaction of a given uid with its concrete type """
+        transaction_type = Transaction(transaction_uid, db)._type.get()
+
+        if transaction_type == TransactionType.OUTGOING:
+            return OutgoingTransaction(transaction_uid, db)
+        elif transaction_type == TransactionType.INCOMING:
+            return IncomingTransaction(transaction_uid, db)
+        else:
+            raise InvalidTransactionType(TransactionFactory._NAME, transaction_type)
@@ -43,16 +43,56 @@ class TransactionManager:
         return UIDLinkedListDB(f'{TransactionManager._NAME}_waiting_transactions', self.db)
 
     @property
-    def _executed_transactions(self) -> UIDLinkedListDB:
-        return UIDLinkedListDB(f'{TransactionManager._NAME}_executed_transactions', self.db)
+    def _executed_transactions(self) -> UnrolledUIDListDB:
+        name = f'{TransactionManager._NAME}_executed_transactions'
+        return UnrolledUIDListDB(name, self.db, legacy_key=name)
 
     @property
     def _rejected_transactions(self) -> UIDLinkedListDB:
         return UIDLinkedListDB(f'{TransactionManager._NAME}_rejected_transactions', self.db)
 
     @property
-    def _all_transactions(self) -> UIDLinkedListDB:
-        return UIDLinkedListDB(f'{TransactionManager._NAME}_all_transactions', self.db)
+    def _all_transactions(self) -> UnrolledUIDListDB:
+        name = f'{TransactionManager._NAME}_all_transactions'
+        return UnrolledUIDListDB(name, self.db, legacy_key=name)
+
+    @property
+    def _cancelled_transactions(self) -> BitmapDB:
+        """ Uids of the transactions cancelled, skipped when listing the transactions by uid """
+        return BitmapDB(f'{TransactionManager._NAME}_cancelled_transactions', self.db)
+
+    def _waiting_transactions_confirmed(self, confirmations: int) -> UIDLinkedListDB:
+        """ Waiting transactions with a given amount of confirmations """
+        return UIDLinkedListDB(f'{TransactionManager._NAME}_waiting_transactions_confirmed_{confirmations}', self.db)
+
+    def _waiting_transactions_rejected(self, rejections: int) -> UIDLinkedListDB:
+        """ Waiting transactions with a given amount of rejections """
+        return UIDLinkedListDB(f'{TransactionManager._NAME}_waiting_transactions_rejected_{rejections}', self.db)
+
+    def _pending_transactions(self, wallet_owner_uid: int) -> UIDLinkedListDB:
+        """ Waiting transactions that a given wallet owner neither confirmed nor rejected """
+        return UIDLinkedListDB(f'{TransactionManager._NAME}_pending_transactions_{wallet_owner_uid}', self.db)
+
+    @property
+    def _unindexed_pending_transactions(self) -> DictDB:
+        """ Highest uid of the waiting transactions that may be missing from the pending transactions of
+            a wallet owner, as they were submitted before the wallet owner was added """
+        return DictDB(f'{TransactionManager._NAME}_unindexed_pending_transactions', self.db, value_type=int)
+
+    @property
+    def _removed_pending_transactions(self) -> UIDLinkedListDB:
+        """ Uids of the removed wallet owners whose pending transactions haven't been deleted yet """
+        return UIDLinkedListDB(f'{TransactionManager._NAME}_removed_pending_transactions', self.db)
+
+    @property
+    def _waiting_transactions_max_participation(self) -> VarDB:
+        """ Upper bound of the amount of confirmations or rejections of the waiting transactions """
+        return VarDB(f'{TransactionManager._NAME}_waiting_transactions_max_participation', self.db, value_type=int)
+
+    @property
+    def _unindexed_waiting_transactions(self) -> VarDB:
+        """ Highest uid of the waiting transactions created before the indexes that may not be indexed yet """
+        return VarDB(f'{TransactionManager._NAME}_unindexed_waiting_transactions', self.db, value_type=int)
 
     # ================================================
     #  Event Logs
@@ -110,26 +150,68 @@ class TransactionManager:
             token, source, amount)
 
         self._all_transactions.append(transaction_uid)
-        self.update_balance_history_manager(transaction_uid)
+        self.update_balance_history_manager(transaction_uid, [token])
+
+    def on_update_transaction_manager(self) -> None:
+        # The existing waiting transactions are indexed progressively, from the newest one
+        self._unindexed_waiting_transactions.set(IdFactory(TransactionFactory._NAME, self.db).get_last_uid())
+
+    def handle_wallet_owner_addition(self, wallet_owner_uid: int) -> None:
+        # The new wallet owner may participate to all the waiting transactions, indexed progressively
+        if len(self._waiting_transactions):
+            last_uid = IdFactory(TransactionFactory._NAME, self.db).get_last_uid()
+            self._unindexed_pending_transactions[wallet_owner_uid] = last_uid
+            self._index_pending_transactions(wallet_owner_uid, MAX_GARBAGE_COLLECTION_LOOP)
+
+    def handle_wallet_owner_removal(self, wallet_owner_uid: int) -> None:
+        # The pending transactions of the wallet owner are deleted progressively
+        self._pending_transactions(wallet_owner_uid).clear()
+        self._unindexed_pending_transactions.remove(wallet_owner_uid)
+        self._removed_pending_transactions.append(wallet_owner_uid)
+        self._collect_removed_pending_transactions(MAX_GARBAGE_COLLECTION_LOOP)
+
+    def handle_wallet_owners_required_change(self, owners_required: int) -> None:
+        if not self._is_waiting_transactions_indexed():
+            # Visit all the waiting transactions until they are indexed
+            for transaction_uid in list(self._waiting_transactions):
+                self.try_execute_transaction(transaction_uid)
+                if self._waiting_transactions.has_node(transaction_uid):
+                    self.try_reject_transaction(transaction_uid)
+            return
+
+        # Only visit the waiting transactions with enough participations for the new requirement
+        max_participation = self._waiting_transactions_max_participation.get()
+
+        for confirmations in range(owners_required, max_participation + 1):
+            for transaction_uid in list(self._waiting_transactions_confirmed(confirmations)):
+                self.try_execute_transaction(transaction_uid)
+
+        for rejections in range(owners_required, max_participation + 1):
+            for transaction_uid in list(self._waiting_transactions_rejected(rejections)):
+                self.try_reject_transaction(transaction_uid)
 
     def try_execute_transaction(self, transaction_uid: int) -> None:
         transaction = OutgoingTransaction(transaction_uid, self.db)
 
-        if len(transaction._confirmations) >= self._wallet_owners_required.get():
+        if transaction.confirmations_count() >= self._wallet_owners_required.get():
             # Enough confirmations for the current transaction, execute it
             # Move the transaction from the waiting transactions
-            self._waiting_transactions.remove(transaction_uid)
+            self._remove_waiting_transaction(transaction)
             self._executed_transactions.append(transaction_uid)
             transaction._executed_txhash.set(self.tx.hash)
 
             # Consider the executor as the last added confirmation
-            wallet_owner_uid = transaction._confirmations.last()
+            wallet_owner_uid = transaction.last_confirmer()
+
+            # The proxy call is served by another instance of the SCORE, reading the database.
+            # Outside of the try, so a call without a cache fails instead of being recorded as a failed execution
+            DatabaseCache.current(self).flush_before_call()
 
             try:
                 proxy = self.create_interface_score(self.address, CallTransactionProxyInterface)
                 proxy.call_transaction(transaction_uid)
                 # Call success
-                self.update_balance_history_manager(transaction_uid)
+                self.update_balance_history_manager(transaction_uid, self.executed_transaction_tokens(transaction_uid))
                 transaction._state.set(OutgoingTransactionState.EXECUTED)
                 self.TransactionExecutionSuccess(transaction_uid, wallet_owner_uid)
             except BaseException as e:
@@ -137,32 +219,164 @@ class TransactionManager:
                 Logger.warning(f"Failed to executed tx : {repr(e)}")
                 self.TransactionExecutionFailure(transaction_uid, wallet_owner_uid, repr(e))
 
+    def try_reject_transaction(self, transaction_uid: int) -> None:
+        transaction = OutgoingTransaction(transaction_uid, self.db)
+
+        if transaction.rejections_count() >= self._wallet_owners_required.get():
+            # Enough rejections for the current transaction, reject it
+            # Move the transaction from the waiting transactions
+            self._remove_waiting_transaction(transaction)
+            self._rejected_transactions.append(transaction_uid)
+
+            # Update the transaction state
+            transaction._state.set(OutgoingTransactionState.REJECTED)
+            self.TransactionRejectionSuccess(transaction_uid, transaction.last_rejecter())
+
     # ================================================
     #  Private methods
     # ================================================
-    def _serialize_transaction(self, transaction_uid: int) -> dict:
-        transaction = Transaction(transaction_uid, self.db)
-        transaction_type = transaction._type.get()
-
-        if transaction_type == TransactionType.OUTGOING:
-            return OutgoingTransaction(transaction_uid, self.db).serialize()
-        elif transaction_type == TransactionType.INCOMING:
-            return IncomingTransaction(transaction_uid, self.db).serialize()
+    def _index_waiting_transaction(self, transaction: OutgoingTransaction) -> None:
+        confirmations = transaction.confirmations_count()
+        rejections = transaction.rejections_count()
+        self._waiting_transactions_confirmed(confirmations).append(transaction._uid)
+        self._waiting_transactions_rejected(rejections).append(transaction._uid)
+
+        max_participation = max(confirmations, rejections)
+        if max_participation > self._waiting_transactions_max_participation.get():
+            self._waiting_transactions_max_participation.set(max_participation)
+
+    def _unindex_waiting_transaction(self, transaction: OutgoingTransaction) -> None:
+        self._index_legacy_waiting_transaction(transaction)
+        self._waiting_transactions_confirmed(transaction.confirmations_count()).remove(transaction._uid)
+        self._waiting_transactions_rejected(transaction.rejections_count()).remove(transaction._uid)
+
+    def _is_waiting_transactions_indexed(self) -> bool:
+        return self._unindexed_waiting_transactions.get() == 0
+
+    def _index_legacy_waiting_transaction(self, transaction: OutgoingTransaction) -> None:
+        """ Index a waiting transaction created before the indexes, if it isn't indexed yet """
+        transaction_uid = transaction._uid
+        if transaction_uid > self._unindexed_waiting_transactions.get() \
+                or self._waiting_transactions_confirmed(transaction.confirmations_count()).has_node(transaction_uid):
+            return
+
+        self._index_waiting_transaction(transaction)
+
+        for wallet_owner_uid in self._wallet_owners:
+            pending_transactions = self._pending_transactions(wallet_owner_uid)
+            # The wallet owners added since the update already have it
+            if not transaction._has_participated(wallet_owner_uid) and not pending_transactions.has_node(transaction_uid):
+                # Older than the transactions submitted since the update
+                pending_transactions.prepend(transaction_uid)
+
+    def _index_legacy_waiting_transactions(self, max_count: int) -> None:
+        """ Index a limited amount of uids of the waiting transactions created before the indexes """
+        unindexed = self._unindexed_waiting_transactions.get()
+        last = max(unindexed - max_count, 0)
+
+        for transaction_uid in range(unindexed, last, -1):
+            if self._waiting_transactions.has_node(transaction_uid):
+                self._index_legacy_waiting_transaction(OutgoingTransaction(transaction_uid, self.db))
+
+        if unindexed:
+            self._unindexed_waiting_transactions.set(last)
+
+    def _index_pending_transactions(self, wallet_owner_uid: int, max_count: int) -> None:
+        """ Index a limited amount of uids of the waiting transactions submitted before a wallet owner was added """
+        unindexed = self._unindexed_pending_transactions[wallet_owner_uid]
+        if not unindexed:
+            return
+
+        # The waiting transactions are ordered by uid, none of them is older than the head
+        waiting_transactions = self._waiting_transactions
+        oldest = waiting_transactions.head_value() if len(waiting_transactions) else unindexed + 1
+        last = max(unindexed - max_count, oldest - 1)
+        pending_transactions = self._pending_transactions(wallet_owner_uid)
+
+        for transaction_uid in range(unindexed, last, -1):
+            if waiting_transactions.has_node(transaction_uid) \
+                    and not OutgoingTransaction(transaction_uid, self.db)._has_participated(wallet_owner_uid) \
+                    and not pending_transactions.has_node(transaction_uid):
+                # Older than the transactions submitted since the wallet owner was added
+                pending_transactions.prepend(transaction_uid)
+
+        if last >= oldest:
+            self._unindexed_pending_transactions[wallet_owner_uid] = last
         else:
-            raise InvalidTransactionType(transaction._type.get())
+            self._unindexed_pending_transactions.remove(wallet_owner_uid)
+
+    def _remove_pending_transaction(self, wallet_owner_uid: int, transaction_uid: int) -> None:
+        pending_transactions = self._pending_transactions(wallet_owner_uid)
+        # The transaction may not be indexed yet for a new wallet owner
+        if transaction_uid > self._unindexed_pending_transactions[wallet_owner_uid] \
+                or pending_transactions.has_node(transaction_uid):
+            pending_transactions.remove(transaction_uid)
+
+    def _collect_removed_pending_transactions(self, max_count: int) -> None:
+        """ Delete a limited amount of pending transactions of the removed wallet owners """
+        removed = self._removed_pending_transactions
+        count = 0
+
+        while count < max_count and len(removed):
+            wallet_owner_uid = removed.head_value()
+            pending_transactions = self._pending_transactions(wallet_owner_uid)
+            count += pending_transactions.collect_garbage(max_count - count)
+
+            if not pending_transactions.has_garbage():
+                pending_transactions.forget_epochs()
+                removed.remove(wallet_owner_uid)
+
+    def _update_pending_transactions(self, max_count: int) -> None:
+        """ Index the pending transactions of the new wallet owners and delete the ones of the removed wallet owners """
+        self._collect_removed_pending_transactions(max_count)
+        for wallet_owner_uid in self._wallet_owners:
+            self._index_pending_transactions(wallet_owner_uid, max_count)
+
+    def _is_pending_transactions_indexed(self, wallet_owner_uid: int) -> bool:
+        return self._is_waiting_transactions_indexed() and self._unindexed_pending_transactions[wallet_owner_uid] == 0
+
+    def _pending_transactions_for_owner(self, wallet_owner_uid: int) -> tuple:
+        """ Returns the list of the pending transactions of a wallet owner and the condition filtering it.
+            Until the waiting transactions are indexed, they are filtered from all the waiting transactions """
+        if self._is_pending_transactions_indexed(wallet_owner_uid):
+            return self._pending_transactions(wallet_owner_uid), None
+
+        return self._waiting_transactions, \
+            lambda db, transaction_uid: not OutgoingTransaction(transaction_uid, db)._has_participated(wallet_owner_uid)
+
+    def _add_waiting_transaction(self, transaction: OutgoingTransaction) -> None:
+        self._index_legacy_waiting_transactions(MAX_GARBAGE_COLLECTION_LOOP)
+        self._update_pending_transactions(MAX_GARBAGE_COLLECTION_LOOP)
+        self._waiting_transactions.append(transaction._uid)
+        self._index_waiting_transaction(transaction)
+
+        for wallet_owner_uid in self._wallet_owners:
+            self._pending_transactions(wallet_owner_uid).append(transaction._uid)
+
+    def _remove_waiting_transaction(self, transaction: OutgoingTransaction) -> None:
+        self._waiting_transactions.remove(transaction._uid)
+        self._unindex_waiting_transaction(transaction)
+
+        for wallet_owner_uid in self._wallet_owners:
+            if not transaction._has_participated(wallet_owner_uid):
+                self._remove_pending_transaction(wallet_owner_uid, transaction._uid)
+
+    def _serialize_transaction(self, transaction_uid: int) -> dict:
+        return TransactionFactory.get(self.db, transaction_uid).serialize()
 
     # ================================================
     #  External methods
     # ================================================
     @external
     @only_wallet
+    @defer_writes
     def call_transaction(self, transaction_uid: int) -> None:
         transaction = OutgoingTransaction(transaction_uid, self.db)
         # Get the execution time, even if the subtx fails
         transaction._executed_timestamp.set(self.now())
 
         # Handle all sub transactions
-        for sub_transaction_uid in transaction._sub_transactions:
+        for sub_transaction_uid in transaction.get_sub_transactions():
             sub_transaction = SubOutgoingTransaction(sub_transaction_uid, self.db)
 
             method_name = sub_transaction._method_name.get() or None
@@ -170,6 +384,9 @@ class TransactionManager:
             destination = sub_transaction._destination.get()
             amount = sub_transaction._amount.get()
 
+            # The destination may read the wallet state
+            DatabaseCache.current(self).flush_before_call()
+
             if destination.is_contract and method_name != None:
                 self.call(addr_to=destination,
                           func_name=method_name,
@@ -181,6 +398,7 @@ class TransactionManager:
     @external
     @catch_exception
     @only_wallet
+    @defer_writes
     def force_cancel_transaction(self, transaction_uid: int) -> None:
         transaction = OutgoingTransaction(transaction_uid, self.db)
         wallet_owner_uid = self.get_wallet_owner_uid(self.tx.origin)
@@ -192,15 +410,16 @@ class TransactionManager:
         # --- OK from here ---
         transaction._state.set(OutgoingTransactionState.CANCELLED)
         # Remove it from active transactions
-        self._waiting_transactions.remove(transaction_uid)
+        self._remove_waiting_transaction(transaction)
         self._all_transactions.remove(transaction_uid)
+        self._cancelled_transactions.set(transaction_uid)
         self.TransactionCancelled(transaction_uid, wallet_owner_uid)
 
     @external
-    @catch_exception
-    @only_multisig_owner
+    @defer_writes
+    @guarded(owner=True)
     def submit_transaction(self, sub_transactions: str) -> None:
-        wallet_owner_uid = self.get_wallet_owner_uid(self.msg.sender)
+        wallet_owner_uid = self.sender_uid()
 
         transaction_uid = TransactionFactory.create(
             self.db,
@@ -209,16 +428,16 @@ class TransactionManager:
             self.now(),
             sub_transactions)
 
-        self._waiting_transactions.append(transaction_uid)
+        self._add_waiting_transaction(OutgoingTransaction(transaction_uid, self.db))
         self._all_transactions.append(transaction_uid)
         self.TransactionCreated(transaction_uid, wallet_owner_uid)
 
     @external
-    @catch_exception
-    @only_multisig_owner
+    @defer_writes
+    @guarded(owner=True)
     def confirm_transaction(self, transaction_uid: int) -> None:
         transaction = OutgoingTransaction(transaction_uid, self.db)
-        wallet_owner_uid = self.get_wallet_owner_uid(self.msg.sender)
+        wallet_owner_uid = self.sender_uid()
 
         # --- Checks ---
         transaction._type.check(TransactionType.OUTGOING)
@@ -226,17 +445,20 @@ class TransactionManager:
         transaction.check_hasnt_participated(wallet_owner_uid)
 
         # --- OK from here ---
-        transaction._confirmations.add(wallet_owner_uid)
+        self._unindex_waiting_transaction(transaction)
+        transaction.confirm(wallet_owner_uid)
+        self._index_waiting_transaction(transaction)
+        self._remove_pending_transaction(wallet_owner_uid, transaction_uid)
         self.TransactionConfirmed(transaction_uid, wallet_owner_uid)
 
         self.try_execute_transaction(transaction_uid)
 
     @external
-    @catch_exception
-    @only_multisig_owner
+    @defer_writes
+    @guarded(owner=True)
     def reject_transaction(self, transaction_uid: int) -> None:
         transaction = OutgoingTransaction(transaction_uid, self.db)
-        wallet_owner_uid = self.get_wallet_owner_uid(self.msg.sender)
+        wallet_owner_uid = self.sender_uid()
 
         # --- Checks ---
         transaction._type.check(TransactionType.OUTGOING)
@@ -244,26 +466,20 @@ class TransactionManager:
         transaction.check_hasnt_participated(wallet_owner_uid)
 
         # --- OK from here ---
-        transaction._rejections.add(wallet_owner_uid)
+        self._unindex_waiting_transaction(transaction)
+        transaction.reject(wallet_owner_uid)
+        self._index_waiting_transaction(transaction)
+        self._remove_pending_transaction(wallet_owner_uid, transaction_uid)
         self.TransactionRejected(transaction_uid, wallet_owner_uid)
 
-        if len(transaction._rejections) >= self._wallet_owners_required.get():
-            # Enough confirmations for the current transaction, reject it
-
-            # Move the transaction from the waiting transactions
-            self._waiting_transactions.remove(transaction_uid)
-            self._rejected_transactions.append(transaction_uid)
-
-            # Update the transaction state
-            transaction._state.set(OutgoingTransactionState.REJECTED)
-            self.TransactionRejectionSuccess(transaction_uid, wallet_owner_uid)
+        self.try_reject_transaction(transaction_uid)
 
     @external
-    @catch_exception
-    @only_multisig_owner
+    @defer_writes
+    @guarded(owner=True)
     def revoke_transaction(self, transaction_uid: int) -> None:
         transaction = OutgoingTransaction(transaction_uid, self.db)
-        wallet_owner_uid = self.get_wallet_owner_uid(self.msg.sender)
+        wallet_owner_uid = self.sender_uid()
 
         # --- Checks ---
         transaction._type.check(TransactionType.OUTGOING)
@@ -271,19 +487,19 @@ class TransactionManager:
         transaction.check_has_participated(wallet_owner_uid)
 
         # --- OK from here ---
-        if transaction.has_confirmed(wallet_owner_uid):
-            transaction._confirmations.remove(wallet_owner_uid)
-        elif transaction.has_rejected(wallet_owner_uid):
-            transaction._rejections.remove(wallet_owner_uid)
+        self._unindex_waiting_transaction(transaction)
+        transaction.revoke(wallet_owner_uid)
+        self._index_waiting_transaction(transaction)
+        self._pending_transactions(wallet_owner_uid).append(transaction_uid)
 
         self.TransactionRevoked(transaction_uid, wallet_owner_uid)
 
     @external
-    @catch_exception
-    @only_multisig_owner
+    @defer_writes
+    @guarded(owner=True)
     def cancel_transaction(self, transaction_uid: int) -> None:
         transaction = OutgoingTransaction(transaction_uid, self.db)
-        wallet_owner_uid = self.get_wallet_owner_uid(self.msg.sender)
+        wallet_owner_uid = self.sender_uid()
 
         # --- Checks ---
         transaction._type.check(TransactionType.OUTGOING)
@@ -293,10 +509,18 @@ class TransactionManager:
         # --- OK from here ---
         transaction._state.set(OutgoingTransactionState.CANCELLED)
         # Remove it from active transactions
-        self._waiting_transactions.remove(transaction_uid)
+        self._remove_waiting_transaction(transaction)
         self._all_transactions.remove(transaction_uid)
+        self._cancelled_transactions.set(transaction_uid)
         self.TransactionCancelled(transaction_uid, wallet_owner_uid)
 
+    @external
+    @defer_writes
+    @guarded(owner=True)
+    def index_waiting_transactions(self, max_items: int) -> None:
+        self._index_legacy_waiting_transactions(max_items)
+        self._update_pending_transactions(max_items)
+
     @external(readonly=True)
     @catch_exception
     def get_transaction(self, transaction_uid: int) -> dict:
@@ -304,41 +528,130 @@ class TransactionManager:
 
     @external(readonly=True)
     @catch_exception
-    def get_waiting_transactions(self, offset: int = 0) -> list:
+    def get_last_transaction_uid(self) -> int:
+        return IdFactory(TransactionFactory._NAME, self.db).get_last_uid()
+
+    @external(readonly=True)
+    @catch_exception
+    def get_transactions_by_uid_range(self, start_uid: int, end_uid: int) -> list:
+        """ Returns the transactions whose uid is in [start_uid, end_uid], except the cancelled ones.
+            At most MAX_ITERATION_LOOP uids are looked up """
+        start_uid = max(start_uid, 1)
+        end_uid = min(end_uid, self.get_last_transaction_uid(), start_uid + MAX_ITERATION_LOOP - 1)
+        cancelled = self._cancelled_transactions.get_range(start_uid, end_uid + 1)
+        result = []
+
+        for transaction_uid in range(start_uid, end_uid + 1):
+            if transaction_uid in cancelled:
+                continue
+
+            transaction = TransactionFactory.get(self.db, transaction_uid)
+            # Transactions cancelled before the cancelled uids were recorded
+            if isinstance(transaction, OutgoingTransaction) \
+               and transaction._state.get() == OutgoingTransactionState.CANCELLED:
+                continue
+
+            result.append(transaction.serialize())
+
+        return result
+
+    @external(readonly=True)
+    @catch_exception
+    def get_waiting_transactions(self, offset: int = 0, newest_first: bool = False) -> list:
+        return [
+            self._serialize_transaction(transaction_uid)
+            for transaction_uid in self._waiting_transactions.select(offset, reverse=newest_first)
+        ]
+
+    @external(readonly=True)
+    @catch_exception
+    def get_waiting_transactions_page(self, cursor: int = 0, newest_first: bool = False) -> dict:
+        return Utils.serialize_page(
+            self._waiting_transactions.select_page(cursor, reverse=newest_first),
+            self._serialize_transaction)
+
+    @external(readonly=True)
+    @catch_exception
+    def get_all_transactions(self, offset: int = 0, newest_first: bool = False) -> list:
         return [
             self._serialize_transaction(transaction_uid)
-            for transaction_uid in self._waiting_transactions.select(offset)
+            for transaction_uid in self._all_transactions.select(offset, reverse=newest_first)
         ]
 
     @external(readonly=True)
     @catch_exception
-    def get_all_transactions(self, offset: int = 0) -> list:
+    def get_all_transactions_page(self, cursor: int = 0, newest_first: bool = False) -> dict:
+        return Utils.serialize_page(
+            self._all_transactions.select_page(cursor, reverse=newest_first),
+            self._serialize_transaction)
+
+    @external(readonly=True)
+    @catch_exception
+    def get_executed_transactions(self, offset: int = 0, newest_first: bool = False) -> list:
         return [
             self._serialize_transaction(transaction_uid)
-            for transaction_uid in self._all_transactions.select(offset)
+            for transaction_uid in self._executed_transactions.select(offset, reverse=newest_first)
         ]
 
     @external(readonly=True)
     @catch_exception
-    def get_executed_transactions(self, offset: int = 0) -> list:
+    def get_executed_transactions_page(self, cursor: int = 0, newest_first: bool = False) -> dict:
+        return Utils.serialize_page(
+            self._executed_transactions.select_page(cursor, reverse=newest_first),
+            self._serialize_transaction)
+
+    @external(readonly=True)
+    @catch_exception
+    def get_rejected_transactions(self, offset: int = 0, newest_first: bool = False) -> list:
         return [
             self._serialize_transaction(transaction_uid)
-            for transaction_uid in self._executed_transactions.select(offset)
+            for transaction_uid in self._rejected_transactions.select(offset, reverse=newest_first)
         ]
 
     @external(readonly=True)
     @catch_exception
-    def get_rejected_transactions(self, offset: int = 0) -> list:
+    def get_rejected_transactions_page(self, cursor: int = 0, newest_first: bool = False) -> dict:
+        return Utils.serialize_page(
+            self._rejected_transactions.select_page(cursor, reverse=newest_first),
+            self._serialize_transaction)
+
+    @external(readonly=True)
+    @catch_exception
+    def get_pending_transactions_for_owner(self, wallet_owner_uid: int, offset: int = 0) -> list:
+        pending_transactions, cond = self._pending_transactions_for_owner(wallet_owner_uid)
         return [
             self._serialize_transaction(transaction_uid)
-            for transaction_uid in self._rejected_transactions.select(offset)
+            for transaction_uid in pending_transactions.select(offset, cond)
         ]
 
+    @external(readonly=True)
+    @catch_exception
+    def get_pending_transactions_for_owner_page(self, wallet_owner_uid: int, cursor: int = 0) -> dict:
+        pending_transactions, cond = self._pending_transactions_for_owner(wallet_owner_uid)
+        return Utils.serialize_page(
+            pending_transactions.select_page(cursor, cond),
+            self._serialize_transaction)
+
+    @external(readonly=True)
+    @catch_exception
+    def get_pending_transactions_for_owner_count(self, wallet_owner_uid: int) -> int:
+        pending_transactions, cond = self._pending_transactions_for_owner(wallet_owner_uid)
+        if cond:
+            return len([transaction_uid for transaction_uid in pending_transactions if cond(self.db, transaction_uid)])
+        return len(pending_transactions)
+
     @external(readonly=True)
     @catch_exception
     def get_waiting_transactions_count(self) -> int:
         return len(self._waiting_transactions)
 
+    @external(readonly=True)
+    @catch_exception
+    def is_waiting_transactions_indexed(self) -> bool:
+        """ Returns True once `index_waiting_transactions` has nothing left to do """
+        return not len(self._removed_pending_transactions) and all(
+            self._is_pending_transactions_indexed(wallet_owner_uid) for wallet_owner_uid in self._wallet_owners)
+
     @external(readonly=True)
     @catch_exception
     def get_all_transactions_count(self) -> int:
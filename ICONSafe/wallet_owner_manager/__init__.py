@@ -1,2 +1,2 @@
-from .wallet_owner_manager import WalletOwnersManager, WalletOwnerDescription, only_multisig_owner
+from .wallet_owner_manager import WalletOwnersManager, WalletOwnerDescription, only_multisig_owner, guarded
 from .wallet_owner import WalletOwner
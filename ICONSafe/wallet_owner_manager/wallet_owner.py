@@ -16,24 +16,31 @@
 
 from iconservice import *
 
+from ..scorelib import *
+
 
 class SenderNotMultisigOwnerError(Exception):
     pass
 
 
-class WalletOwner:
+class WalletOwner(EntityDB):
 
     _NAME = 'WALLET_OWNER'
 
+    _FIELDS = [
+        ('address', Address),
+        ('name', str)
+    ]
+
+    _LEGACY_FIELD = 'address'
+    _NAMESPACE = 3
+
     # ================================================
     #  Initialization
     # ================================================
     def __init__(self, uid: int, db: IconScoreDatabase):
-        name = f"{WalletOwner._NAME}_{uid}"
-        self._address = VarDB(f"{name}_address", db, value_type=Address)
-        self._name = VarDB(f"{name}_name", db, value_type=str)
+        super().__init__(f"{WalletOwner._NAME}_{uid}", db, uid)
         self._uid = uid
-        self._db = db
 
     # ================================================
     #  Internal methods
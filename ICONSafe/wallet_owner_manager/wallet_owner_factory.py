@@ -28,13 +28,15 @@ class WalletOwnerFactory:
     @staticmethod
     def create(db: IconScoreDatabase,
                address: Address,
-               name: str) -> int:
+               name: str,
+               wallet_owner_uid: int = None) -> int:
+        """ Create a wallet owner, with a uid previously reserved if specified """
 
-        wallet_owner_uid = IdFactory(WalletOwnerFactory._NAME, db).get_uid()
+        if wallet_owner_uid is None:
+            wallet_owner_uid = IdFactory(WalletOwnerFactory._NAME, db).get_uid()
 
         owner = WalletOwner(wallet_owner_uid, db)
 
-        owner._address.set(address)
-        owner._name.set(name)
+        owner._record.create({'address': address, 'name': name})
 
         return wallet_owner_uid
@@ -97,18 +97,24 @@ class WalletOwnersManager:
         if self._address_to_uid_map[str(address)] == 0:
             raise WalletOwnerDoesntExist(WalletOwnersManager._NAME, str(address))
 
+    def sender_uid(self) -> int:
+        """ Returns the wallet owner uid of the sender, checked by `guarded(owner=True)` """
+        return DatabaseCache.current(self).sender_uid
+
     # ================================================
     #  Private methods
     # ================================================
     def _add_wallet_owner(self, address: Address, wallet_owner_uid: int) -> int:
         self._wallet_owners.append(wallet_owner_uid)
         self._address_to_uid_map[str(address)] = wallet_owner_uid
+        self.handle_wallet_owner_addition(wallet_owner_uid)
         self.WalletOwnerAddition(wallet_owner_uid)
 
     def _remove_wallet_owner(self, wallet_owner_uid: int) -> int:
         owner = WalletOwner(wallet_owner_uid, self.db)
         self._wallet_owners.remove(wallet_owner_uid)
         self._address_to_uid_map.remove(str(owner._address.get()))
+        self.handle_wallet_owner_removal(wallet_owner_uid)
         self.WalletOwnerRemoval(wallet_owner_uid)
 
     # ================================================
@@ -124,9 +130,10 @@ class WalletOwnersManager:
             self._check_address_doesnt_exist(address)
 
         # --- OK from here ---
-        for owner in owners:
+        wallet_owners_uid = IdFactory(WalletOwnerFactory._NAME, self.db).reserve(len(owners))
+        for owner, wallet_owner_uid in zip(owners, wallet_owners_uid):
             address, name = Address.from_string(owner['address']), owner['name']
-            wallet_owner_uid = WalletOwnerFactory.create(self.db, address, name)
+            WalletOwnerFactory.create(self.db, address, name, wallet_owner_uid)
             self._add_wallet_owner(address, wallet_owner_uid)
 
     # ================================================
@@ -135,6 +142,7 @@ class WalletOwnersManager:
     @catch_exception
     @only_wallet
     @external
+    @defer_writes
     def add_wallet_owner(self, address: Address, name: str) -> None:
         # --- Checks ---
         WalletOwnersManager._check_requirements(len(self._wallet_owners) + 1, self._wallet_owners_required.get())
@@ -146,6 +154,7 @@ class WalletOwnersManager:
     @catch_exception
     @only_wallet
     @external
+    @defer_writes
     def remove_wallet_owner(self, wallet_owner_uid: int) -> None:
         # --- Checks ---
         WalletOwnersManager._check_requirements(len(self._wallet_owners) - 1, self._wallet_owners_required.get())
@@ -156,6 +165,7 @@ class WalletOwnersManager:
     @catch_exception
     @only_wallet
     @external
+    @defer_writes
     def replace_wallet_owner(self, old_wallet_owner_uid: int, new_address: Address, new_name: str) -> None:
         # --- Checks ---
         WalletOwnersManager._check_requirements(len(self._wallet_owners), self._wallet_owners_required.get())
@@ -173,6 +183,7 @@ class WalletOwnersManager:
     @catch_exception
     @only_wallet
     @external
+    @defer_writes
     def set_wallet_owners_required(self, owners_required: int) -> None:
         # --- Checks ---
         WalletOwnersManager._check_requirements(len(self._wallet_owners), owners_required)
@@ -180,8 +191,7 @@ class WalletOwnersManager:
         self._wallet_owners_required.set(owners_required)
         self.WalletOwnersRequiredChanged(owners_required)
 
-        for transaction_uid in list(self._waiting_transactions):
-            self.try_execute_transaction(transaction_uid)
+        self.handle_wallet_owners_required_change(owners_required)
 
     # ================================================
     #  External methods
@@ -194,6 +204,11 @@ class WalletOwnersManager:
             for wallet_owner_uid in self._wallet_owners.select(offset)
         ]
 
+    @catch_exception
+    @external(readonly=True)
+    def get_wallet_owners_page(self, cursor: int = 0) -> dict:
+        return Utils.serialize_page(self._wallet_owners.select_page(cursor), self.get_wallet_owner)
+
     @catch_exception
     @external(readonly=True)
     def get_wallet_owner(self, wallet_owner_uid: int) -> dict:
@@ -232,3 +247,32 @@ def only_multisig_owner(func):
 
         return func(self, *args, **kwargs)
     return __wrapper
+
+
+def guarded(owner: bool = False, maintenance: bool = False):
+    """ Guard of a write external method, replacing the stack of `catch_exception`,
+        `check_maintenance` and `only_multisig_owner`.
+        Each lookup is only done once per call :
+        - maintenance : the method fails while the SCORE is in maintenance
+        - owner : the sender must be a wallet owner. The guard must be below `defer_writes`,
+          its uid is handed over to the method through the cache of the call, see `sender_uid`
+    """
+    def decorator(func):
+        if not isfunction(func):
+            raise NotAFunctionError
+
+        @wraps(func)
+        def __wrapper(self: object, *args, **kwargs):
+            if maintenance and self._maintenance_is_enabled():
+                raise ScoreInMaintenanceException
+
+            if owner:
+                uid = self._address_to_uid_map[str(self.msg.sender)]
+                if uid == 0:
+                    raise SenderNotMultisigOwnerError(self.msg.sender)
+                DatabaseCache.current(self).sender_uid = uid
+
+            return func(self, *args, **kwargs)
+
+        return catch_exception(__wrapper)
+    return decorator
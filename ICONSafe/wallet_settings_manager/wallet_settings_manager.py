@@ -54,8 +54,8 @@ class WalletSettingsManager:
         return self._safe_name.get()
 
     @external
-    @catch_exception
-    @only_multisig_owner
+    @defer_writes
+    @guarded(owner=True)
     def set_safe_name(self, safe_name: str):
         self._safe_name.set(safe_name)
         self.WalletSettingsSafeNameChanged(safe_name)